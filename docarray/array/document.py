@@ -9,12 +9,15 @@ if TYPE_CHECKING:  # pragma: no cover
     from docarray.array.memory import DocumentArrayInMemory
     from docarray.array.sqlite import DocumentArraySqlite
     from docarray.array.annlite import DocumentArrayAnnlite
+    from docarray.array.hnsw import DocumentArrayHnsw
     from docarray.array.weaviate import DocumentArrayWeaviate
     from docarray.array.elastic import DocumentArrayElastic
     from docarray.array.redis import DocumentArrayRedis
     from docarray.array.milvus import DocumentArrayMilvus
+    from docarray.array.storage.memory import MemoryConfig
     from docarray.array.storage.sqlite import SqliteConfig
     from docarray.array.storage.annlite import AnnliteConfig
+    from docarray.array.storage.hnsw import HnswConfig
     from docarray.array.storage.weaviate import WeaviateConfig
     from docarray.array.storage.elastic import ElasticConfig
     from docarray.array.storage.redis import RedisConfig
@@ -83,6 +86,7 @@ class DocumentArray(AllMixins, BaseDocumentArray):
         cls,
         _docs: Optional['DocumentArraySourceType'] = None,
         copy: bool = False,
+        config: Optional[Union['MemoryConfig', Dict]] = None,
         subindex_configs: Optional[Dict[str, 'None']] = None,
     ) -> 'DocumentArrayInMemory':
         """Create an in-memory DocumentArray object."""
@@ -121,6 +125,17 @@ class DocumentArray(AllMixins, BaseDocumentArray):
         """Create a AnnLite-powered DocumentArray object."""
         ...
 
+    @overload
+    def __new__(
+        cls,
+        _docs: Optional['DocumentArraySourceType'] = None,
+        storage: str = 'hnsw',
+        config: Optional[Union['HnswConfig', Dict]] = None,
+        subindex_configs: Optional[Dict[str, Dict]] = None,
+    ) -> 'DocumentArrayHnsw':
+        """Create a DocumentArray object indexed by an in-process HNSW graph."""
+        ...
+
     @overload
     def __new__(
         cls,
@@ -180,6 +195,10 @@ class DocumentArray(AllMixins, BaseDocumentArray):
                 from docarray.array.annlite import DocumentArrayAnnlite
 
                 instance = super().__new__(DocumentArrayAnnlite)
+            elif storage == 'hnsw':
+                from docarray.array.hnsw import DocumentArrayHnsw
+
+                instance = super().__new__(DocumentArrayHnsw)
             elif storage == 'weaviate':
                 from docarray.array.weaviate import DocumentArrayWeaviate
 
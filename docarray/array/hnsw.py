@@ -0,0 +1,33 @@
+from docarray.array.document import DocumentArray
+from docarray.array.storage.hnsw import StorageMixins, HnswConfig
+
+__all__ = ['HnswConfig', 'DocumentArrayHnsw']
+
+
+class DocumentArrayHnsw(StorageMixins, DocumentArray):
+    """
+    DocumentArray that indexes the embeddings of its Documents in an in-process HNSW graph.
+
+    The graph is implemented with numpy only, no server or extra dependency is needed. With this implementation,
+    :meth:`match` and :meth:`find` perform fast (approximate) vector search.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from docarray import Document, DocumentArray
+        import numpy as np
+
+        da = DocumentArray(storage='hnsw', config={'n_dim': 10, 'data_path': './data'})
+
+        with da:
+            da.extend([Document(embedding=np.random.random(10)) for _ in range(1000)])
+
+        results = da.find(np.random.random(10), limit=10)
+
+    .. seealso::
+        For further details, see our :ref:`user guide <hnsw>`.
+    """
+
+    def __new__(cls, *args, **kwargs):
+        return super().__new__(cls)
@@ -1,5 +1,7 @@
 from docarray.array.document import DocumentArray
-from docarray.array.storage.memory import StorageMixins
+from docarray.array.storage.memory import StorageMixins, MemoryConfig
+
+__all__ = ['MemoryConfig', 'DocumentArrayInMemory']
 
 
 class DocumentArrayInMemory(StorageMixins, DocumentArray):
@@ -10,6 +10,7 @@ from docarray.array.mixins.getattr import GetAttributeMixin
 from docarray.array.mixins.getitem import GetItemMixin
 from docarray.array.mixins.group import GroupMixin
 from docarray.array.mixins.io.binary import BinaryIOMixin
+from docarray.array.mixins.io.columnar import ColumnarIOMixin
 from docarray.array.mixins.io.common import CommonIOMixin
 from docarray.array.mixins.io.csv import CsvIOMixin
 from docarray.array.mixins.io.dataframe import DataframeIOMixin
@@ -43,6 +44,7 @@ class AllMixins(
     CsvIOMixin,
     JsonIOMixin,
     BinaryIOMixin,
+    ColumnarIOMixin,
     CommonIOMixin,
     EmbedMixin,
     PushPullMixin,
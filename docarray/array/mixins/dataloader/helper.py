@@ -24,10 +24,21 @@ class DocumentArrayLoader(ParallelMixin, GroupMixin):
 
         with open(path, 'rb') as f:
             version_numdocs_lendoc0 = f.read(9)
+            # 1 byte (uint8)
+            version = int.from_bytes(version_numdocs_lendoc0[0:1], 'big', signed=False)
             # 8 bytes (uint64)
             self._len = int.from_bytes(
                 version_numdocs_lendoc0[1:9], 'big', signed=False
             )
+
+        # files with an offset index are read by range instead of sequentially
+        self._reader = None
+        if version >= 2:
+            from docarray.array.mixins.io.binary import IndexedBinaryReader
+
+            self._reader = IndexedBinaryReader(
+                path, protocol=self._protocol, compress=self._compress
+            )
         self._iter = iter(self)
 
     def __iter__(self):
@@ -67,6 +78,9 @@ class DocumentArrayLoader(ParallelMixin, GroupMixin):
     def __getitem__(self, item: list) -> 'DocumentArray':
         from docarray import DocumentArray
 
+        if self._reader is not None:
+            return self._reader[item]
+
         da = DocumentArray()
         for _ in item:
             da.append(next(self._iter))
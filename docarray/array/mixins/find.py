@@ -29,6 +29,7 @@ class FindMixin:
         metric_name: Optional[str] = None,
         exclude_self: bool = False,
         only_id: bool = False,
+        copy: bool = True,
         **kwargs,
     ) -> Union['DocumentArray', List['DocumentArray']]:
         """Returns approximate nearest neighbors given an input query.
@@ -40,6 +41,8 @@ class FindMixin:
         :param exclude_self: if set, Documents in results with same ``id`` as the query values will not be
                         considered as matches. This is only applied when the input query is Document or DocumentArray.
         :param only_id: if set, then returning matches will only contain ``id``
+        :param copy: if set, matches are deep copies of the indexed Documents. Otherwise they are shallow copies that
+            share tensors, embeddings and chunks with the indexed Documents, see :meth:`copy_from`.
         :param kwargs: other kwargs.
 
         :return: a list of DocumentArrays containing the closest Document objects for each of the queries in `query`.
@@ -100,6 +103,7 @@ class FindMixin:
         only_id: bool = False,
         index: str = 'text',
         on: Optional[str] = None,
+        copy: bool = True,
         **kwargs,
     ) -> Union['DocumentArray', List['DocumentArray']]:
         """Returns matching Documents given an input query.
@@ -127,6 +131,10 @@ class FindMixin:
                       otherwise the tag field specified by `index` will be used. You can only use this parameter if the
                       storage backend supports searching by text.
         :param on: specifies a subindex to search on. If set, the returned DocumentArray will be retrieved from the given subindex.
+        :param copy: if set, matches are deep copies of the indexed Documents. Otherwise they are shallow copies that
+            share tensors, embeddings and chunks with the indexed Documents, which is much faster for large Documents.
+            Re-assigning a field or changing the ``tags`` and ``scores`` of such a match does not affect the indexed
+            Document, but modifying its arrays or chunks in place does.
         :param kwargs: other kwargs.
 
         :return: a list of DocumentArrays containing the closest Document objects for each of the queries in `query`.
@@ -143,6 +151,7 @@ class FindMixin:
                 only_id,
                 index,
                 on=None,
+                copy=copy,
             )
         from docarray import Document, DocumentArray
 
@@ -231,8 +240,11 @@ class FindMixin:
                     # checkout https://github.com/jina-ai/jina/issues/3034
                     if only_id:
                         d = Document(id=self[_id].id)
-                    else:
+                    elif copy:
                         d = Document(self[int(_id)], copy=True)  # type: Document
+                    else:
+                        d = Document()
+                        d.copy_from(self[int(_id)], shallow=True)
 
                     # to prevent self-reference and override on matches
                     d.pop('matches')
@@ -3,9 +3,25 @@ import io
 import os
 import os.path
 import pickle
+import threading
 from contextlib import nullcontext
+from math import ceil
 from pathlib import Path
-from typing import Union, BinaryIO, TYPE_CHECKING, Type, Optional, Generator
+from typing import (
+    Union,
+    BinaryIO,
+    TYPE_CHECKING,
+    Type,
+    Optional,
+    Generator,
+    Sequence,
+    Dict,
+    List,
+    Iterator,
+    Tuple,
+)
+
+import numpy as np
 
 from docarray.helper import (
     get_compress_ctx,
@@ -33,6 +49,205 @@ class LazyRequestReader:
         return self.content[item]
 
 
+# V2 streaming format appends an index footer to the V1 format, see `_stream_index_footer`
+_STREAM_INDEX_MAGIC = b'DAIX'
+# 8 bytes (uint64) offset table position + 8 bytes (uint64) id table position + 4 bytes magic
+_STREAM_TRAILER_SIZE = 20
+
+
+class IndexedBinaryReader(Sequence['Document']):
+    """Random access to the Documents of a file written with ``protocol='pickle'`` or ``protocol='protobuf'``.
+
+    For files written with ``offset_index=True`` (V2 format), the offset table at the end of the file is memory-mapped,
+    so that opening is instant and reading any Document is a single seek. For V1 files, the offsets are collected once
+    by skipping from one length prefix to the next, without deserializing any Document.
+
+    Reads use ``os.pread`` where available, so the reader can be shared between threads.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        protocol: str = 'protobuf',
+        compress: Optional[str] = None,
+    ):
+        self._path = path
+        self._protocol, self._compress = protocol_and_compress_from_file_path(
+            path, protocol, compress
+        )
+        if self._protocol not in ('pickle', 'protobuf'):
+            raise ValueError(
+                f'random access needs `protocol` to be `pickle` or `protobuf`, receiving `{self._protocol}`'
+            )
+        self._file = open(path, 'rb')
+        self._lock = threading.Lock()
+        self._id_to_index = None  # type: Optional[Dict[str, int]]
+        self._ids_pos = 0
+
+        header = self._pread(0, 9)
+        # 1 byte (uint8)
+        self._version = int.from_bytes(header[0:1], 'big', signed=False)
+        # 8 bytes (uint64)
+        self._len = int.from_bytes(header[1:9], 'big', signed=False)
+
+        if self._version >= 2:
+            trailer = self._pread(
+                os.fstat(self._file.fileno()).st_size - _STREAM_TRAILER_SIZE,
+                _STREAM_TRAILER_SIZE,
+            )
+            if trailer[16:] != _STREAM_INDEX_MAGIC:
+                raise ValueError(f'{path} has no valid offset index')
+            self._end = int.from_bytes(trailer[0:8], 'big', signed=False)
+            self._ids_pos = int.from_bytes(trailer[8:16], 'big', signed=False)
+            self._offsets = (
+                np.memmap(
+                    self._file,
+                    dtype='>u8',
+                    mode='r',
+                    offset=self._end,
+                    shape=(self._len,),
+                )
+                if self._len
+                else np.empty(0, dtype='>u8')
+            )
+        else:
+            self._offsets, self._end = self._scan_offsets()
+
+    def _scan_offsets(self):
+        offsets = np.empty(self._len, dtype=np.uint64)
+        pos = 9
+        for i in range(self._len):
+            offsets[i] = pos
+            # 4 bytes (uint32)
+            pos += 4 + int.from_bytes(self._pread(pos, 4), 'big', signed=False)
+        return offsets, pos
+
+    def _pread(self, pos: int, size: int) -> bytes:
+        if hasattr(os, 'pread'):
+            return os.pread(self._file.fileno(), size, pos)
+        with self._lock:
+            self._file.seek(pos)
+            return self._file.read(size)
+
+    def _pos(self, i: int) -> int:
+        return int(self._offsets[i]) if i < self._len else self._end
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self) -> Iterator['Document']:
+        for i in range(self._len):
+            yield self._get_doc(i)
+
+    def __getitem__(
+        self, key: Union[int, str, slice, Sequence[int], Sequence[str]]
+    ) -> Union['Document', 'DocumentArray']:
+        from docarray import DocumentArray
+
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self._len
+            if not 0 <= key < self._len:
+                raise IndexError(f'index {key} is out of range')
+            return self._get_doc(int(key))
+        elif isinstance(key, str):
+            return self._get_doc(self._get_offset(key))
+        elif isinstance(key, slice):
+            start, stop, step = key.indices(self._len)
+            if step == 1:
+                return self.read_range(start, stop)
+            return DocumentArray(self._get_doc(i) for i in range(start, stop, step))
+        elif isinstance(key, (list, tuple, np.ndarray)):
+            key = list(key)
+            if (
+                key
+                and all(isinstance(k, (int, np.integer)) for k in key)
+                and 0 <= key[0] <= key[-1] < self._len
+                and key == list(range(key[0], key[-1] + 1))
+            ):
+                # e.g. the batches of `map_batch`, read them at once
+                return self.read_range(key[0], key[-1] + 1)
+            return DocumentArray(self[k] for k in key)
+        raise IndexError(f'unsupported key type {type(key)!r}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._offsets = None
+        self._file.close()
+
+    @property
+    def ids(self) -> List[str]:
+        """Return the ids of all Documents, read from the id table if the file has one.
+
+        :return: a list of ids
+        """
+        if not self._ids_pos:
+            return [d.id for d in self]
+        data = self._pread(
+            self._ids_pos,
+            os.fstat(self._file.fileno()).st_size
+            - _STREAM_TRAILER_SIZE
+            - self._ids_pos,
+        )
+        ids, pos = [], 0
+        for _ in range(self._len):
+            # 4 bytes (uint32)
+            size = int.from_bytes(data[pos : pos + 4], 'big', signed=False)
+            ids.append(data[pos + 4 : pos + 4 + size].decode('utf-8'))
+            pos += 4 + size
+        return ids
+
+    def read_range(self, start: int, stop: int) -> 'DocumentArray':
+        """Read the Documents from ``start`` to ``stop`` with a single read of their contiguous bytes.
+
+        :param start: the index of the first Document
+        :param stop: the index after the last Document
+        :return: the Documents, in order
+        """
+        from docarray import Document, DocumentArray
+
+        start, stop = max(start, 0), min(stop, self._len)
+        if start >= stop:
+            return DocumentArray()
+        base = self._pos(start)
+        data = self._pread(base, self._pos(stop) - base)
+        docs = []
+        for i in range(start, stop):
+            pos = self._pos(i) - base + 4
+            docs.append(
+                Document.from_bytes(
+                    data[pos : self._pos(i + 1) - base],
+                    protocol=self._protocol,
+                    compress=self._compress,
+                )
+            )
+        return DocumentArray(docs)
+
+    def _get_doc(self, i: int) -> 'Document':
+        from docarray import Document
+
+        pos = self._pos(i)
+        return Document.from_bytes(
+            self._pread(pos + 4, self._pos(i + 1) - pos - 4),
+            protocol=self._protocol,
+            compress=self._compress,
+        )
+
+    def _get_offset(self, doc_id: str) -> int:
+        if self._id_to_index is None:
+            self._id_to_index = {_id: i for i, _id in enumerate(self.ids)}
+        try:
+            return self._id_to_index[doc_id]
+        except KeyError:
+            raise KeyError(f'`{doc_id}` is not found') from None
+
+
 class BinaryIOMixin:
     """Save/load an array to a binary file."""
 
@@ -44,9 +259,15 @@ class BinaryIOMixin:
         compress: Optional[str] = None,
         _show_progress: bool = False,
         streaming: bool = False,
+        random_access: bool = False,
+        num_worker: int = 1,
+        backend: str = 'thread',
+        lazy: bool = False,
         *args,
         **kwargs,
-    ) -> Union['DocumentArray', Generator['Document', None, None]]:
+    ) -> Union[
+        'DocumentArray', Generator['Document', None, None], 'IndexedBinaryReader'
+    ]:
         """Load array elements from a compressed binary file.
 
         :param file: File or filename or serialized bytes where the data is stored.
@@ -55,6 +276,18 @@ class BinaryIOMixin:
         :param _show_progress: show progress bar, only works when protocol is `pickle` or `protobuf`
         :param streaming: if `True` returns a generator over `Document` objects.
         In case protocol is pickle the `Documents` are streamed from disk to save memory usage
+        :param random_access: if `True` returns an :class:`IndexedBinaryReader` that reads Documents from the file
+            on access, by position, id or slice. Only works when `file` is a path and protocol is `pickle` or `protobuf`.
+        :param num_worker: the number of parallel workers decoding Documents. With more than one, the file is split into
+            byte ranges of whole Documents that are decompressed and deserialized in parallel, then reassembled in
+            order. More workers than CPUs only add the cost of moving Documents to and from the pool. Only works when
+            protocol is `pickle` or `protobuf` and ``streaming`` is not set.
+        :param backend: `thread` or `process`, the backend of the pool used when ``num_worker`` is more than one.
+            Decompression releases the GIL, `process` workers also deserialize in parallel but have to send the
+            Documents back pickled.
+        :param lazy: if set, only the scalar fields of the Documents are decoded when loading, the others on first
+            access, see :meth:`~docarray.document.mixins.protobuf.ProtobufMixin.from_protobuf`. Only works when
+            protocol is `protobuf` or `protobuf-array`.
         :return: a DocumentArray object
 
         .. note::
@@ -77,16 +310,30 @@ class BinaryIOMixin:
             file_ctx = open(file, 'rb')
         else:
             raise FileNotFoundError(f'cannot find file {file}')
+        if random_access:
+            if not isinstance(file, (str, os.PathLike)):
+                raise ValueError('`random_access` needs `file` to be a path')
+            file_ctx.close()
+            return IndexedBinaryReader(file, protocol=protocol, compress=compress)
         if streaming:
             return cls._load_binary_stream(
                 file_ctx,
                 protocol=protocol,
                 compress=compress,
                 _show_progress=_show_progress,
+                lazy=lazy,
             )
         else:
             return cls._load_binary_all(
-                file_ctx, protocol, compress, _show_progress, *args, **kwargs
+                file_ctx,
+                protocol,
+                compress,
+                _show_progress,
+                *args,
+                num_worker=num_worker,
+                backend=backend,
+                lazy=lazy,
+                **kwargs,
             )
 
     @classmethod
@@ -96,12 +343,14 @@ class BinaryIOMixin:
         protocol=None,
         compress=None,
         _show_progress=False,
+        lazy: bool = False,
     ) -> Generator['Document', None, None]:
         """Yield `Document` objects from a binary file
 
         :param protocol: protocol to use
         :param compress: compress algorithm to use
         :param _show_progress: show progress bar, only works when protocol is `pickle` or `protobuf`
+        :param lazy: if set, decode the fields of `protobuf` Documents on first access
         :return: a generator of `Document` objects
         """
 
@@ -134,6 +383,7 @@ class BinaryIOMixin:
                         f.read(len_current_doc_in_bytes),
                         protocol=protocol,
                         compress=compress,
+                        lazy=lazy,
                     )
                     pbar.update(
                         t, advance=1, total_size=str(filesize.decimal(_total_size))
@@ -141,13 +391,26 @@ class BinaryIOMixin:
 
     @classmethod
     def _load_binary_all(
-        cls, file_ctx, protocol, compress, show_progress, *args, **kwargs
+        cls,
+        file_ctx,
+        protocol,
+        compress,
+        show_progress,
+        *args,
+        num_worker: int = 1,
+        backend: str = 'thread',
+        lazy: bool = False,
+        **kwargs,
     ):
         """Read a `DocumentArray` object from a binary file
 
         :param protocol: protocol to use
         :param compress: compress algorithm to use
         :param _show_progress: show progress bar, only works when protocol is `pickle` or `protobuf`
+        :param num_worker: the number of parallel workers decoding Documents, only works when protocol is `pickle` or
+            `protobuf`
+        :param backend: `thread` or `process`, the backend used when ``num_worker`` is more than one
+        :param lazy: if set, decode the fields of `protobuf` Documents on first access
         :return: a `DocumentArray`
         """
         from docarray import Document
@@ -166,7 +429,7 @@ class BinaryIOMixin:
             dap = DocumentArrayProto()
             dap.ParseFromString(d)
 
-            return cls.from_protobuf(dap)
+            return cls.from_protobuf(dap, lazy=lazy)
         elif protocol == 'pickle-array':
             return pickle.loads(d)
 
@@ -191,6 +454,31 @@ class BinaryIOMixin:
                 _total_size = 0
                 pbar.start_task(t)
 
+                if num_worker > 1 and num_docs:
+                    from docarray.array.mixins.parallel import _get_pool
+
+                    # a few ranges per worker to balance uneven Document sizes
+                    ranges = _split_stream(d, num_docs, num_worker * 4)
+                    with _get_pool(backend, num_worker) as p:
+                        for (start, end), chunk in zip(
+                            ranges,
+                            p.imap(
+                                _decode_stream_chunk,
+                                (
+                                    (d[start:end], protocol, compress, lazy)
+                                    for start, end in ranges
+                                ),
+                            ),
+                        ):
+                            docs.extend(chunk)
+                            _total_size += end - start
+                            pbar.update(
+                                t,
+                                advance=len(chunk),
+                                total_size=str(filesize.decimal(_total_size)),
+                            )
+                    return cls(docs, *args, **kwargs)
+
                 for _ in range(num_docs):
                     # 4 bytes (uint32)
                     len_current_doc_in_bytes = int.from_bytes(
@@ -205,6 +493,7 @@ class BinaryIOMixin:
                         d[start_doc_pos:end_doc_pos],
                         protocol=protocol,
                         compress=compress,
+                        lazy=lazy,
                     )
                     docs.append(doc)
                     _total_size += len_current_doc_in_bytes
@@ -237,12 +526,33 @@ class BinaryIOMixin:
         file: Union[str, BinaryIO],
         protocol: str = 'pickle-array',
         compress: Optional[str] = None,
+        offset_index: bool = False,
+        id_index: bool = False,
+        num_worker: int = 1,
+        backend: str = 'thread',
+        pack_ndarrays: bool = False,
+        tags_codec: str = 'struct',
     ) -> None:
         """Save array elements into a binary file.
 
         :param file: File or filename to which the data is saved.
         :param protocol: protocol to use
         :param compress: compress algorithm to use
+        :param offset_index: if set, append a table of Document offsets to the file, so that it can be read by
+            position without a full scan, see ``load_binary(..., random_access=True)``.
+            Only works when protocol is `pickle` or `protobuf`.
+        :param id_index: if set, also append a table of Document ids, so that Documents can be read by id.
+            Implies ``offset_index``.
+        :param num_worker: the number of parallel workers serializing and compressing Documents. The file is still
+            written in order by the calling thread. More workers than CPUs only add the cost of moving Documents to and
+            from the pool. Only works when protocol is `pickle` or `protobuf`.
+        :param backend: `thread` or `process`, the backend of the pool used when ``num_worker`` is more than one.
+            Compression releases the GIL, `process` workers have to receive the Documents pickled.
+        :param pack_ndarrays: if set, store the embeddings and tensors as single dense arrays, see :meth:`to_protobuf`.
+            Only works when protocol is `protobuf-array`.
+        :param tags_codec: `struct` or `msgpack`, how the ``tags`` of the Documents are encoded, see
+            :meth:`~docarray.document.mixins.protobuf.ProtobufMixin.to_protobuf`.
+            Only works when protocol is `protobuf` or `protobuf-array`.
 
          .. note::
             If `file` is `str` it can specify `protocol` and `compress` as file extensions.
@@ -269,7 +579,17 @@ class BinaryIOMixin:
 
             file_ctx = open(file, 'wb')
 
-        self.to_bytes(protocol=protocol, compress=compress, _file_ctx=file_ctx)
+        self.to_bytes(
+            protocol=protocol,
+            compress=compress,
+            _file_ctx=file_ctx,
+            offset_index=offset_index,
+            id_index=id_index,
+            num_worker=num_worker,
+            backend=backend,
+            pack_ndarrays=pack_ndarrays,
+            tags_codec=tags_codec,
+        )
 
     def to_bytes(
         self,
@@ -277,6 +597,12 @@ class BinaryIOMixin:
         compress: Optional[str] = None,
         _file_ctx: Optional[BinaryIO] = None,
         _show_progress: bool = False,
+        offset_index: bool = False,
+        id_index: bool = False,
+        num_worker: int = 1,
+        backend: str = 'thread',
+        pack_ndarrays: bool = False,
+        tags_codec: str = 'struct',
     ) -> bytes:
         """Serialize itself into bytes.
 
@@ -286,8 +612,24 @@ class BinaryIOMixin:
         :param protocol: protocol to use
         :param compress: compress algorithm to use
         :param _show_progress: show progress bar, only works when protocol is `pickle` or `protobuf`
+        :param offset_index: if set, append a table of Document offsets (V2 streaming format).
+            Only works when protocol is `pickle` or `protobuf`.
+        :param id_index: if set, also append a table of Document ids. Implies ``offset_index``.
+        :param num_worker: the number of parallel workers serializing and compressing Documents, only works when
+            protocol is `pickle` or `protobuf`. The bytes are still written in order by the calling thread.
+        :param backend: `thread` or `process`, the backend used when ``num_worker`` is more than one
+        :param pack_ndarrays: if set, store the embeddings and tensors as single dense arrays, see :meth:`to_protobuf`.
+            Only works when protocol is `protobuf-array`.
+        :param tags_codec: `struct` or `msgpack`, how the ``tags`` of the Documents are encoded, see
+            :meth:`~docarray.document.mixins.protobuf.ProtobufMixin.to_protobuf`.
+            Only works when protocol is `protobuf` or `protobuf-array`.
         :return: the binary serialization in bytes
         """
+        offset_index = offset_index or id_index
+        if offset_index and protocol not in ('pickle', 'protobuf'):
+            raise ValueError(
+                f'`offset_index` needs `protocol` to be `pickle` or `protobuf`, receiving `{protocol}`'
+            )
 
         if protocol == 'protobuf-array' or protocol == 'pickle-array':
             compress_ctx = get_compress_ctx(compress, mode='wb')
@@ -307,7 +649,11 @@ class BinaryIOMixin:
 
             with fc:
                 if protocol == 'protobuf-array':
-                    f.write(self.to_protobuf().SerializePartialToString())
+                    f.write(
+                        self.to_protobuf(
+                            pack_ndarrays=pack_ndarrays, tags_codec=tags_codec
+                        ).SerializePartialToString()
+                    )
                 elif protocol == 'pickle-array':
                     f.write(pickle.dumps(self))
                 elif protocol in ('pickle', 'protobuf'):
@@ -318,20 +664,39 @@ class BinaryIOMixin:
                         'Serializing', disable=not _show_progress, total=len(self)
                     )
 
-                    f.write(self._stream_header)
+                    header = self._stream_header
+                    if offset_index:
+                        header = b'\x02' + header[1:]
+                    f.write(header)
 
+                    offsets, ids = [], []
                     with pbar:
                         _total_size = 0
                         pbar.start_task(t)
-                        for d in self:
-                            r = d._to_stream_bytes(protocol=protocol, compress=compress)
-                            f.write(r)
-                            _total_size += len(r)
+                        for doc_ids, chunk in self._iter_stream_chunks(
+                            protocol, compress, num_worker, backend, tags_codec
+                        ):
+                            for doc_id, r in zip(doc_ids, chunk):
+                                if offset_index:
+                                    offsets.append(len(header) + _total_size)
+                                    if id_index:
+                                        ids.append(doc_id)
+                                f.write(r)
+                                _total_size += len(r)
                             pbar.update(
                                 t,
-                                advance=1,
+                                advance=len(chunk),
                                 total_size=str(filesize.decimal(_total_size)),
                             )
+
+                    if offset_index:
+                        f.write(
+                            _stream_index_footer(
+                                len(header) + _total_size,
+                                offsets,
+                                ids if id_index else None,
+                            )
+                        )
                 else:
                     raise ValueError(
                         f'protocol={protocol} is not supported. Can be only `protobuf`, `pickle`, `protobuf-array`, `pickle-array`.'
@@ -340,25 +705,121 @@ class BinaryIOMixin:
             if not _file_ctx:
                 return bf.getvalue()
 
-    def to_protobuf(self, ndarray_type: Optional[str] = None) -> 'DocumentArrayProto':
+    def _iter_stream_chunks(
+        self,
+        protocol: str,
+        compress: Optional[str],
+        num_worker: int,
+        backend: str,
+        tags_codec: str = 'struct',
+    ) -> Iterator[Tuple[List[str], List[bytes]]]:
+        # the ids and the length-prefixed bytes of the Documents, in order
+        if num_worker <= 1:
+            for d in self:
+                yield [d.id], [
+                    d._to_stream_bytes(
+                        protocol=protocol, compress=compress, tags_codec=tags_codec
+                    )
+                ]
+            return
+
+        from docarray.array.mixins.parallel import _get_pool
+
+        # a few batches per worker, small enough to keep the writer busy
+        batch_size = max(1, min(256, ceil(len(self) / (num_worker * 4))))
+        with _get_pool(backend, num_worker) as p:
+            yield from p.imap(
+                _encode_stream_chunk,
+                (
+                    (batch, protocol, compress, tags_codec)
+                    for batch in self.batch(batch_size=batch_size)
+                ),
+            )
+
+    def to_protobuf(
+        self,
+        ndarray_type: Optional[str] = None,
+        pack_ndarrays: bool = False,
+        tags_codec: str = 'struct',
+    ) -> 'DocumentArrayProto':
         """Convert DocumentArray into a Protobuf message.
 
         :param ndarray_type: can be ``list`` or ``numpy``, if set it will force all ndarray-like object from all
             Documents to ``List`` or ``numpy.ndarray``.
+        :param pack_ndarrays: if set, the ``embedding`` and ``tensor`` of the top-level Documents are each stored once
+            as a single dense array with a list of ids, instead of one array per Document. A field is packed only if
+            all its values are dense and share framework, shape and dtype. :meth:`from_protobuf` reads them as views of
+            the message buffer.
+        :param tags_codec: `struct` or `msgpack`, how the ``tags`` of the Documents are encoded, see
+            :meth:`~docarray.document.mixins.protobuf.ProtobufMixin.to_protobuf`.
         :return: the protobuf message
         """
         from docarray.proto.docarray_pb2 import DocumentArrayProto
+        from docarray.proto.io import flush_proto
+        from docarray.proto.io.ndarray import flush_packed_ndarray
 
         dap = DocumentArrayProto()
-        for d in self:
-            dap.docs.append(d.to_protobuf(ndarray_type))
+        packed = []
+        docs = self
+        if pack_ndarrays:
+            docs = list(self)
+            for field in ('embedding', 'tensor'):
+                if flush_packed_ndarray(dap.packed.add(), field, docs, ndarray_type):
+                    packed.append(field)
+                else:
+                    del dap.packed[-1]
+
+        for d in docs:
+            dap.docs.append(
+                flush_proto(
+                    d, ndarray_type, exclude_fields=packed, tags_codec=tags_codec
+                )
+            )
         return dap
 
     @classmethod
-    def from_protobuf(cls: Type['T'], pb_msg: 'DocumentArrayProto') -> 'T':
+    def from_protobuf(
+        cls: Type['T'],
+        pb_msg: 'DocumentArrayProto',
+        writable_ndarrays: bool = False,
+        lazy_ndarrays: bool = False,
+        lazy: bool = False,
+    ) -> 'T':
+        """Build a DocumentArray from a Protobuf message.
+
+        :param pb_msg: the protobuf message
+        :param writable_ndarrays: if set, ``tensor`` and ``embedding`` are copied into writable, aligned buffers.
+            Otherwise ``numpy`` and ``torch`` arrays are read-only views of the message.
+        :param lazy_ndarrays: if set, the ``tensor`` and ``embedding`` of each Document are only decoded when they are
+            accessed. Packed arrays are always decoded.
+        :param lazy: if set, only the scalar fields of each Document are decoded, the others when they are accessed
+        :return: the DocumentArray
+        """
         from docarray import Document
-
-        return cls(Document.from_protobuf(od) for od in pb_msg.docs)
+        from docarray.proto.io.ndarray import read_packed_ndarray
+
+        docs = [
+            Document.from_protobuf(
+                od,
+                writable_ndarrays=writable_ndarrays,
+                lazy_ndarrays=lazy_ndarrays,
+                lazy=lazy,
+            )
+            for od in pb_msg.docs
+        ]
+        if pb_msg.packed:
+            docs_by_id = None
+            for packed in pb_msg.packed:
+                field, ids, values = read_packed_ndarray(packed, writable_ndarrays)
+                if ids:
+                    if docs_by_id is None:
+                        docs_by_id = {d.id: d for d in docs}
+                    targets = (docs_by_id[_id] for _id in ids)
+                else:
+                    targets = docs
+                for d, value in zip(targets, values):
+                    setattr(d, field, value)
+        return cls(docs)
 
     def __bytes__(self):
         return self.to_bytes()
@@ -402,3 +863,68 @@ class BinaryIOMixin:
         # 8 bytes (uint64)
         num_docs_as_bytes = len(self).to_bytes(8, 'big', signed=False)
         return version_byte + num_docs_as_bytes
+
+
+def _split_stream(d: bytes, num_docs: int, n_ranges: int) -> List[Tuple[int, int]]:
+    # byte ranges of roughly equal size covering whole length-prefixed Documents, found from the length prefixes only
+    target = max((len(d) - 9) // n_ranges, 1)
+    ranges = []
+    start = pos = 9
+    for _ in range(num_docs):
+        # 4 bytes (uint32)
+        pos += 4 + int.from_bytes(d[pos : pos + 4], 'big', signed=False)
+        if pos - start >= target:
+            ranges.append((start, pos))
+            start = pos
+    if pos > start:
+        ranges.append((start, pos))
+    return ranges
+
+
+def _decode_stream_chunk(args) -> List['Document']:
+    from docarray import Document
+
+    data, protocol, compress, lazy = args
+    docs = []
+    pos = 0
+    while pos < len(data):
+        # 4 bytes (uint32)
+        end = pos + 4 + int.from_bytes(data[pos : pos + 4], 'big', signed=False)
+        docs.append(
+            Document.from_bytes(
+                data[pos + 4 : end], protocol=protocol, compress=compress, lazy=lazy
+            )
+        )
+        pos = end
+    return docs
+
+
+def _encode_stream_chunk(args) -> Tuple[List[str], List[bytes]]:
+    docs, protocol, compress, tags_codec = args
+    return [d.id for d in docs], [
+        d._to_stream_bytes(protocol=protocol, compress=compress, tags_codec=tags_codec)
+        for d in docs
+    ]
+
+
+def _stream_index_footer(
+    index_pos: int, offsets: List[int], ids: Optional[List[str]] = None
+) -> bytes:
+    # V2 DocArray streaming serialization format, V1 followed by
+    # | num_docs * 8 bytes | [num_docs * (4 bytes | variable)] | 8 bytes | 8 bytes | 4 bytes |
+    # i.e. the offset of every Document length prefix (uint64), the optional id table of length-prefixed UTF-8 ids,
+    # the position of the offset table (uint64), the position of the id table or 0 (uint64) and a magic string
+
+    parts = [np.asarray(offsets, dtype='>u8').tobytes()]
+    ids_pos = 0
+    if ids is not None:
+        ids_pos = index_pos + 8 * len(offsets)
+        for _id in ids:
+            _id = _id.encode('utf-8')
+            parts.append(len(_id).to_bytes(4, 'big', signed=False) + _id)
+    parts.append(
+        index_pos.to_bytes(8, 'big', signed=False)
+        + ids_pos.to_bytes(8, 'big', signed=False)
+        + _STREAM_INDEX_MAGIC
+    )
+    return b''.join(parts)
@@ -0,0 +1,554 @@
+import json
+import os
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from docarray.typing import T, ArrayType
+    from docarray import Document, DocumentArray
+
+COLUMNAR_FORMAT_VERSION = 1
+
+# file names inside a columnar directory
+_META_FILE = 'meta.json'
+_EMBEDDINGS_FILE = 'embeddings.npy'
+_TENSORS_DATA_FILE = 'tensors.npy'
+_TENSORS_OFFSETS_FILE = 'tensors.offsets.npy'
+_TENSORS_SHAPES_FILE = 'tensors.shapes.npy'
+
+
+class ColumnarIOMixin:
+    """Save/load an array to/from a directory of memory-mappable column files."""
+
+    def save_columnar(self, path: Union[str, os.PathLike]) -> None:
+        """Save array elements into a directory of column files.
+
+        The directory holds:
+
+            - ``ids`` and, if any Document has them, ``text`` and ``tags`` as variable-length buffers, i.e. a
+              ``.data`` file of concatenated UTF-8 bytes and a ``.offsets.npy`` file of ``len(self) + 1`` offsets;
+            - ``embeddings.npy``, if all Documents have numpy embeddings of the same shape and dtype;
+            - ``tensors.npy``, ``tensors.offsets.npy`` and ``tensors.shapes.npy``, the flattened numpy tensors with
+              their offsets and shapes, if all tensors share the same dtype and number of dimensions;
+            - ``docs``, a variable-length buffer of the protobuf serialization of the remaining fields, if any;
+            - ``meta.json``, the list of columns.
+
+        All numeric files can be memory-mapped, see :meth:`load_columnar`.
+
+        The Documents are read in a single pass. Only if the embeddings or tensors turn out not to fit a column, the
+        Documents before the first one that does not fit are read again to keep their fields in ``docs``.
+
+        The tags are stored as JSON, so they must be a ``dict`` with ``str`` keys and values that are ``dict``,
+        ``list``, ``tuple``, ``str``, ``int``, ``float``, ``bool``, ``None`` or numpy scalars. As with the default
+        Protobuf serialization, tuples are loaded as lists.
+
+        :param path: the directory to save into, created if it does not exist
+        """
+        os.makedirs(path, exist_ok=True)
+        length = len(self)
+        ids = _StringColumnWriter(path, 'ids', length)
+        text = _StringColumnWriter(path, 'text', length)
+        tags = _StringColumnWriter(path, 'tags', length)
+        embeddings = _EmbeddingsColumnWriter(path, length)
+        tensors = _TensorsColumnWriter(path, length)
+
+        rest = []
+        for i, d in enumerate(self):
+            ids.write(i, d.id)
+            text.write(i, d.text)
+            tags.write(i, _encode_tags(d) if d.tags else '')
+            embeddings.write(i, d.embedding)
+            tensors.write(i, d.tensor)
+            rest.append(
+                _encode_rest(d, embeddings.failed_at is None, tensors.failed_at is None)
+            )
+
+        has_embeddings = embeddings.close()
+        has_tensors = tensors.close()
+        stale = set(range(embeddings.failed_at or 0))
+        stale.update(i for i in range(tensors.failed_at or 0) if tensors.has_tensor(i))
+        for i in sorted(stale):
+            rest[i] = _encode_rest(self[i], has_embeddings, has_tensors)
+
+        columns = ['ids']
+        ids.close(keep_empty=True)
+        if text.close():
+            columns.append('text')
+        if tags.close():
+            columns.append('tags')
+        if has_embeddings:
+            columns.append('embedding')
+        if has_tensors:
+            columns.append('tensor')
+
+        docs = _StringColumnWriter(path, 'docs', length)
+        for i, r in enumerate(rest):
+            docs.write(i, r)
+        has_docs = docs.close()
+
+        with open(os.path.join(path, _META_FILE), 'w') as fp:
+            json.dump(
+                {
+                    'version': COLUMNAR_FORMAT_VERSION,
+                    'length': length,
+                    'columns': columns,
+                    'has_docs': has_docs,
+                },
+                fp,
+            )
+
+    @classmethod
+    def load_columnar(
+        cls: Type['T'],
+        path: Union[str, os.PathLike],
+        lazy: bool = False,
+        *args,
+        **kwargs,
+    ) -> Union['T', 'ColumnarDocumentArray']:
+        """Load array elements from a directory written by :meth:`save_columnar`.
+
+        :param path: the directory to load from
+        :param lazy: if set, return a read-only :class:`ColumnarDocumentArray` that memory-maps the column files and only
+            materializes Documents when they are accessed. Opening it does not read the data, and its ``.embeddings``
+            is a memory map of the file.
+        :param args: passed to the DocumentArray constructor, unused when ``lazy`` is set
+        :param kwargs: passed to the DocumentArray constructor, unused when ``lazy`` is set
+        :return: a DocumentArray, or a :class:`ColumnarDocumentArray` if ``lazy`` is set
+        """
+        columnar = ColumnarDocumentArray(path)
+        if lazy:
+            return columnar
+        return cls(columnar.iter_docs(copy=True), *args, **kwargs)
+
+
+class ColumnarDocumentArray(Sequence['Document']):
+    """A read-only sequence of Documents stored in a directory of column files, see
+    :meth:`~docarray.array.mixins.io.columnar.ColumnarIOMixin.save_columnar`.
+
+    Column files are memory-mapped, so that opening even a very large directory is instant and only the accessed
+    parts are read from disk. Documents are materialized on access, their ``.embedding`` and ``.tensor`` are read-only
+    views of the memory maps.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        with open(os.path.join(path, _META_FILE)) as fp:
+            meta = json.load(fp)
+        if meta['version'] > COLUMNAR_FORMAT_VERSION:
+            raise ValueError(
+                f'columnar format version {meta["version"]} is not supported, '
+                f'upgrade DocArray to load {path}'
+            )
+
+        self._path = path
+        self._length = meta['length']
+        self._columns = meta['columns']
+
+        self._ids = _StringColumn(path, 'ids')
+        self._text = _StringColumn(path, 'text') if 'text' in self._columns else None
+        self._tags = _StringColumn(path, 'tags') if 'tags' in self._columns else None
+        self._docs = _StringColumn(path, 'docs') if meta['has_docs'] else None
+
+        self._embeddings = None
+        if 'embedding' in self._columns:
+            self._embeddings = np.load(
+                os.path.join(path, _EMBEDDINGS_FILE), mmap_mode='r'
+            )
+
+        self._tensors = None
+        if 'tensor' in self._columns:
+            self._tensors = (
+                np.load(os.path.join(path, _TENSORS_DATA_FILE), mmap_mode='r'),
+                np.load(os.path.join(path, _TENSORS_OFFSETS_FILE), mmap_mode='r'),
+                np.load(os.path.join(path, _TENSORS_SHAPES_FILE), mmap_mode='r'),
+            )
+
+        self._id_to_index = None  # type: Optional[Dict[str, int]]
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self) -> Iterator['Document']:
+        return self.iter_docs()
+
+    def __getitem__(
+        self, key: Union[int, str, slice, Sequence[int], Sequence[str]]
+    ) -> Union['Document', 'DocumentArray']:
+        from docarray import DocumentArray
+
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self._length
+            if not 0 <= key < self._length:
+                raise IndexError(f'index {key} is out of range')
+            return self._get_doc(int(key))
+        elif isinstance(key, str):
+            return self._get_doc(self._get_offset(key))
+        elif isinstance(key, slice):
+            return DocumentArray(
+                self._get_doc(i) for i in range(*key.indices(self._length))
+            )
+        elif isinstance(key, (list, tuple, np.ndarray)):
+            return DocumentArray(self[k] for k in key)
+        raise IndexError(f'unsupported key type {type(key)!r}')
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} (length={len(self)}) at {self._path}>'
+
+    @property
+    def embeddings(self) -> Optional['np.ndarray']:
+        """Return the embeddings of all Documents, as a read-only memory map of the column file.
+
+        :return: a 2-D ``np.memmap``, or None if the embeddings were not saved as a column
+        """
+        return self._embeddings
+
+    @property
+    def ids(self) -> List[str]:
+        """Return the ids of all Documents.
+
+        :return: a list of ids
+        """
+        return [self._ids[i] for i in range(self._length)]
+
+    def iter_docs(self, copy: bool = False) -> Iterator['Document']:
+        """Materialize the Documents one by one.
+
+        :param copy: if set, copy the arrays of the Documents out of the memory maps
+        :yield: the Documents, in order
+        """
+        for i in range(self._length):
+            yield self._get_doc(i, copy=copy)
+
+    def find(
+        self,
+        query: Union['Document', 'DocumentArray', 'ArrayType'],
+        metric: str = 'cosine',
+        limit: int = 20,
+        metric_name: Optional[str] = None,
+        batch_size: int = 65536,
+    ) -> Union['DocumentArray', List['DocumentArray']]:
+        """Find the nearest neighbours of the query by exhaustive search over the memory-mapped embeddings.
+
+        Embeddings are read from disk ``batch_size`` rows at a time, and only the matches are materialized.
+
+        :param query: the query embeddings, or Documents to take the embeddings from
+        :param metric: the distance metric
+        :param limit: the maximum number of matches
+        :param metric_name: if provided, then match result will be marked with this string.
+        :param batch_size: the number of embeddings read at once
+        :return: the matches of each query, or a single DocumentArray if the query is a 1-D vector
+        """
+        from docarray import Document, DocumentArray
+        from docarray.math.distance import cdist
+        from docarray.math.helper import top_k, update_rows_x_mat_best
+        from docarray.math.ndarray import to_numpy_array
+        from docarray.score import NamedScore
+
+        if self._embeddings is None:
+            raise ValueError(f'{self!r} has no embeddings column')
+
+        if isinstance(query, Document):
+            query = DocumentArray(query)
+        if isinstance(query, DocumentArray):
+            query = query.embeddings
+        query = to_numpy_array(query)
+        single = query.ndim == 1
+        query = query.reshape(-1, self._embeddings.shape[1])
+
+        limit = min(limit, self._length)
+        metric_name = metric_name or metric
+        top_dists = np.full((len(query), limit), np.inf)
+        top_inds = np.zeros((len(query), limit), dtype=int)
+        for start in range(0, self._length, batch_size):
+            dists = cdist(
+                query,
+                np.asarray(self._embeddings[start : start + batch_size]),
+                metric,
+            )
+            dists, inds = top_k(dists, min(limit, dists.shape[1]), descending=False)
+            top_dists, top_inds = update_rows_x_mat_best(
+                top_dists, top_inds, dists, inds + start, limit
+            )
+
+        order = np.argsort(top_dists, axis=1)
+        top_dists = np.take_along_axis(top_dists, order, axis=1)
+        top_inds = np.take_along_axis(top_inds, order, axis=1)
+
+        results = []
+        for dists, inds in zip(top_dists, top_inds):
+            matches = DocumentArray()
+            for dist, i in zip(dists, inds):
+                d = self._get_doc(int(i))
+                d.scores[metric_name] = NamedScore(value=dist)
+                matches.append(d)
+            results.append(matches)
+        return results[0] if single else results
+
+    def _get_offset(self, doc_id: str) -> int:
+        if self._id_to_index is None:
+            self._id_to_index = {doc_id: i for i, doc_id in enumerate(self.ids)}
+        try:
+            return self._id_to_index[doc_id]
+        except KeyError:
+            raise KeyError(f'`{doc_id}` is not found') from None
+
+    def _get_doc(self, i: int, copy: bool = False) -> 'Document':
+        from docarray import Document
+
+        if self._docs is not None and self._docs.nbytes(i):
+            d = Document.from_bytes(self._docs.get_bytes(i), protocol='protobuf')
+        else:
+            d = Document()
+        d.id = self._ids[i]
+
+        if self._text is not None and self._text.nbytes(i):
+            d.text = self._text[i]
+        if self._tags is not None and self._tags.nbytes(i):
+            d.tags = json.loads(self._tags[i])
+        if self._embeddings is not None:
+            # `np.asarray` drops the memmap subclass but keeps viewing the mapped file
+            d.embedding = (
+                np.array(self._embeddings[i])
+                if copy
+                else np.asarray(self._embeddings[i])
+            )
+        if self._tensors is not None:
+            data, offsets, shapes = self._tensors
+            if shapes[i, 0] >= 0:
+                tensor = data[offsets[i] : offsets[i + 1]].reshape(tuple(shapes[i]))
+                d.tensor = np.array(tensor) if copy else np.asarray(tensor)
+        return d
+
+
+class _StringColumn:
+    # a column of variable-length strings, stored as concatenated bytes and offsets
+
+    def __init__(self, path: Union[str, os.PathLike], name: str):
+        self._offsets = np.load(
+            os.path.join(path, f'{name}.offsets.npy'), mmap_mode='r'
+        )
+        data_path = os.path.join(path, f'{name}.data')
+        # np.memmap can not map empty files
+        self._data = (
+            np.memmap(data_path, dtype=np.uint8, mode='r')
+            if os.path.getsize(data_path)
+            else np.empty(0, dtype=np.uint8)
+        )
+
+    def nbytes(self, i: int) -> int:
+        return int(self._offsets[i + 1] - self._offsets[i])
+
+    def get_bytes(self, i: int) -> bytes:
+        return self._data[self._offsets[i] : self._offsets[i + 1]].tobytes()
+
+    def __getitem__(self, i: int) -> str:
+        return self.get_bytes(i).decode('utf-8')
+
+
+class _StringColumnWriter:
+    # writes a `_StringColumn` value by value, its files are only created once a value is not empty
+
+    def __init__(self, path: Union[str, os.PathLike], name: str, length: int):
+        self._path = path
+        self._name = name
+        self._offsets = np.zeros(length + 1, dtype=np.int64)
+        self._fp = None
+
+    def write(self, i: int, value: Optional[Union[str, bytes]]) -> None:
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        if value:
+            if self._fp is None:
+                self._fp = open(os.path.join(self._path, f'{self._name}.data'), 'wb')
+            self._fp.write(value)
+        self._offsets[i + 1] = self._offsets[i] + len(value or b'')
+
+    def close(self, keep_empty: bool = False) -> bool:
+        """Write the offsets.
+
+        :param keep_empty: if set, the files are written even if all values are empty
+        :return: whether the files were written
+        """
+        if self._fp is None:
+            if not keep_empty:
+                return False
+            self._fp = open(os.path.join(self._path, f'{self._name}.data'), 'wb')
+        self._fp.close()
+        self._fp = None
+        np.save(os.path.join(self._path, f'{self._name}.offsets.npy'), self._offsets)
+        return True
+
+
+class _EmbeddingsColumnWriter:
+    # writes the embeddings into `embeddings.npy`, as long as they all are numpy arrays of the same shape and dtype
+
+    def __init__(self, path: Union[str, os.PathLike], length: int):
+        self._file = os.path.join(path, _EMBEDDINGS_FILE)
+        self._length = length
+        self._embeddings = None
+        # the index of the first Document whose embedding does not fit the column
+        self.failed_at = None  # type: Optional[int]
+
+    def write(self, i: int, embedding) -> None:
+        if self.failed_at is not None:
+            return
+        if not isinstance(embedding, np.ndarray):
+            return self._fail(i)
+        if self._embeddings is None:
+            self._embeddings = np.lib.format.open_memmap(
+                self._file,
+                mode='w+',
+                dtype=embedding.dtype,
+                shape=(self._length,) + embedding.shape,
+            )
+        elif (
+            embedding.shape != self._embeddings.shape[1:]
+            or embedding.dtype != self._embeddings.dtype
+        ):
+            return self._fail(i)
+        self._embeddings[i] = embedding
+
+    def _fail(self, i: int) -> None:
+        self.failed_at = i
+        if self._embeddings is not None:
+            self._embeddings = None
+            os.remove(self._file)
+
+    def close(self) -> bool:
+        # whether the embeddings column was written
+        if self._embeddings is None:
+            return False
+        self._embeddings.flush()
+        self._embeddings = None
+        return True
+
+
+class _TensorsColumnWriter:
+    # writes the flattened tensors, as long as they all are numpy arrays of the same dtype and number of dimensions.
+    # Their total size is only known at the end, so they go to a raw file first
+
+    def __init__(self, path: Union[str, os.PathLike], length: int):
+        self._path = path
+        self._raw_file = os.path.join(path, _TENSORS_DATA_FILE + '.part')
+        self._offsets = np.zeros(length + 1, dtype=np.int64)
+        # a negative first dimension marks a Document without tensor
+        self._shapes = None  # type: Optional[np.ndarray]
+        self._fp = None
+        self._dtype = None
+        # the index of the first Document whose tensor does not fit the column
+        self.failed_at = None  # type: Optional[int]
+
+    def write(self, i: int, tensor) -> None:
+        if self.failed_at is not None:
+            return
+        if tensor is None:
+            self._offsets[i + 1] = self._offsets[i]
+            return
+        if not isinstance(tensor, np.ndarray):
+            return self._fail(i)
+        if self._dtype is None:
+            if tensor.ndim == 0 or tensor.dtype.hasobject:
+                return self._fail(i)
+            self._dtype = tensor.dtype
+            self._shapes = np.full(
+                (len(self._offsets) - 1, tensor.ndim), -1, dtype=np.int64
+            )
+            self._fp = open(self._raw_file, 'wb')
+        elif tensor.dtype != self._dtype or tensor.ndim != self._shapes.shape[1]:
+            return self._fail(i)
+        self._fp.write(tensor.tobytes())
+        self._shapes[i] = tensor.shape
+        self._offsets[i + 1] = self._offsets[i] + tensor.size
+
+    def has_tensor(self, i: int) -> bool:
+        # whether the tensor of the Document at `i` was written to the column
+        return self._shapes is not None and self._shapes[i, 0] >= 0
+
+    def _fail(self, i: int) -> None:
+        self.failed_at = i
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+            os.remove(self._raw_file)
+
+    def close(self) -> bool:
+        # whether the tensors column was written
+        if self._fp is None:
+            return False
+        self._fp.close()
+        self._fp = None
+        size = int(self._offsets[-1])
+        data = np.lib.format.open_memmap(
+            os.path.join(self._path, _TENSORS_DATA_FILE),
+            mode='w+',
+            dtype=self._dtype,
+            shape=(size,),
+        )
+        if size:
+            data[:] = np.memmap(self._raw_file, dtype=self._dtype, mode='r')
+        data.flush()
+        del data
+        os.remove(self._raw_file)
+
+        np.save(os.path.join(self._path, _TENSORS_OFFSETS_FILE), self._offsets)
+        np.save(os.path.join(self._path, _TENSORS_SHAPES_FILE), self._shapes)
+        return True
+
+
+def _encode_tags(d: 'Document') -> str:
+    try:
+        _check_tags_keys(d.tags)
+        return json.dumps(d.tags, default=_json_default)
+    except TypeError as ex:
+        raise ValueError(
+            f'the tags of Document {d.id} can not be saved as a column: {ex}. Tags must be a `dict` with `str` keys '
+            f'and values that are `dict`, `list`, `tuple`, `str`, `int`, `float`, `bool`, `None` or numpy scalars'
+        ) from ex
+
+
+def _check_tags_keys(value) -> None:
+    # JSON would silently turn non-`str` keys into strings
+    if isinstance(value, dict):
+        for k, v in value.items():
+            if not isinstance(k, str):
+                raise TypeError(f'key {k!r} is not a `str`')
+            _check_tags_keys(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            _check_tags_keys(v)
+
+
+def _json_default(obj):
+    # numpy scalars in the tags, e.g. `np.float32` scores, are written as their Python value
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _encode_rest(d: 'Document', has_embeddings: bool, has_tensors: bool) -> bytes:
+    # the protobuf serialization of the fields of `d` that are not stored in a column, or empty bytes if there are none
+    from docarray import Document
+
+    r = Document()
+    r.copy_from(d, shallow=True)
+    columns = ['text', 'tags']
+    if has_embeddings:
+        columns.append('embedding')
+    if has_tensors:
+        columns.append('tensor')
+    for f in columns:
+        setattr(r._data, f, None)
+    if set(r.non_empty_fields) - {'id'}:
+        return r.to_bytes(protocol='protobuf')
+    return b''
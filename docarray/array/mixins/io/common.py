@@ -16,9 +16,10 @@ class CommonIOMixin:
         """Save array elements into a JSON, a binary file or a CSV file.
 
         :param file: File or filename to which the data is saved.
-        :param file_format: `json` or `binary` or `csv`. JSON and CSV files are human-readable,
+        :param file_format: `json` or `binary` or `csv` or `columnar`. JSON and CSV files are human-readable,
             but binary format gives much smaller size and faster save/load speed. Note that, CSV file has very limited
-            compatability, complex DocumentArray with nested structure can not be restored from a CSV file.
+            compatability, complex DocumentArray with nested structure can not be restored from a CSV file. `columnar`
+            saves into a directory of memory-mappable column files, see :meth:`save_columnar`.
         :param encoding: encoding used to save data into a file (it only applies to `JSON` and `CSV` format).
             By default, ``utf-8`` is used.
         """
@@ -28,8 +29,12 @@ class CommonIOMixin:
             self.save_binary(file)
         elif file_format == 'csv':
             self.save_csv(file, encoding=encoding)
+        elif file_format == 'columnar':
+            self.save_columnar(file)
         else:
-            raise ValueError('`format` must be one of [`json`, `binary`, `csv`]')
+            raise ValueError(
+                '`format` must be one of [`json`, `binary`, `csv`, `columnar`]'
+            )
 
     @classmethod
     def load(
@@ -42,9 +47,10 @@ class CommonIOMixin:
         """Load array elements from a JSON or a binary file, or a CSV file.
 
         :param file: File or filename to which the data is saved.
-        :param file_format: `json` or `binary` or `csv`. JSON and CSV files are human-readable,
+        :param file_format: `json` or `binary` or `csv` or `columnar`. JSON and CSV files are human-readable,
             but binary format gives much smaller size and faster save/load speed. CSV file has very limited compatability,
-            complex DocumentArray with nested structure can not be restored from a CSV file.
+            complex DocumentArray with nested structure can not be restored from a CSV file. `columnar` loads from a
+            directory written by :meth:`save_columnar`.
         :param encoding: encoding used to load data from a file (it only applies to `JSON` and `CSV` format).
             By default, ``utf-8`` is used.
 
@@ -56,5 +62,9 @@ class CommonIOMixin:
             return cls.load_binary(file)
         elif file_format == 'csv':
             return cls.load_csv(file, encoding=encoding)
+        elif file_format == 'columnar':
+            return cls.load_columnar(file, **kwargs)
         else:
-            raise ValueError('`format` must be one of [`json`, `binary`, `csv`]')
+            raise ValueError(
+                '`format` must be one of [`json`, `binary`, `csv`, `columnar`]'
+            )
@@ -1,11 +1,21 @@
 import csv
 from contextlib import nullcontext
-from typing import Union, TextIO, Optional, Dict, TYPE_CHECKING, Type, Sequence
+from typing import (
+    Union,
+    TextIO,
+    Optional,
+    Dict,
+    TYPE_CHECKING,
+    Type,
+    Sequence,
+    Generator,
+)
 
 import numpy as np
 
 if TYPE_CHECKING:  # pragma: no cover
     from docarray.typing import T
+    from docarray import Document
 
 
 class CsvIOMixin:
@@ -94,16 +104,21 @@ class CsvIOMixin:
         file: Union[str, TextIO],
         field_resolver: Optional[Dict[str, str]] = None,
         encoding: str = 'utf-8',
-    ) -> 'T':
+        streaming: bool = False,
+    ) -> Union['T', Generator['Document', None, None]]:
         """Load array elements from a binary file.
 
         :param file: File or filename to which the data is saved.
         :param field_resolver: a map from field names defined in JSON, dict to the field
             names defined in Document.
         :param encoding: encoding used to read a CSV file. By default, ``utf-8`` is used.
+        :param streaming: if set, return a generator that reads the file row by row and yields `Document` objects
         :return: a DocumentArray object
         """
 
         from docarray.document.generators import from_csv
 
-        return cls(from_csv(file, field_resolver=field_resolver, encoding=encoding))
+        docs = from_csv(file, field_resolver=field_resolver, encoding=encoding)
+        if streaming:
+            return docs
+        return cls(docs)
@@ -1,9 +1,10 @@
 import json
 from contextlib import nullcontext
-from typing import Union, TextIO, TYPE_CHECKING, Type, List
+from typing import Union, TextIO, TYPE_CHECKING, Type, List, Generator
 
 if TYPE_CHECKING:  # pragma: no cover
     from docarray.typing import T
+    from docarray import Document
 
 
 class JsonIOMixin:
@@ -14,6 +15,7 @@ class JsonIOMixin:
         file: Union[str, TextIO],
         protocol: str = 'jsonschema',
         encoding: str = 'utf-8',
+        streaming: bool = False,
         **kwargs
     ) -> None:
         """Save array elements into a JSON file.
@@ -23,6 +25,8 @@ class JsonIOMixin:
         :param file: File or filename to which the data is saved.
         :param protocol: `jsonschema` or `protobuf`
         :param encoding: encoding used to save data into a JSON file. By default, ``utf-8`` is used.
+        :param streaming: if set, write one JSON object per line (NDJSON), Document by Document, instead of building
+            the JSON string of the whole array in memory
         """
         if hasattr(file, 'write'):
             file_ctx = nullcontext(file)
@@ -30,7 +34,12 @@ class JsonIOMixin:
             file_ctx = open(file, 'w', encoding=encoding)
 
         with file_ctx as fp:
-            fp.write(self.to_json(protocol=protocol, **kwargs))
+            if streaming:
+                for d in self:
+                    fp.write(json.dumps(d.to_dict(protocol=protocol, **kwargs)))
+                    fp.write('\n')
+            else:
+                fp.write(self.to_json(protocol=protocol, **kwargs))
 
     @classmethod
     def load_json(
@@ -38,23 +47,26 @@ class JsonIOMixin:
         file: Union[str, TextIO],
         protocol: str = 'jsonschema',
         encoding: str = 'utf-8',
+        streaming: bool = False,
         **kwargs
-    ) -> 'T':
+    ) -> Union['T', Generator['Document', None, None]]:
         """Load array elements from a JSON file.
 
+        Both a JSON list and one JSON object per line (NDJSON), as written by ``save_json(..., streaming=True)``, are
+        supported. NDJSON is read line by line.
+
         :param file: File or filename or a JSON string to which the data is saved.
         :param protocol: `jsonschema` or `protobuf`
         :param encoding: encoding used to load data from a JSON file. By default, ``utf-8`` is used.
+        :param streaming: if set, return a generator over `Document` objects. With NDJSON, the memory usage does not
+            depend on the size of the file.
 
         :return: a DocumentArrayLike object
         """
-        if hasattr(file, 'read'):
-            file_ctx = nullcontext(file)
-        else:
-            file_ctx = open(file, 'r', encoding=encoding)
-
-        with file_ctx as fp:
-            return cls.from_json(fp.read(), protocol=protocol, **kwargs)
+        docs = _iter_json_docs(file, protocol, encoding)
+        if streaming:
+            return docs
+        return cls(docs, **kwargs)
 
     @classmethod
     def from_json(
@@ -97,3 +109,30 @@ class JsonIOMixin:
     # to comply with Document interfaces but less semantically accurate
     to_dict = to_list
     from_dict = from_list
+
+
+def _iter_json_docs(
+    file: Union[str, TextIO], protocol: str, encoding: str
+) -> Generator['Document', None, None]:
+    from docarray import Document
+
+    if hasattr(file, 'read'):
+        file_ctx = nullcontext(file)
+    else:
+        file_ctx = open(file, 'r', encoding=encoding)
+
+    with file_ctx as fp:
+        line = fp.readline()
+        while line and not line.strip():
+            line = fp.readline()
+
+        if line.lstrip().startswith('['):
+            # a JSON list can only be parsed as a whole
+            for v in json.loads(line + fp.read()):
+                yield Document.from_dict(v, protocol=protocol)
+            return
+
+        while line:
+            if line.strip():
+                yield Document.from_dict(json.loads(line), protocol=protocol)
+            line = fp.readline()
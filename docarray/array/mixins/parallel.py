@@ -1,7 +1,13 @@
+import atexit
+import os
+import pickle
 import sys
+import threading
+import weakref
 from contextlib import nullcontext
 from math import ceil
-from types import LambdaType
+from multiprocessing.pool import Pool as _ProcessPool
+from types import FunctionType, LambdaType
 from typing import (
     Callable,
     TYPE_CHECKING,
@@ -10,6 +16,8 @@ from typing import (
     overload,
     TypeVar,
     Union,
+    Dict,
+    Tuple,
 )
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -20,6 +28,18 @@ if TYPE_CHECKING:  # pragma: no cover
 
 T_DA = TypeVar('T_DA')
 
+# pools reused across calls, keyed by backend and number of workers
+_MANAGED_POOLS = {}  # type: Dict[Tuple[str, int], Union[Pool, ThreadPool]]
+_MANAGED_POOLS_LOCK = threading.Lock()
+_MANAGED_POOLS_PID = os.getpid()
+# in a worker of a managed pool, the key of that pool
+_managed_worker = threading.local()
+# the payloads of the functions sent to managed process pools, see `_PickledTask`
+_PICKLED_FUNCTIONS = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+# in a worker of a managed process pool, the functions unpickled from these payloads
+_UNPICKLED_FUNCTIONS = {}  # type: Dict[bytes, Callable]
+_MAX_UNPICKLED_FUNCTIONS = 256
+
 
 class ParallelMixin:
     """Helper functions that provide parallel map to :class:`DocumentArray`"""
@@ -33,6 +53,7 @@ class ParallelMixin:
         num_worker: Optional[int] = None,
         show_progress: bool = False,
         pool: Optional[Union['Pool', 'ThreadPool']] = None,
+        reuse_pool: Optional[bool] = None,
     ) -> 'T':
         """Apply ``func`` to every Document in itself, return itself after modification.
 
@@ -50,6 +71,10 @@ class ParallelMixin:
 
         :param num_worker: the number of parallel workers. If not given, then the number of CPUs in the system will be used.
         :param pool: use an existing/external process or thread pool. If given, `backend` is ignored and you will be responsible for closing the pool.
+        :param reuse_pool: whether to use the managed pool of ``backend`` and ``num_worker`` when ``pool`` is not given,
+            created on first use and kept alive across calls, see :func:`get_managed_pool`. Otherwise a new pool is
+            created and closed. If not given, only `thread` pools are reused, as a managed `process` pool only knows the
+            functions and global state that existed when its workers started.
         :param show_progress: show a progress bar
 
         """
@@ -75,6 +100,10 @@ class ParallelMixin:
 
         :param num_worker: the number of parallel workers. If not given, then the number of CPUs in the system will be used.
         :param pool: use an existing/external process or thread pool. If given, `backend` is ignored and you will be responsible for closing the pool.
+        :param reuse_pool: whether to use the managed pool of ``backend`` and ``num_worker`` when ``pool`` is not given,
+            created on first use and kept alive across calls, see :func:`get_managed_pool`. Otherwise a new pool is
+            created and closed. If not given, only `thread` pools are reused, as a managed `process` pool only knows the
+            functions and global state that existed when its workers started.
         :param show_progress: show a progress bar
         :return: itself after modification
 
@@ -95,6 +124,7 @@ class ParallelMixin:
         num_worker: Optional[int] = None,
         show_progress: bool = False,
         pool: Optional[Union['Pool', 'ThreadPool']] = None,
+        reuse_pool: Optional[bool] = None,
     ) -> Generator['T', None, None]:
         """Return an iterator that applies function to every **element** of iterable in parallel, yielding the results.
 
@@ -118,20 +148,21 @@ class ParallelMixin:
         :param num_worker: the number of parallel workers. If not given, then the number of CPUs in the system will be used.
         :param show_progress: show a progress bar
         :param pool: use an existing/external process or thread pool. If given, `backend` is ignored and you will be responsible for closing the pool.
+        :param reuse_pool: whether to use the managed pool of ``backend`` and ``num_worker`` when ``pool`` is not given,
+            created on first use and kept alive across calls, see :func:`get_managed_pool`. Otherwise a new pool is
+            created and closed. If not given, only `thread` pools are reused, as a managed `process` pool only knows the
+            functions and global state that existed when its workers started.
 
         :yield: anything return from ``func``
         """
         if _is_lambda_or_partial_or_local_function(func) and backend == 'process':
             func = _globalize_lambda_function(func)
+            # the globalized function only exists in processes forked after this point
+            reuse_pool = False
 
         from rich.progress import track
 
-        if pool:
-            p = pool
-            ctx_p = nullcontext()
-        else:
-            p = _get_pool(backend, num_worker)
-            ctx_p = p
+        p, ctx_p = _get_pool_and_context(backend, num_worker, pool, reuse_pool)
 
         with ctx_p:
             for x in track(
@@ -150,6 +181,8 @@ class ParallelMixin:
         shuffle: bool = False,
         show_progress: bool = False,
         pool: Optional[Union['Pool', 'ThreadPool']] = None,
+        reuse_pool: Optional[bool] = None,
+        shared_memory: bool = False,
     ) -> 'T':
         """Batches itself into mini-batches, applies `func` to every mini-batch, and return itself after the modifications.
 
@@ -191,6 +224,12 @@ class ParallelMixin:
         :param shuffle: If set, shuffle the Documents before dividing into minibatches.
         :param show_progress: show a progress bar
         :param pool: use an existing/external process or thread pool. If given, `backend` is ignored and you will be responsible for closing the pool.
+        :param reuse_pool: whether to use the managed pool of ``backend`` and ``num_worker`` when ``pool`` is not given,
+            created on first use and kept alive across calls, see :func:`get_managed_pool`. Otherwise a new pool is
+            created and closed. If not given, only `thread` pools are reused, as a managed `process` pool only knows the
+            functions and global state that existed when its workers started.
+        :param shared_memory: with `process` backend, pass the numpy ``.tensor`` and ``.embedding`` of the batches to the
+            workers and back through shared memory instead of pickling them. Requires Python 3.8+.
 
         """
 
@@ -239,6 +278,12 @@ class ParallelMixin:
         :param shuffle: If set, shuffle the Documents before dividing into minibatches.
         :param show_progress: show a progress bar
         :param pool: use an existing/external process or thread pool. If given, `backend` is ignored and you will be responsible for closing the pool.
+        :param reuse_pool: whether to use the managed pool of ``backend`` and ``num_worker`` when ``pool`` is not given,
+            created on first use and kept alive across calls, see :func:`get_managed_pool`. Otherwise a new pool is
+            created and closed. If not given, only `thread` pools are reused, as a managed `process` pool only knows the
+            functions and global state that existed when its workers started.
+        :param shared_memory: with `process` backend, pass the numpy ``.tensor`` and ``.embedding`` of the batches to the
+            workers and back through shared memory instead of pickling them. Requires Python 3.8+.
         :return: itself after modification
 
         .. # noqa: DAR102
@@ -260,6 +305,8 @@ class ParallelMixin:
         shuffle: bool = False,
         show_progress: bool = False,
         pool: Optional[Union['Pool', 'ThreadPool']] = None,
+        reuse_pool: Optional[bool] = None,
+        shared_memory: bool = False,
     ) -> Generator['T', None, None]:
         """Return an iterator that applies function to every **minibatch** of iterable in parallel, yielding the results.
         Each element in the returned iterator is :class:`DocumentArray`.
@@ -285,40 +332,383 @@ class ParallelMixin:
         :param num_worker: the number of parallel workers. If not given, then the number of CPUs in the system will be used.
         :param show_progress: show a progress bar
         :param pool: use an existing/external pool. If given, `backend` is ignored and you will be responsible for closing the pool.
+        :param reuse_pool: whether to use the managed pool of ``backend`` and ``num_worker`` when ``pool`` is not given,
+            created on first use and kept alive across calls, see :func:`get_managed_pool`. Otherwise a new pool is
+            created and closed. If not given, only `thread` pools are reused, as a managed `process` pool only knows the
+            functions and global state that existed when its workers started.
+        :param shared_memory: with `process` backend, pass the numpy ``.tensor`` and ``.embedding`` of the batches to the
+            workers and back through shared memory instead of pickling them. Requires Python 3.8+.
 
         :yield: anything return from ``func``
         """
 
         if _is_lambda_or_partial_or_local_function(func) and backend == 'process':
             func = _globalize_lambda_function(func)
+            # the globalized function only exists in processes forked after this point
+            reuse_pool = False
 
         from rich.progress import track
 
-        if pool:
-            p = pool
-            ctx_p = nullcontext()
+        p, ctx_p = _get_pool_and_context(backend, num_worker, pool, reuse_pool)
+
+        batches = self.batch(batch_size=batch_size, shuffle=shuffle)
+        from multiprocessing.pool import ThreadPool
+
+        if shared_memory and not isinstance(p, ThreadPool):
+            results = _imap_shared_memory(
+                p, func, batches, 2 * (num_worker or os.cpu_count() or 1)
+            )
         else:
-            p = _get_pool(backend, num_worker)
-            ctx_p = p
+            results = p.imap(func, batches)
 
         with ctx_p:
             for x in track(
-                p.imap(func, self.batch(batch_size=batch_size, shuffle=shuffle)),
+                results,
                 total=ceil(len(self) / batch_size),
                 disable=not show_progress,
             ):
                 yield x
 
 
-def _get_pool(backend, num_worker):
+def _imap_shared_memory(pool, func, batches, max_in_flight: int):
+    from collections import deque
+    from functools import partial
+
+    # `pool.imap` would pack all batches into shared memory at once, so at most `max_in_flight` batches are submitted
+    # ahead of the one being collected. Results are collected in submission order
+    call = partial(_call_with_shared_memory, func)
+    pending = deque()
+    try:
+        for batch in batches:
+            packed, shm = _pack_arrays(batch)
+            pending.append((pool.apply_async(call, (packed,)), shm))
+            if len(pending) >= max_in_flight:
+                yield _collect_shared_memory(*pending.popleft())
+        while pending:
+            yield _collect_shared_memory(*pending.popleft())
+    finally:
+        # batches not collected because of an error or an early exit, the segments of their results are only known
+        # once they are done, and their errors are dropped in favour of the one being raised
+        for async_result, shm in pending:
+            try:
+                _collect_shared_memory(async_result, shm)
+            except Exception:
+                pass
+
+
+def _collect_shared_memory(async_result, shm):
+    try:
+        result = async_result.get()
+        if isinstance(result, _SharedBatch):
+            output_shm = _open_shared_memory(result.name)
+            result = _attach_arrays(result, shm, output_shm, copy=True)
+            _unlink_shared_memory(output_shm)
+        return result
+    finally:
+        _unlink_shared_memory(shm)
+
+
+def _open_shared_memory(name: Optional[str]):
+    if name:
+        from multiprocessing import shared_memory
+
+        return shared_memory.SharedMemory(name=name)
+
+
+def _untrack_shared_memory(shm):
+    # segments are owned and unlinked by the caller process, the resource tracker of a worker that was started before
+    # the one of the caller would unlink them when the worker exits
+    if shm is not None and _TRACKS_SHARED_MEMORY:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, 'shared_memory')
+
+
+def _unlink_shared_memory(shm):
+    if shm is None:
+        return
+    if _TRACKS_SHARED_MEMORY:
+        from multiprocessing import resource_tracker
+
+        # a worker sharing the resource tracker of the caller unregistered the segment there as well, so it is
+        # registered again for `unlink` to unregister
+        resource_tracker.register(shm._name, 'shared_memory')
+    shm.close()
+    shm.unlink()
+
+
+def _call_with_shared_memory(func, packed):
+    from docarray import DocumentArray
+
+    shm = _open_shared_memory(packed.name)
+    _untrack_shared_memory(shm)
+    da = _attach_arrays(packed, None, shm)
+    # results are written back at the location of the input arrays if they fit, arrays modified in place already are
+    slots = {
+        (i, f): (offset, getattr(da[i]._data, f))
+        for i, f, _, offset, _, _ in packed.descriptors
+    }
+    result = func(da)
+    if isinstance(result, DocumentArray):
+        result, output_shm = _pack_arrays(result, slots)
+        if output_shm is not None:
+            # the caller unlinks the segment once it is read
+            _untrack_shared_memory(output_shm)
+            output_shm.close()
+    del da, slots
+    if shm is not None:
+        try:
+            shm.close()
+        except BufferError:
+            # `func` still holds views of the segment, it is unmapped when they are released
+            pass
+    return result
+
+
+class _SharedBatch:
+    """A DocumentArray whose numpy arrays are passed through shared memory.
+
+    Each descriptor is a tuple ``(position, field, in_input, offset, shape, dtype)``, where ``in_input`` tells whether
+    the array is in the input segment of the batch or in the segment ``name``.
+    """
+
+    def __init__(self, da: 'DocumentArray', descriptors: list, name: Optional[str]):
+        self.da = da
+        self.descriptors = descriptors
+        self.name = name
+
+
+# fields that are passed through shared memory when they are numpy arrays
+_SHARED_FIELDS = ('tensor', 'embedding')
+# byte alignment of the arrays in a segment
+_SHARED_ALIGNMENT = 64
+# shared memory segments are registered with a resource tracker on POSIX only
+_TRACKS_SHARED_MEMORY = os.name == 'posix'
+
+
+def _pack_arrays(da: 'DocumentArray', slots: Optional[Dict] = None):
+    # move the numpy arrays of `da` into shared memory, `da` itself is not modified
+    from multiprocessing import shared_memory
+
+    import numpy as np
+
+    from docarray import Document, DocumentArray
+
+    slots = slots or {}
+    descriptors, to_copy, size = [], [], 0
+    packed = DocumentArray()
+    for i, d in enumerate(da):
+        copied = None
+        for f in _SHARED_FIELDS:
+            v = getattr(d._data, f)
+            if not isinstance(v, np.ndarray) or v.dtype.hasobject:
+                continue
+
+            offset, slot = slots.get((i, f), (None, None))
+            if slot is not None and slot.dtype == v.dtype and slot.size == v.size:
+                if v is not slot:
+                    slot[...] = v.reshape(slot.shape)
+                descriptors.append((i, f, True, offset, v.shape, v.dtype.str))
+            else:
+                size = -(-size // _SHARED_ALIGNMENT) * _SHARED_ALIGNMENT
+                to_copy.append((size, v))
+                descriptors.append((i, f, False, size, v.shape, v.dtype.str))
+                size += v.nbytes
+
+            if copied is None:
+                copied = Document()
+                copied.copy_from(d, shallow=True)
+            setattr(copied._data, f, None)
+        packed.append(copied or d)
+
+    shm = None
+    if to_copy:
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for offset, v in to_copy:
+            np.ndarray(v.shape, dtype=v.dtype, buffer=shm.buf, offset=offset)[...] = v
+
+    return _SharedBatch(packed, descriptors, shm.name if shm else None), shm
+
+
+def _attach_arrays(
+    packed: '_SharedBatch', input_shm, shm, copy: bool = False
+) -> 'DocumentArray':
+    # restore the arrays of a packed DocumentArray, as views of the segments or as copies
+    import numpy as np
+
+    for i, f, in_input, offset, shape, dtype in packed.descriptors:
+        v = np.ndarray(
+            shape,
+            dtype=dtype,
+            buffer=(input_shm if in_input else shm).buf,
+            offset=offset,
+        )
+        setattr(packed.da[i]._data, f, v.copy() if copy else v)
+    return packed.da
+
+
+def _get_pool_and_context(backend, num_worker, pool, reuse_pool):
+    if pool:
+        return pool, nullcontext()
+    if reuse_pool is None:
+        # threads see the current state of the caller, so a managed thread pool never runs stale code
+        reuse_pool = backend == 'thread'
+    if reuse_pool:
+        p = get_managed_pool(backend, num_worker)
+        if p is not None:
+            return p, nullcontext()
+    p = _get_pool(backend, num_worker)
+    return p, p
+
+
+def get_managed_pool(
+    backend: str = 'thread', num_worker: Optional[int] = None
+) -> Optional[Union['Pool', 'ThreadPool']]:
+    """Get the pool of ``backend`` and ``num_worker`` shared by all :class:`DocumentArray`, create it on first use.
+
+    Managed pools are kept alive until :func:`shutdown_managed_pools` is called or the interpreter exits. They must not
+    be closed by the caller.
+
+    :param backend: `thread` or `process`
+    :param num_worker: the number of workers. If not given, then the number of CPUs in the system will be used.
+    :return: the managed pool, or None when called from one of its own workers, as waiting on the pool from there
+        could deadlock.
+    """
+    global _MANAGED_POOLS_PID
+
+    num_worker = num_worker or os.cpu_count() or 1
+    key = (backend, num_worker)
+    if getattr(_managed_worker, 'key', None) == key:
+        return None
+
+    with _MANAGED_POOLS_LOCK:
+        if _MANAGED_POOLS_PID != os.getpid():
+            # pools inherited from a parent process are unusable
+            _MANAGED_POOLS.clear()
+            _MANAGED_POOLS_PID = os.getpid()
+
+        pool = _MANAGED_POOLS.get(key)
+        if pool is None:
+            pool = _MANAGED_POOLS[key] = _get_pool(
+                backend,
+                num_worker,
+                managed=True,
+                initializer=_init_managed_worker,
+                initargs=(key,),
+            )
+        return pool
+
+
+def warmup_managed_pool(
+    backend: str = 'thread', num_worker: Optional[int] = None
+) -> Optional[Union['Pool', 'ThreadPool']]:
+    """Create the managed pool of ``backend`` and ``num_worker`` and wait until all its workers are started.
+
+    Call it at the start of a service, so that the first requests do not pay for spawning processes.
+
+    :param backend: `thread` or `process`
+    :param num_worker: the number of workers. If not given, then the number of CPUs in the system will be used.
+    :return: the managed pool, or None when called from one of its own workers
+    """
+    pool = get_managed_pool(backend, num_worker)
+    if pool is None:
+        return None
+    pool.map(_noop, range(num_worker or os.cpu_count() or 1), chunksize=1)
+    return pool
+
+
+def shutdown_managed_pools() -> None:
+    """Terminate all managed pools, they are re-created on next use."""
+    with _MANAGED_POOLS_LOCK:
+        pools = list(_MANAGED_POOLS.values())
+        _MANAGED_POOLS.clear()
+    for pool in pools:
+        pool.terminate()
+
+
+def _init_managed_worker(key):
+    _managed_worker.key = key
+
+
+def _noop(_):
+    pass
+
+
+class _PickledTask:
+    """Wrap ``func`` so that a worker unpickles it inside the task.
+
+    A worker that cannot unpickle a task, e.g. because ``func`` was defined after the worker was forked, dies and
+    leaves the caller waiting forever for its result. Inside the task, the error is sent back to the caller instead.
+
+    Plain functions are pickled by reference, so they are pickled once in the caller and unpickled once per worker,
+    however often they are mapped. Other callables carry state that may change, they are pickled on every call.
+    """
+
+    def __init__(self, func: Callable):
+        self._is_function = isinstance(func, FunctionType)
+        if self._is_function:
+            payload = _PICKLED_FUNCTIONS.get(func)
+            if payload is None:
+                payload = _PICKLED_FUNCTIONS[func] = pickle.dumps(func)
+            self._payload = payload
+        else:
+            self._payload = pickle.dumps(func)
+        self._func = None
+
+    def __getstate__(self):
+        return self._payload, self._is_function
+
+    def __setstate__(self, state):
+        self._payload, self._is_function = state
+        self._func = None
+
+    def __call__(self, *args):
+        if self._func is None:
+            self._func = _unpickle_task(self._payload, self._is_function)
+        return self._func(*args)
+
+
+def _unpickle_task(payload: bytes, is_function: bool) -> Callable:
+    if not is_function:
+        return pickle.loads(payload)
+    func = _UNPICKLED_FUNCTIONS.get(payload)
+    if func is None:
+        if len(_UNPICKLED_FUNCTIONS) >= _MAX_UNPICKLED_FUNCTIONS:
+            _UNPICKLED_FUNCTIONS.clear()
+        func = _UNPICKLED_FUNCTIONS[payload] = pickle.loads(payload)
+    return func
+
+
+class _ManagedProcessPool(_ProcessPool):
+    """A process pool whose workers report tasks they cannot unpickle, see :class:`_PickledTask`."""
+
+    def apply_async(self, func, *args, **kwargs):
+        return super().apply_async(_PickledTask(func), *args, **kwargs)
+
+    def map_async(self, func, *args, **kwargs):
+        return super().map_async(_PickledTask(func), *args, **kwargs)
+
+    def map(self, func, *args, **kwargs):
+        return super().map(_PickledTask(func), *args, **kwargs)
+
+    def starmap(self, func, *args, **kwargs):
+        return super().starmap(_PickledTask(func), *args, **kwargs)
+
+    def imap(self, func, *args, **kwargs):
+        return super().imap(_PickledTask(func), *args, **kwargs)
+
+    def imap_unordered(self, func, *args, **kwargs):
+        return super().imap_unordered(_PickledTask(func), *args, **kwargs)
+
+
+def _get_pool(backend, num_worker, managed: bool = False, **kwargs):
     if backend == 'thread':
         from multiprocessing.pool import ThreadPool as Pool
 
-        return Pool(processes=num_worker)
+        return Pool(processes=num_worker, **kwargs)
     elif backend == 'process':
-        from multiprocessing.pool import Pool
-
-        return Pool(processes=num_worker)
+        Pool = _ManagedProcessPool if managed else _ProcessPool
+        return Pool(processes=num_worker, **kwargs)
     else:
         raise ValueError(
             f'`backend` must be either `process` or `thread`, receiving {backend}'
@@ -342,3 +732,6 @@ def _globalize_lambda_function(func):
     result.__name__ = result.__qualname__ = random_identity()
     setattr(sys.modules[result.__module__], result.__name__, result)
     return result
+
+
+atexit.register(shutdown_managed_pools)
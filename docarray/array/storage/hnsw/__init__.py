@@ -0,0 +1,12 @@
+from abc import ABC
+
+from docarray.array.storage.hnsw.backend import BackendMixin, HnswConfig
+from docarray.array.storage.hnsw.find import FindMixin
+from docarray.array.storage.hnsw.getsetdel import GetSetDelMixin
+from docarray.array.storage.hnsw.seqlike import SequenceLikeMixin
+
+__all__ = ['StorageMixins', 'HnswConfig']
+
+
+class StorageMixins(FindMixin, BackendMixin, GetSetDelMixin, SequenceLikeMixin, ABC):
+    ...
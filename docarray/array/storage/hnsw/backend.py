@@ -0,0 +1,179 @@
+import copy
+import json
+import os
+from dataclasses import dataclass
+from typing import (
+    Union,
+    Dict,
+    Optional,
+    TYPE_CHECKING,
+    Iterable,
+    List,
+)
+
+import numpy as np
+
+from docarray import Document
+from docarray.array.storage.base.backend import BaseBackendMixin
+from docarray.array.storage.hnsw.helper import HnswIndex
+from docarray.helper import dataclass_from_dict
+
+if TYPE_CHECKING:  # pragma: no cover
+    from docarray.typing import DocumentArraySourceType, ArrayType
+
+
+@dataclass
+class HnswConfig:
+    n_dim: int
+    metric: str = 'cosine'
+    data_path: Optional[str] = None
+    max_connection: int = 16
+    ef_construction: int = 100
+    ef_search: int = 50
+    random_seed: Optional[int] = None
+
+
+class BackendMixin(BaseBackendMixin):
+    """Provide necessary functions to enable this storage backend."""
+
+    _INDEX_FILE = 'index.npz'
+    _DOCS_FILE = 'docs.bin'
+    _LABELS_FILE = 'labels.json'
+
+    def _map_embedding(self, embedding: 'ArrayType') -> Optional['np.ndarray']:
+        if embedding is None:
+            return None
+        from docarray.math.ndarray import to_numpy_array
+
+        return np.asarray(to_numpy_array(embedding), dtype=np.float32).reshape(-1)
+
+    def _ensure_unique_config(
+        self,
+        config_root: dict,
+        config_subindex: dict,
+        config_joined: dict,
+        subindex_name: str,
+    ) -> dict:
+        if 'data_path' not in config_subindex and config_joined['data_path']:
+            config_joined['data_path'] = os.path.join(
+                config_joined['data_path'], 'subindex_' + subindex_name
+            )
+        return config_joined
+
+    def _init_storage(
+        self,
+        _docs: Optional['DocumentArraySourceType'] = None,
+        config: Optional[Union[HnswConfig, Dict]] = None,
+        subindex_configs: Optional[Dict] = None,
+        **kwargs,
+    ):
+        config = copy.deepcopy(config)
+        if not config:
+            raise ValueError('Config object must be specified')
+        elif isinstance(config, dict):
+            config = dataclass_from_dict(HnswConfig, config)
+
+        if config.data_path is None:
+            from tempfile import mkdtemp
+
+            config.data_path = mkdtemp()
+
+        self._config = config
+        self._docs = {}  # type: Dict[str, Document]
+        self._id2label = {}  # type: Dict[str, int]
+        self._label2id = []  # type: List[Optional[str]]
+        self._hnsw = self._new_index()
+        self._load()
+
+        super()._init_storage()
+
+        if _docs is None:
+            return
+
+        self.clear()
+
+        if isinstance(_docs, Iterable):
+            self.extend(_docs)
+        elif isinstance(_docs, Document):
+            self.append(_docs)
+
+    def _new_index(self) -> 'HnswIndex':
+        return HnswIndex(
+            self._config.n_dim,
+            metric=self._config.metric,
+            max_connection=self._config.max_connection,
+            ef_construction=self._config.ef_construction,
+            ef_search=self._config.ef_search,
+            random_seed=self._config.random_seed,
+        )
+
+    def _index_doc(self, doc: 'Document') -> None:
+        # keep a copy, so that modifying `doc` afterwards does not desync the graph
+        doc = Document(doc, copy=True)
+        embedding = self._map_embedding(doc.embedding)
+        if embedding is not None:
+            label = self._hnsw.add(embedding)
+            self._id2label[doc.id] = label
+            self._label2id.append(doc.id)
+        self._docs[doc.id] = doc
+
+    def _unindex_doc(self, _id: str) -> None:
+        del self._docs[_id]
+        label = self._id2label.pop(_id, None)
+        if label is not None:
+            self._hnsw.delete(label)
+            self._label2id[label] = None
+            # deleted nodes stay in the graph, rebuild it once they outnumber the others
+            if self._hnsw.size - len(self._hnsw) > len(self._hnsw):
+                self._compact()
+
+    def _compact(self) -> None:
+        labels = self._hnsw.compact()
+        self._label2id = [self._label2id[label] for label in labels.tolist()]
+        self._id2label = {_id: label for label, _id in enumerate(self._label2id)}
+
+    def _same_embedding(self, doc: 'Document', other: 'Document') -> bool:
+        embedding = self._map_embedding(doc.embedding)
+        other_embedding = self._map_embedding(other.embedding)
+        if embedding is None or other_embedding is None:
+            return embedding is None and other_embedding is None
+        return np.array_equal(embedding, other_embedding)
+
+    def _load(self) -> None:
+        """Load the Documents and the graph from ``data_path``, if they were saved there."""
+        data_path = self._config.data_path
+        if not data_path or not os.path.exists(
+            os.path.join(data_path, self._DOCS_FILE)
+        ):
+            return
+
+        from docarray import DocumentArray
+
+        docs = DocumentArray.load_binary(os.path.join(data_path, self._DOCS_FILE))
+        self._docs = {d.id: d for d in docs}
+        self._loaded_ids = [d.id for d in docs]
+
+        self._hnsw = HnswIndex.load(os.path.join(data_path, self._INDEX_FILE))
+        # `ef_search` is a query time parameter, it may differ from the saved one
+        self._hnsw.ef_search = self._config.ef_search
+        with open(os.path.join(data_path, self._LABELS_FILE)) as fp:
+            self._label2id = json.load(fp)
+        self._id2label = {
+            _id: label for label, _id in enumerate(self._label2id) if _id is not None
+        }
+
+    def _save(self) -> None:
+        """Save the Documents, in order, and the graph into ``data_path``."""
+        data_path = self._config.data_path
+        if not data_path:
+            return
+
+        from docarray import DocumentArray
+
+        os.makedirs(data_path, exist_ok=True)
+        DocumentArray(self._docs[_id] for _id in self._offset2ids).save_binary(
+            os.path.join(data_path, self._DOCS_FILE)
+        )
+        self._hnsw.save(os.path.join(data_path, self._INDEX_FILE))
+        with open(os.path.join(data_path, self._LABELS_FILE), 'w') as fp:
+            json.dump(self._label2id, fp)
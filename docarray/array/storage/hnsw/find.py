@@ -0,0 +1,62 @@
+from typing import (
+    Union,
+    Optional,
+    TYPE_CHECKING,
+    List,
+    Dict,
+)
+
+from docarray import Document, DocumentArray
+from docarray.math import ndarray
+from docarray.score import NamedScore
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+
+class FindMixin:
+    def _find(
+        self,
+        query: 'np.ndarray',
+        limit: Optional[Union[int, float]] = 20,
+        only_id: bool = False,
+        filter: Optional[Dict] = None,
+        ef: Optional[int] = None,
+        **kwargs,
+    ) -> List['DocumentArray']:
+        """Returns approximate nearest neighbors given a batch of input queries.
+
+        :param query: the query embeddings to search
+        :param limit: the number of results to get for each query document in search.
+        :param only_id: if set, then returning matches will only contain ``id``
+        :param filter: filter query used for pre-filtering, not supported by this backend
+        :param ef: the size of the dynamic candidate list, defaults to ``ef_search`` of the config.
+            Larger is more accurate but slower.
+        :param kwargs: other kwargs.
+
+        :return: a list of DocumentArrays containing the closest Document objects for each of the queries in `query`.
+        """
+        if filter is not None:
+            raise ValueError('Filtered vector search is not supported for HNSW backend')
+
+        n_rows, _ = ndarray.get_array_rows(query)
+        if n_rows == 1:
+            query = query.reshape(1, -1)
+
+        limit = len(self) if limit is None else int(limit)
+        metric = self._config.metric
+        results = []
+        for q in ndarray.to_numpy_array(query):
+            dists, labels = self._hnsw.search(q, limit, ef=ef)
+            matches = DocumentArray()
+            for dist, label in zip(dists.tolist(), labels.tolist()):
+                _id = self._label2id[label]
+                if only_id:
+                    d = Document(id=_id)
+                else:
+                    d = Document(self._docs[_id], copy=True)
+                    d.pop('matches')
+                d.scores[metric] = NamedScore(value=dist)
+                matches.append(d)
+            results.append(matches)
+        return results
@@ -0,0 +1,53 @@
+from typing import Iterable, Dict
+
+from docarray.array.storage.base.getsetdel import BaseGetSetDelMixin
+from docarray.array.storage.base.helper import Offset2ID
+from docarray import Document
+
+
+class GetSetDelMixin(BaseGetSetDelMixin):
+    """Implement required and derived functions that power `getitem`, `setitem`, `delitem`"""
+
+    # essential methods start
+
+    def _get_doc_by_id(self, _id: str) -> 'Document':
+        try:
+            return self._docs[_id]
+        except KeyError:
+            raise KeyError(f'Can not find Document with id=`{_id}`')
+
+    def _set_doc_by_id(self, _id: str, value: 'Document'):
+        if (
+            value.id == _id
+            and _id in self._docs
+            and self._same_embedding(self._docs[_id], value)
+        ):
+            # only other fields changed, the node is kept in the graph
+            self._docs[_id] = Document(value, copy=True)
+            return
+        if _id in self._docs:
+            self._unindex_doc(_id)
+        if value.id != _id and value.id in self._docs:
+            self._unindex_doc(value.id)
+        self._index_doc(value)
+
+    def _del_doc_by_id(self, _id: str):
+        if _id in self._docs:
+            self._unindex_doc(_id)
+
+    def _clear_storage(self):
+        self._docs = {}
+        self._id2label = {}
+        self._label2id = []
+        self._hnsw = self._new_index()
+
+    def _set_docs_by_ids(self, ids, docs: Iterable['Document'], mismatch_ids: Dict):
+        for _id, doc in zip(ids, docs):
+            self._set_doc_by_id(_id, doc)
+
+    def _load_offset2ids(self):
+        # ids in their saved order, set by `_load` when the array is restored from `data_path`
+        self._offset2ids = Offset2ID(self.__dict__.pop('_loaded_ids', []))
+
+    def _save_offset2ids(self):
+        self._save()
@@ -0,0 +1,440 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+SUPPORTED_METRICS = ('cosine', 'euclidean', 'sqeuclidean')
+
+# max number of candidates whose links are scored together when searching a layer
+_EXPAND_SIZE = 8
+
+
+class HnswIndex:
+    """A Hierarchical Navigable Small World graph over float32 vectors, implemented with numpy.
+
+    Vectors are identified by integer labels, assigned in insertion order. Deleting a vector only marks its label as
+    deleted: the node is still used to navigate the graph, but never returned by :meth:`search`, until :meth:`compact`
+    rebuilds the graph without it.
+
+    The graph follows `Malkov & Yashunin <https://arxiv.org/abs/1603.09320>`_: every node lives on layer 0 and on a
+    random number of upper layers, each node keeps at most ``max_connection`` links per upper layer and
+    ``2 * max_connection`` links on layer 0, and links are pruned with the neighbor selection heuristic.
+    """
+
+    def __init__(
+        self,
+        n_dim: int,
+        metric: str = 'cosine',
+        max_connection: int = 16,
+        ef_construction: int = 100,
+        ef_search: int = 50,
+        initial_capacity: int = 1024,
+        random_seed: Optional[int] = None,
+    ):
+        if metric not in SUPPORTED_METRICS:
+            raise ValueError(
+                f'metric `{metric}` is not supported, must be one of {SUPPORTED_METRICS}'
+            )
+        if max_connection < 2:
+            raise ValueError(
+                f'`max_connection` must be at least 2, receiving {max_connection}'
+            )
+
+        self.n_dim = n_dim
+        self.metric = metric
+        self.max_connection = max_connection
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self._level_mult = 1 / np.log(max_connection)
+        self._rng = np.random.default_rng(random_seed)
+
+        self._allocate(initial_capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        # an empty graph with room for ``capacity`` vectors
+        capacity = max(int(capacity), 1)
+        self._vectors = np.zeros((capacity, self.n_dim), dtype=np.float32)
+        self._levels = np.zeros(capacity, dtype=np.int32)
+        self._deleted = np.zeros(capacity, dtype=bool)
+        self._links0 = np.full((capacity, 2 * self.max_connection), -1, dtype=np.int32)
+        self._n_links0 = np.zeros(capacity, dtype=np.int32)
+        self._visited = np.zeros(capacity, dtype=np.int64)
+        self._epoch = 0
+        # links of upper layer `l` are stored in `self._upper_links[l - 1]`, keyed by label
+        self._upper_links = []  # type: List[Dict[int, np.ndarray]]
+
+        self._size = 0
+        self._n_deleted = 0
+        self._entry_point = -1
+        self._max_level = -1
+
+    def __len__(self):
+        """Return the number of vectors that are not deleted.
+
+        :return: number of searchable vectors
+        """
+        return self._size - self._n_deleted
+
+    @property
+    def size(self) -> int:
+        """Return the number of allocated labels, deleted ones included.
+
+        :return: number of labels
+        """
+        return self._size
+
+    def add(self, vector: 'np.ndarray') -> int:
+        """Insert a vector into the graph.
+
+        :param vector: a 1-D array of dimension ``n_dim``
+        :return: the label of the vector
+        """
+        vector = self._prepare(vector)
+
+        label = self._size
+        self._reserve(label + 1)
+        self._size += 1
+        self._vectors[label] = vector
+
+        level = int(-np.log(1.0 - self._rng.random()) * self._level_mult)
+        self._levels[label] = level
+        while len(self._upper_links) < level:
+            self._upper_links.append({})
+
+        if self._entry_point < 0:
+            self._entry_point, self._max_level = label, level
+            return label
+
+        entry_points = self._descend(vector, level)
+        for layer in range(min(level, self._max_level), -1, -1):
+            candidates = self._search_layer(
+                vector, entry_points, self.ef_construction, layer
+            )
+            neighbors = self._select_neighbors(candidates, self.max_connection)
+            self._set_links(label, layer, np.asarray(neighbors, dtype=np.int32))
+            for n in neighbors:
+                self._connect(n, label, layer)
+            entry_points = candidates
+
+        if level > self._max_level:
+            self._entry_point, self._max_level = label, level
+        return label
+
+    def delete(self, label: int) -> None:
+        """Mark a vector as deleted.
+
+        :param label: the label returned by :meth:`add`
+        """
+        if not self._deleted[label]:
+            self._deleted[label] = True
+            self._n_deleted += 1
+
+    def compact(self) -> 'np.ndarray':
+        """Rebuild the graph from the vectors that are not deleted, to free the space of the deleted ones.
+
+        :return: the former labels of the kept vectors, the new label of a vector is its position in this array
+        """
+        labels = np.flatnonzero(~self._deleted[: self._size])
+        vectors = self._vectors[labels]
+        self._allocate(len(labels))
+        for vector in vectors:
+            self.add(vector)
+        return labels
+
+    def search(
+        self, query: 'np.ndarray', limit: int, ef: Optional[int] = None
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Find the approximate nearest neighbors of a single query.
+
+        :param query: a 1-D array of dimension ``n_dim``
+        :param limit: the number of neighbors to return
+        :param ef: the size of the dynamic candidate list, defaults to ``ef_search``. Larger is more accurate but slower.
+        :return: distances and labels, sorted by distance
+        """
+        limit = min(limit, len(self))
+        if limit <= 0:
+            return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64)
+
+        query = self._prepare(query)
+        ef = max(ef or self.ef_search, limit)
+        entry_points = self._descend(query, 0)
+        while True:
+            candidates = self._search_layer(query, entry_points, ef, 0)
+            results = [(d, l) for d, l in candidates if not self._deleted[l]][:limit]
+            # deleted nodes may crowd the candidate list, widen it until enough live nodes are found
+            if len(results) >= limit or ef >= self._size:
+                break
+            ef *= 2
+
+        dists = np.array([d for d, _ in results], dtype=np.float32)
+        labels = np.array([l for _, l in results], dtype=np.int64)
+        # rounding errors can make the distance to an identical vector slightly negative
+        np.maximum(dists, 0, out=dists)
+        if self.metric == 'euclidean':
+            np.sqrt(dists, out=dists)
+        return dists, labels
+
+    def save(self, path: str) -> None:
+        """Save the graph into a ``.npz`` file.
+
+        :param path: the file path
+        """
+        keys, offsets, values = [], [0], []
+        for links in self._upper_links:
+            for label, neighbors in links.items():
+                keys.append(label)
+                values.append(neighbors)
+                offsets.append(offsets[-1] + len(neighbors))
+        n_keys = [len(links) for links in self._upper_links]
+
+        n = self._size
+        np.savez(
+            path,
+            params=np.array(
+                [
+                    self.n_dim,
+                    self.max_connection,
+                    self.ef_construction,
+                    self.ef_search,
+                    self._entry_point,
+                    self._max_level,
+                ],
+                dtype=np.int64,
+            ),
+            metric=np.array(self.metric),
+            vectors=self._vectors[:n],
+            levels=self._levels[:n],
+            deleted=self._deleted[:n],
+            links0=self._links0[:n],
+            n_links0=self._n_links0[:n],
+            upper_n_keys=np.array(n_keys, dtype=np.int64),
+            upper_keys=np.array(keys, dtype=np.int64),
+            upper_offsets=np.array(offsets, dtype=np.int64),
+            upper_values=np.concatenate(values)
+            if values
+            else np.empty(0, dtype=np.int32),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'HnswIndex':
+        """Load a graph saved by :meth:`save`.
+
+        :param path: the file path
+        :return: the loaded index
+        """
+        with np.load(path) as data:
+            (
+                n_dim,
+                max_connection,
+                ef_construction,
+                ef_search,
+                entry_point,
+                max_level,
+            ) = data['params'].tolist()
+            index = cls(
+                n_dim,
+                metric=str(data['metric']),
+                max_connection=max_connection,
+                ef_construction=ef_construction,
+                ef_search=ef_search,
+                initial_capacity=len(data['vectors']),
+            )
+            n = len(data['vectors'])
+            index._vectors[:n] = data['vectors']
+            index._levels[:n] = data['levels']
+            index._deleted[:n] = data['deleted']
+            index._links0[:n] = data['links0']
+            index._n_links0[:n] = data['n_links0']
+
+            keys, offsets, values = (
+                data['upper_keys'],
+                data['upper_offsets'],
+                data['upper_values'],
+            )
+            start = 0
+            for n_keys in data['upper_n_keys'].tolist():
+                links = {}
+                for i in range(start, start + n_keys):
+                    links[int(keys[i])] = values[offsets[i] : offsets[i + 1]].copy()
+                index._upper_links.append(links)
+                start += n_keys
+
+        index._size = n
+        index._n_deleted = int(index._deleted[:n].sum())
+        index._entry_point, index._max_level = entry_point, max_level
+        return index
+
+    def _prepare(self, vector: 'np.ndarray') -> 'np.ndarray':
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if vector.shape[0] != self.n_dim:
+            raise ValueError(
+                f'expected a vector of dimension {self.n_dim}, but got {vector.shape[0]}'
+            )
+        if self.metric == 'cosine':
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector = vector / norm
+        return vector
+
+    def _distances(self, vector: 'np.ndarray', labels: 'np.ndarray') -> 'np.ndarray':
+        # cosine works on normalized vectors, euclidean is computed squared and only rooted in `search`
+        vectors = self._vectors[labels]
+        if self.metric == 'cosine':
+            return 1 - vectors @ vector
+        diff = vectors - vector
+        return np.einsum('ij,ij->i', diff, diff)
+
+    def _pairwise_distances(self, labels: 'np.ndarray') -> 'np.ndarray':
+        vectors = self._vectors[labels]
+        dots = vectors @ vectors.T
+        if self.metric == 'cosine':
+            return 1 - dots
+        sq_norms = np.diag(dots)
+        return sq_norms[:, np.newaxis] + sq_norms - 2 * dots
+
+    def _links(self, label: int, layer: int) -> 'np.ndarray':
+        if layer == 0:
+            return self._links0[label, : self._n_links0[label]]
+        return self._upper_links[layer - 1].get(label, self._links0[label, :0])
+
+    def _set_links(self, label: int, layer: int, neighbors: 'np.ndarray') -> None:
+        if layer == 0:
+            self._links0[label, : len(neighbors)] = neighbors
+            self._n_links0[label] = len(neighbors)
+        else:
+            self._upper_links[layer - 1][label] = neighbors
+
+    def _connect(self, label: int, new: int, layer: int) -> None:
+        links = self._links(label, layer)
+        max_links = 2 * self.max_connection if layer == 0 else self.max_connection
+        if len(links) < max_links:
+            self._set_links(label, layer, np.append(links, np.int32(new)))
+            return
+
+        candidates = np.append(links, np.int32(new))
+        dists = self._distances(self._vectors[label], candidates)
+        order = np.argsort(dists)
+        neighbors = self._select_neighbors(
+            list(zip(dists[order].tolist(), candidates[order].tolist())), max_links
+        )
+        self._set_links(label, layer, np.asarray(neighbors, dtype=np.int32))
+
+    def _descend(self, vector: 'np.ndarray', level: int) -> List[Tuple[float, int]]:
+        # greedy search from the entry point down to `level + 1`, return the entry points for `level`
+        current = self._entry_point
+        dist = float(self._distances(vector, np.array([current]))[0])
+        for layer in range(self._max_level, level, -1):
+            changed = True
+            while changed:
+                changed = False
+                links = self._links(current, layer)
+                if len(links) == 0:
+                    break
+                dists = self._distances(vector, links)
+                i = int(np.argmin(dists))
+                if dists[i] < dist:
+                    current, dist, changed = int(links[i]), float(dists[i]), True
+        return [(dist, current)]
+
+    def _search_layer(
+        self,
+        vector: 'np.ndarray',
+        entry_points: List[Tuple[float, int]],
+        ef: int,
+        layer: int,
+    ) -> List[Tuple[float, int]]:
+        # nodes visited by this search are stamped with a new epoch, instead of allocating a mask per search
+        self._epoch += 1
+        epoch, visited = self._epoch, self._visited
+        for _, label in entry_points:
+            visited[label] = epoch
+
+        candidates = list(entry_points)
+        heapq.heapify(candidates)
+        results = [(-d, l) for d, l in entry_points]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        while candidates:
+            # expand the closest candidates together, so that their links are scored at once
+            expand = []
+            while candidates and len(expand) < _EXPAND_SIZE:
+                if len(results) >= ef and candidates[0][0] > -results[0][0]:
+                    break
+                expand.append(heapq.heappop(candidates)[1])
+            if not expand:
+                break
+
+            if layer == 0:
+                links = self._links0[expand].ravel()
+                links = links[links >= 0]
+            else:
+                links = np.concatenate([self._links(l, layer) for l in expand])
+            links = links[visited[links] != epoch]
+            if len(links) == 0:
+                continue
+            if len(expand) > 1:
+                links = np.unique(links)
+            visited[links] = epoch
+
+            dists = self._distances(vector, links)
+            if len(results) >= ef:
+                # only the neighbors closer than the furthest result can enter it
+                closer = dists < -results[0][0]
+                links, dists = links[closer], dists[closer]
+            for d, n in zip(dists.tolist(), links.tolist()):
+                if len(results) < ef:
+                    heapq.heappush(candidates, (d, n))
+                    heapq.heappush(results, (-d, n))
+                elif d < -results[0][0]:
+                    heapq.heappush(candidates, (d, n))
+                    heapq.heapreplace(results, (-d, n))
+
+        return sorted((-d, l) for d, l in results)
+
+    def _select_neighbors(
+        self, candidates: List[Tuple[float, int]], m: int
+    ) -> List[int]:
+        # candidates are sorted by distance, keep the ones closer to the base than to any already selected neighbor
+        if len(candidates) <= m:
+            return [l for _, l in candidates]
+
+        dists = np.array([d for d, _ in candidates], dtype=np.float32)
+        labels = np.array([l for _, l in candidates], dtype=np.int64)
+        pairwise = self._pairwise_distances(labels)
+        # candidates closer to an already selected neighbor than to the base
+        blocked = np.zeros(len(candidates), dtype=bool)
+        selected = []
+        for i in range(len(candidates)):
+            if blocked[i]:
+                continue
+            selected.append(i)
+            if len(selected) >= m:
+                break
+            blocked |= pairwise[i] < dists
+        return labels[selected].tolist()
+
+    def _reserve(self, size: int) -> None:
+        capacity = self._vectors.shape[0]
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+
+        n = self._size
+        vectors = np.zeros((capacity, self.n_dim), dtype=np.float32)
+        vectors[:n] = self._vectors[:n]
+        levels = np.zeros(capacity, dtype=np.int32)
+        levels[:n] = self._levels[:n]
+        deleted = np.zeros(capacity, dtype=bool)
+        deleted[:n] = self._deleted[:n]
+        links0 = np.full((capacity, self._links0.shape[1]), -1, dtype=np.int32)
+        links0[:n] = self._links0[:n]
+        n_links0 = np.zeros(capacity, dtype=np.int32)
+        n_links0[:n] = self._n_links0[:n]
+
+        self._vectors, self._levels, self._deleted = vectors, levels, deleted
+        self._links0, self._n_links0 = links0, n_links0
+        self._visited = np.zeros(capacity, dtype=np.int64)
+        self._epoch = 0
@@ -0,0 +1,34 @@
+from typing import Union, Iterable
+
+from docarray.array.storage.base.seqlike import BaseSequenceLikeMixin
+from docarray import Document
+
+
+class SequenceLikeMixin(BaseSequenceLikeMixin):
+    """Implement sequence-like methods"""
+
+    def _extend(self, values: Iterable['Document'], **kwargs) -> None:
+        ids = []
+        for doc in values:
+            self._set_doc_by_id(doc.id, doc)
+            ids.append(doc.id)
+        self._offset2ids.extend(ids)
+
+    def __eq__(self, other):
+        return (
+            type(self) is type(other)
+            and self._config == other._config
+            and self._offset2ids == other._offset2ids
+            and all(self._docs[_id] == other._docs[_id] for _id in self._offset2ids)
+        )
+
+    def __repr__(self):
+        return f'<DocumentArray[HNSW] (length={len(self)}) at {id(self)}>'
+
+    def __contains__(self, x: Union[str, 'Document']):
+        if isinstance(x, str):
+            return x in self._docs
+        elif isinstance(x, Document):
+            return x.id in self._docs
+        else:
+            return False
@@ -1,11 +1,11 @@
 from abc import ABC
 
-from docarray.array.storage.memory.backend import BackendMixin
+from docarray.array.storage.memory.backend import BackendMixin, MemoryConfig
 from docarray.array.storage.memory.find import FindMixin
 from docarray.array.storage.memory.getsetdel import GetSetDelMixin
 from docarray.array.storage.memory.seqlike import SequenceLikeMixin
 
-__all__ = ['StorageMixins']
+__all__ = ['StorageMixins', 'MemoryConfig']
 
 
 class StorageMixins(FindMixin, BackendMixin, GetSetDelMixin, SequenceLikeMixin, ABC):
@@ -1,18 +1,29 @@
+import copy as cp
 import functools
+from dataclasses import dataclass
 from typing import (
     Optional,
     TYPE_CHECKING,
     Iterable,
     Callable,
     Dict,
+    Union,
 )
 
+from docarray.array.mixins.content import ContentPropertyMixin
 from docarray.array.storage.base.backend import BaseBackendMixin
+from docarray.array.storage.memory.helper import (
+    ColumnarEmbeddings,
+    EmbeddingsCache,
+    EmbeddingsChangeLog,
+)
+from docarray.helper import dataclass_from_dict
 from docarray import Document
 
 if TYPE_CHECKING:  # pragma: no cover
     from docarray.typing import (
         DocumentArraySourceType,
+        ArrayType,
     )
 
 
@@ -27,6 +38,12 @@ def needs_id2offset_rebuild(func) -> Callable:
     return wrapper
 
 
+@dataclass
+class MemoryConfig:
+    columnar_embeddings: bool = False
+    initial_capacity: int = 1024
+
+
 class BackendMixin(BaseBackendMixin):
     """Provide necessary functions to enable this storage backend."""
 
@@ -58,11 +75,30 @@ class BackendMixin(BaseBackendMixin):
         self,
         _docs: Optional['DocumentArraySourceType'] = None,
         copy: bool = False,
+        config: Optional[Union[MemoryConfig, Dict]] = None,
         *args,
         **kwargs
     ):
         from docarray.array.memory import DocumentArrayInMemory
 
+        config = cp.deepcopy(config)
+        if not config:
+            config = MemoryConfig()
+        elif isinstance(config, dict):
+            # the in-memory backend has always ignored configs meant for other backends
+            config = dataclass_from_dict(
+                MemoryConfig,
+                {k: v for k, v in config.items() if k in MemoryConfig.__annotations__},
+            )
+
+        self._config = config
+        self._embedding_store = (
+            ColumnarEmbeddings(config.initial_capacity)
+            if config.columnar_embeddings
+            else None
+        )
+        self._embeddings_changes = EmbeddingsChangeLog()
+
         super()._init_storage(_docs, copy=copy, *args, **kwargs)
 
         self._data = []
@@ -75,10 +111,19 @@ class BackendMixin(BaseBackendMixin):
         ):
             if copy:
                 self._data = [Document(d, copy=True) for d in _docs]
+                if self._embedding_store is not None:
+                    self._embedding_store.rebuild(self._data)
             elif isinstance(_docs, DocumentArrayInMemory):
+                # both arrays see the same Documents, so they also share what is derived from them
                 self._data = _docs._data
                 self._id_to_index = _docs._id2offset
                 self._needs_id2offset_rebuild = _docs._needs_id2offset_rebuild
+                self._embeddings_changes = _docs._embeddings_changes
+                if self._embedding_store is not None:
+                    if _docs._embedding_store is not None:
+                        self._embedding_store = _docs._embedding_store
+                    else:
+                        self._embedding_store.rebuild(self._data)
             else:
                 self.extend(_docs)
         else:
@@ -96,3 +141,57 @@ class BackendMixin(BaseBackendMixin):
         subindex_name: str,
     ) -> dict:
         return config_joined
+
+    @property
+    def embeddings(self) -> Optional['ArrayType']:
+        """Return a :class:`ArrayType` stacking all the `embedding` attributes as rows.
+
+        With ``columnar_embeddings`` enabled, this returns the contiguous embedding buffer itself without copying.
+
+        :return: a :class:`ArrayType` of embedding
+        """
+        store = self._embedding_store
+        if store is not None and self:
+            store.sync(self._data)
+            if store.is_complete:
+                return store.matrix
+        return ContentPropertyMixin.embeddings.fget(self)
+
+    @embeddings.setter
+    def embeddings(self, value: 'ArrayType'):
+        """Set the :attr:`.embedding` of the Documents.
+
+        :param value: The embedding matrix to set
+        """
+        ContentPropertyMixin.embeddings.fset(self, value)
+        self._bump_embeddings_version()
+
+    def _bump_embeddings_version(self, ids: Optional[Iterable[str]] = None) -> None:
+        # any change that may affect `.embeddings`, with ``ids`` only the Documents of these ids were touched
+        self._embeddings_changes.record(ids)
+
+    def _get_embeddings_cache(self, stack: bool = True) -> Optional['EmbeddingsCache']:
+        """Return the stacked :attr:`embeddings` together with their row norms.
+
+        The matrix is only stacked again if the array changed since the last call, so that repeated :meth:`find` calls
+        against an unchanged array pay the stacking cost once. With ``columnar_embeddings`` enabled, the matrix is the
+        embedding buffer itself, so nothing is stacked.
+
+        :param stack: if not set, return None instead of stacking the embeddings again
+        :return: an :class:`EmbeddingsCache`
+        """
+        version = self._embeddings_changes.version
+        refs = [d._data.embedding for d in self._data]
+        cache = getattr(self, '_embeddings_cache', None)
+        if cache is None or not cache.is_valid(version, refs):
+            if not stack:
+                store = self._embedding_store
+                if store is None:
+                    return None
+                store.sync(self._data)
+                if not store.is_complete:
+                    return None
+            cache = self._embeddings_cache = EmbeddingsCache(
+                version, refs, self.embeddings
+            )
+        return cache
@@ -1,9 +1,34 @@
-from typing import Optional, Union, Tuple, Callable, TYPE_CHECKING, Dict
+import os
+from itertools import chain
+from typing import (
+    Optional,
+    Union,
+    Tuple,
+    Callable,
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+)
 
 import numpy as np
 
+from docarray.array.mixins.parallel import get_managed_pool
+from docarray.array.storage.memory.helper import (
+    CodeRows,
+    QuantizedCodes,
+)
 from docarray.math import ndarray
+from docarray.math.distance.numpy import row_norms
 from docarray.math.helper import top_k, minmax_normalize, update_rows_x_mat_best
+from docarray.math.ivfpq import IVFPQIndex
+from docarray.math.quantization import int8_scales
+
+QUANTIZATIONS = ('int8', 'binary')
+# the maximum number of distances computed at once when re-ranking candidates
+_RERANK_MAX_DISTANCES = 1 << 22
 
 if TYPE_CHECKING:  # pragma: no cover
     from docarray.typing import T, ArrayType
@@ -14,6 +39,167 @@ if TYPE_CHECKING:  # pragma: no cover
 class FindMixin:
     """A mixin that provides find functionality to DocumentArrays"""
 
+    def train_ivfpq(
+        self,
+        n_clusters: int = 256,
+        n_subvectors: int = 8,
+        n_bits: int = 8,
+        metric: str = 'cosine',
+        sample_size: int = 100_000,
+        n_iter: int = 20,
+        random_seed: Optional[int] = None,
+        batch_size: int = 10_000,
+    ) -> None:
+        """Train an IVF-PQ index on a sample of the embeddings and encode all of them.
+
+        Once trained, ``.find(..., nprobe=...)`` only scans the compressed codes of the ``nprobe`` closest inverted
+        lists and re-ranks the best candidates with the exact embeddings. Only the Documents added, removed or whose
+        embedding was replaced afterwards are encoded on next search, with the same centroids and codebooks.
+
+        :param n_clusters: the number of coarse centroids, i.e. inverted lists
+        :param n_subvectors: the number of bytes each embedding is compressed to, must divide the embedding dimension
+        :param n_bits: the number of bits of each sub-vector code, at most 8
+        :param metric: the distance metric, one of `cosine`, `euclidean` or `sqeuclidean`
+        :param sample_size: the maximum number of embeddings used for training
+        :param n_iter: the number of k-means iterations
+        :param random_seed: the seed used to sample the training set and initialize k-means
+        :param batch_size: the number of embeddings loaded at once when encoding
+        """
+        if not len(self):
+            raise ValueError('can not train an IVF-PQ index on an empty DocumentArray')
+
+        rng = np.random.default_rng(random_seed)
+        n_samples = min(sample_size, len(self))
+        offsets = np.sort(rng.choice(len(self), n_samples, replace=False))
+        sample = self._get_embeddings_by_offsets(offsets)
+
+        index = IVFPQIndex(
+            n_dim=sample.shape[1],
+            n_clusters=n_clusters,
+            n_subvectors=n_subvectors,
+            n_bits=n_bits,
+            metric=metric,
+        )
+        index.train(sample, n_iter=n_iter, random_seed=random_seed)
+        self._ivfpq = index
+        self._ivfpq_batch_size = batch_size
+        self._ivfpq_version = None
+        self._sync_ivfpq()
+
+    def _get_embeddings_by_offsets(self, offsets: 'np.ndarray') -> 'np.ndarray':
+        embeddings = self[offsets.tolist()].embeddings
+        if embeddings is None:
+            raise ValueError('IVF-PQ requires all Documents to have an embedding')
+        return ndarray.to_numpy_array(embeddings)
+
+    def _iter_embeddings(
+        self, batch_size: int
+    ) -> Iterator[Tuple[List[str], 'np.ndarray']]:
+        # the ids and embeddings of all Documents with an embedding, ``batch_size`` at a time
+        for start in range(0, len(self), batch_size):
+            docs = [
+                d
+                for d in self._data[start : start + batch_size]
+                if d.embedding is not None
+            ]
+            if docs:
+                yield [d.id for d in docs], np.stack(
+                    [ndarray.to_numpy_array(d.embedding) for d in docs]
+                )
+
+    def _get_embeddings_by_ids(
+        self, ids: Sequence[str]
+    ) -> Tuple[List[str], Optional['np.ndarray']]:
+        # the embeddings of the ids that are in the array and have one, in the order of ``ids``. The rows are gathered
+        # from the stacked embeddings if they are up to date, and only the Documents of ``ids`` are stacked otherwise
+        id2offset = self._id2offset
+        cache = self._get_embeddings_cache(stack=False)
+        if cache is not None and isinstance(cache.matrix, np.ndarray):
+            ids = [_id for _id in ids if _id in id2offset]
+            if not ids:
+                return [], None
+            return ids, cache.matrix[[id2offset[_id] for _id in ids]]
+        docs = [self._data[id2offset[_id]] for _id in ids if _id in id2offset]
+        docs = [d for d in docs if d.embedding is not None]
+        if not docs:
+            return [], None
+        return [d.id for d in docs], np.stack(
+            [ndarray.to_numpy_array(d.embedding) for d in docs]
+        )
+
+    def _get_offsets_by_ids(self, ids: Sequence[str]) -> List[int]:
+        return [self._id2offset[_id] for _id in ids]
+
+    def _sync_ivfpq(self) -> None:
+        # the labels of the index are rows of `_ivfpq_rows`, only the Documents touched since last sync are re-encoded
+        changes = self._embeddings_changes
+        index, batch_size = self._ivfpq, self._ivfpq_batch_size
+        touched = (
+            None if self._ivfpq_version is None else changes.since(self._ivfpq_version)
+        )
+
+        if touched is None:
+            index.reset()
+            rows = self._ivfpq_rows = CodeRows()
+            for ids, embeddings in self._iter_embeddings(batch_size):
+                index.add(embeddings, rows.assign(ids))
+        elif touched:
+            rows = self._ivfpq_rows
+            index.remove(rows.remove(touched))
+            for start in range(0, len(touched), batch_size):
+                ids, embeddings = self._get_embeddings_by_ids(
+                    touched[start : start + batch_size]
+                )
+                if ids:
+                    index.add(embeddings, rows.assign(ids))
+        self._ivfpq_version = changes.version
+        self._discard_embeddings_changes()
+
+    def _get_quantized_codes(
+        self, quantization: str, batch_size: int = 10_000
+    ) -> 'QuantizedCodes':
+        # codes are built on first use, then only the Documents touched since are re-encoded
+        quantized = getattr(self, '_quantized', None)
+        if quantized is None:
+            quantized = self._quantized = {}
+        changes = self._embeddings_changes
+        codes = quantized.get(quantization)
+        touched = None if codes is None else changes.since(codes.version)
+
+        if touched is None:
+            scales = None
+            if quantization == 'int8':
+                # the scales must be known before encoding the first batch
+                maxima = [
+                    np.max(np.abs(embeddings), axis=0)
+                    for _, embeddings in self._iter_embeddings(batch_size)
+                ]
+                if maxima:
+                    scales = int8_scales(np.stack(maxima))
+            codes = quantized[quantization] = QuantizedCodes(quantization, scales)
+            for ids, embeddings in self._iter_embeddings(batch_size):
+                codes.add(ids, embeddings)
+        elif touched:
+            codes.remove(touched)
+            for start in range(0, len(touched), batch_size):
+                ids, embeddings = self._get_embeddings_by_ids(
+                    touched[start : start + batch_size]
+                )
+                if ids:
+                    codes.add(ids, embeddings)
+        codes.version = changes.version
+        self._discard_embeddings_changes()
+        return codes
+
+    def _discard_embeddings_changes(self) -> None:
+        # all codes are up to date, touched ids only need to be recorded from now on
+        changes = self._embeddings_changes
+        changes.tracking = True
+        versions = [c.version for c in getattr(self, '_quantized', {}).values()]
+        if getattr(self, '_ivfpq', None) is not None:
+            versions.append(self._ivfpq_version)
+        changes.discard(min(versions))
+
     def _find(
         self: 'T',
         query: 'ArrayType',
@@ -28,6 +214,10 @@ class FindMixin:
         device: str = 'cpu',
         num_worker: Optional[int] = 1,
         filter: Optional[Dict] = None,
+        memory_budget: Optional[int] = None,
+        nprobe: Optional[int] = None,
+        n_candidates: Optional[int] = None,
+        quantization: Optional[str] = None,
         **kwargs,
     ) -> Tuple['np.ndarray', 'np.ndarray']:
         """Returns approximate nearest neighbors given a batch of input queries.
@@ -47,8 +237,20 @@ class FindMixin:
         :param num_worker: the number of parallel workers. If not given, then the number of CPUs in the system will be used.
 
                 .. note::
-                    This argument is only effective when ``batch_size`` is set.
+                    When ``batch_size`` is not set, the embeddings are split once into ``num_worker`` contiguous
+                    shards searched in parallel by the managed thread pool of ``num_worker`` threads, see
+                    :func:`get_managed_pool`. Sparse embeddings are not split. Ignored when ``memory_budget`` is set.
         :param filter: filter query used for pre-filtering
+        :param memory_budget: if provided, the maximum size in bytes of the distance matrix computed at once. Both the
+            queries and ``self.embeddings`` are then split into tiles that fit into this budget, and the top matches are
+            merged tile by tile. Ignored when ``batch_size`` is set.
+        :param nprobe: if provided, search the IVF-PQ index built by :meth:`train_ivfpq`, scanning the ``nprobe``
+            closest inverted lists. Takes precedence over ``batch_size`` and ``memory_budget``.
+        :param n_candidates: the number of IVF-PQ or quantized candidates re-ranked with the exact embeddings, defaults
+            to ``4 * limit``. Only effective when ``nprobe`` or ``quantization`` is set.
+        :param quantization: if provided, either `int8` or `binary`. Candidates are then found by scanning compressed
+            codes of the embeddings, int8 scalar-quantized or sign bits, and re-ranked with the exact embeddings. The
+            codes are built on first use. Takes precedence over ``batch_size`` and ``memory_budget``.
         :param kwargs: other kwargs.
 
         :return: a list of DocumentArrays containing the closest Document objects for each of the queries in `query`.
@@ -75,7 +277,7 @@ class FindMixin:
             else:
                 from docarray.math.distance import cdist as _cdist
 
-                cdist = lambda *x: _cdist(*x, device=device)
+                cdist = lambda *x, **k: _cdist(*x, device=device, **k)
         else:
             raise TypeError(
                 f'metric must be either string or a 2-arity function, received: {metric!r}'
@@ -83,15 +285,98 @@ class FindMixin:
 
         metric_name = metric_name or (metric.__name__ if callable(metric) else metric)
 
-        if batch_size:
+        use_norms = metric in ('cosine', 'sqeuclidean', 'euclidean') and not use_scipy
+
+        if nprobe is not None:
+            index = getattr(self, '_ivfpq', None)
+            if index is None:
+                raise ValueError(
+                    '`nprobe` requires an IVF-PQ index, call `.train_ivfpq()` first'
+                )
+            if metric != index.metric:
+                raise ValueError(
+                    f'the IVF-PQ index was trained for metric `{index.metric}`, receiving {metric!r}'
+                )
+            if nprobe <= 0:
+                raise ValueError(f'`nprobe` must be larger than 0, receiving {nprobe}')
+            return self._find_nn_ivfpq(
+                query,
+                cdist,
+                limit,
+                normalization,
+                metric_name,
+                int(nprobe),
+                n_candidates or 4 * limit,
+            )
+        elif quantization is not None:
+            if quantization not in QUANTIZATIONS:
+                raise ValueError(
+                    f'`quantization` must be one of {QUANTIZATIONS}, receiving {quantization!r}'
+                )
+            if quantization == 'int8' and metric not in (
+                'cosine',
+                'sqeuclidean',
+                'euclidean',
+            ):
+                raise ValueError(
+                    f'int8 quantization does not support metric {metric!r}'
+                )
+            return self._find_nn_quantized(
+                query,
+                cdist,
+                limit,
+                normalization,
+                metric_name,
+                metric if quantization == 'int8' else None,
+                quantization,
+                n_candidates or 4 * limit,
+            )
+        elif batch_size:
             return self._find_nn_online(
                 query, cdist, limit, normalization, metric_name, batch_size, num_worker
             )
+        elif memory_budget is not None:
+            if memory_budget <= 0:
+                raise ValueError(
+                    f'`memory_budget` must be larger than 0, receiving {memory_budget}'
+                )
+            return self._find_nn_tiled(
+                query,
+                cdist,
+                limit,
+                normalization,
+                metric_name,
+                int(memory_budget),
+                use_norms=use_norms,
+            )
+        elif num_worker is None or num_worker > 1:
+            return self._find_nn_sharded(
+                query,
+                cdist,
+                limit,
+                normalization,
+                metric_name,
+                num_worker or os.cpu_count() or 1,
+                use_norms=use_norms,
+            )
         else:
-            return self._find_nn(query, cdist, limit, normalization, metric_name)
+            return self._find_nn(
+                query,
+                cdist,
+                limit,
+                normalization,
+                metric_name,
+                use_norms=use_norms,
+            )
 
     def _find_nn(
-        self, query: 'ArrayType', cdist, limit, normalization, metric_name
+        self,
+        query: 'ArrayType',
+        cdist,
+        limit,
+        normalization,
+        metric_name,
+        use_norms: bool = False,
     ) -> Tuple['np.ndarray', 'np.ndarray']:
         """
         :param query: the query embeddings to search by.
@@ -102,10 +387,19 @@ class FindMixin:
                                 the min distance will be rescaled to `a`, the max distance will be rescaled to `b`
                                 all values will be rescaled into range `[a, b]`.
         :param metric_name: if provided, then match result will be marked with this string.
+        :param use_norms: if set, pass the cached row norms of the embeddings to `cdist` as ``y_norm``
         :return: distances and indices
         """
 
-        dists = cdist(query, self.embeddings, metric_name)
+        get_cache = getattr(self, '_get_embeddings_cache', None)
+        if get_cache is None:
+            dists = cdist(query, self.embeddings, metric_name)
+        else:
+            cache = get_cache()
+            if use_norms and cache.norms is not None:
+                dists = cdist(query, cache.matrix, metric_name, y_norm=cache.norms)
+            else:
+                dists = cdist(query, cache.matrix, metric_name)
         dist, idx = top_k(dists, min(limit, len(self)), descending=False)
         if isinstance(normalization, (tuple, list)) and normalization is not None:
             # normalization bound uses original distance not the top-k trimmed distance
@@ -115,6 +409,329 @@ class FindMixin:
 
         return dist, idx
 
+    def _find_nn_sharded(
+        self,
+        query: 'ArrayType',
+        cdist,
+        limit,
+        normalization,
+        metric_name,
+        num_worker: int,
+        use_norms: bool = False,
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        :param query: the query embeddings to search by.
+        :param cdist: the distance metric
+        :param limit: the maximum number of matches, when not given
+                      all Documents in `darray` are considered as matches
+        :param normalization: a tuple [a, b] to be used with min-max normalization,
+                                the min distance will be rescaled to `a`, the max distance will be rescaled to `b`
+                                all values will be rescaled into range `[a, b]`.
+        :param metric_name: if provided, then match result will be marked with this string.
+        :param num_worker: the number of shards, each of them searched by one thread
+        :param use_norms: if set, pass the cached row norms of the embeddings to `cdist`
+        :return: distances and indices
+        """
+        get_cache = getattr(self, '_get_embeddings_cache', None)
+        # shards are views of the embeddings split once per cache, nothing is copied
+        shards = (
+            None if get_cache is None else get_cache().shards(num_worker, use_norms)
+        )
+        if shards is None:
+            return self._find_nn(
+                query, cdist, limit, normalization, metric_name, use_norms=use_norms
+            )
+
+        limit = min(limit, len(self))
+
+        def _search_shard(shard):
+            start, end, rows, norms = shard
+            if norms is not None:
+                dists = cdist(query, rows, metric_name, y_norm=norms)
+            else:
+                dists = cdist(query, rows, metric_name)
+            shard_dists, shard_inds = top_k(
+                dists, min(limit, end - start), descending=False
+            )
+            return (
+                shard_dists,
+                shard_inds + start,
+                np.min(dists, axis=-1, keepdims=True),
+                np.max(dists, axis=-1, keepdims=True),
+            )
+
+        pool = get_managed_pool('thread', num_worker)
+        if pool is None:
+            # already running in a worker of that pool, e.g. `find` inside `.map()`
+            results = list(map(_search_shard, shards))
+        else:
+            results = pool.map(_search_shard, shards)
+
+        all_dists = np.concatenate([r[0] for r in results], axis=1)
+        all_inds = np.concatenate([r[1] for r in results], axis=1)
+        dist, top = top_k(all_dists, limit, descending=False)
+        idx = np.take_along_axis(all_inds, top, axis=1)
+
+        if isinstance(normalization, (tuple, list)) and normalization is not None:
+            # normalization bound uses original distance not the top-k trimmed distance
+            min_d = np.min(np.concatenate([r[2] for r in results], axis=1), axis=1)
+            max_d = np.max(np.concatenate([r[3] for r in results], axis=1), axis=1)
+            dist = minmax_normalize(
+                dist, normalization, (min_d[:, None], max_d[:, None])
+            )
+
+        return dist, idx
+
+    def _find_nn_tiled(
+        self,
+        query: 'ArrayType',
+        cdist,
+        limit,
+        normalization,
+        metric_name,
+        memory_budget: int,
+        use_norms: bool = False,
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        :param query: the query embeddings to search by.
+        :param cdist: the distance metric
+        :param limit: the maximum number of matches, when not given
+                      all Documents in `darray` are considered as matches
+        :param normalization: a tuple [a, b] to be used with min-max normalization,
+                                the min distance will be rescaled to `a`, the max distance will be rescaled to `b`
+                                all values will be rescaled into range `[a, b]`.
+        :param metric_name: if provided, then match result will be marked with this string.
+        :param memory_budget: the maximum size in bytes of a distance tile
+        :param use_norms: if set, pass the cached row norms of the embeddings to `cdist`
+        :return: distances and indices
+        """
+        n_q, _ = ndarray.get_array_rows(query)
+        n_index = len(self)
+        if not n_index:
+            return np.empty((n_q, 0)), np.empty((n_q, 0), dtype=int)
+
+        get_cache = getattr(self, '_get_embeddings_cache', None)
+        if get_cache is None:
+            embeddings, norms = self.embeddings, None
+        else:
+            cache = get_cache()
+            embeddings, norms = cache.matrix, cache.norms if use_norms else None
+        if norms is not None:
+            # the embeddings are a dense numpy matrix, the numpy kernels need a numpy query too
+            query = ndarray.to_numpy_array(query)
+
+        limit = min(limit, n_index)
+
+        # the dense numpy kernels write into a reused tile buffer, other frameworks allocate their own result
+        itemsize = (
+            np.result_type(query.dtype, embeddings.dtype, np.float32).itemsize
+            if norms is not None
+            else np.dtype(np.float64).itemsize
+        )
+        n_elements = max(1, memory_budget // itemsize)
+        q_tile = min(n_q, max(1, n_elements // n_index))
+        i_tile = min(n_index, max(1, n_elements // q_tile))
+
+        if norms is not None:
+            q_norms = row_norms(query)
+            buffer = np.empty(
+                q_tile * i_tile,
+                dtype=np.result_type(query.dtype, embeddings.dtype, np.float32),
+            )
+
+        dist = np.empty((n_q, limit))
+        idx = np.empty((n_q, limit), dtype=int)
+        if isinstance(normalization, (tuple, list)) and normalization is not None:
+            min_d = np.full((n_q, 1), np.inf)
+            max_d = np.full((n_q, 1), -np.inf)
+        else:
+            min_d = max_d = None
+
+        for q_start in range(0, n_q, q_tile):
+            q_end = min(q_start + q_tile, n_q)
+            top_dists = np.full((q_end - q_start, limit), np.inf)
+            top_inds = np.zeros((q_end - q_start, limit), dtype=int)
+
+            for i_start in range(0, n_index, i_tile):
+                i_end = min(i_start + i_tile, n_index)
+                if norms is not None:
+                    dists = cdist(
+                        query[q_start:q_end],
+                        embeddings[i_start:i_end],
+                        metric_name,
+                        x_norm=q_norms[q_start:q_end],
+                        y_norm=norms[i_start:i_end],
+                        out=buffer[: (q_end - q_start) * (i_end - i_start)].reshape(
+                            q_end - q_start, i_end - i_start
+                        ),
+                    )
+                else:
+                    dists = cdist(
+                        query[q_start:q_end], embeddings[i_start:i_end], metric_name
+                    )
+
+                if min_d is not None:
+                    np.minimum(
+                        min_d[q_start:q_end],
+                        np.min(dists, axis=-1, keepdims=True),
+                        out=min_d[q_start:q_end],
+                    )
+                    np.maximum(
+                        max_d[q_start:q_end],
+                        np.max(dists, axis=-1, keepdims=True),
+                        out=max_d[q_start:q_end],
+                    )
+
+                tile_dists, tile_inds = top_k(
+                    dists, min(limit, i_end - i_start), descending=False
+                )
+                top_dists, top_inds = update_rows_x_mat_best(
+                    top_dists, top_inds, tile_dists, tile_inds + i_start, limit
+                )
+
+            permutation = np.argsort(top_dists, axis=1)
+            dist[q_start:q_end] = np.take_along_axis(top_dists, permutation, axis=1)
+            idx[q_start:q_end] = np.take_along_axis(top_inds, permutation, axis=1)
+
+        if min_d is not None:
+            # normalization bound uses original distance not the top-k trimmed distance
+            dist = minmax_normalize(dist, normalization, (min_d, max_d))
+
+        return dist, idx
+
+    def _find_nn_ivfpq(
+        self,
+        query: 'ArrayType',
+        cdist,
+        limit,
+        normalization,
+        metric_name,
+        nprobe: int,
+        n_candidates: int,
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        :param query: the query embeddings to search by.
+        :param cdist: the distance metric
+        :param limit: the maximum number of matches, when not given
+                      all Documents in `darray` are considered as matches
+        :param normalization: a tuple [a, b] to be used with min-max normalization,
+                                the min distance will be rescaled to `a`, the max distance will be rescaled to `b`
+                                all values will be rescaled into range `[a, b]`.
+        :param metric_name: if provided, then match result will be marked with this string.
+        :param nprobe: the number of inverted lists to scan
+        :param n_candidates: the number of candidates re-ranked with the exact embeddings
+        :return: distances and indices
+        """
+        self._sync_ivfpq()
+
+        query = ndarray.to_numpy_array(query)
+        n_candidates = max(min(limit, len(self)), int(n_candidates))
+        # the index always returns at least `limit` candidates, as it probes more lists if needed
+        ids = self._ivfpq_rows.ids
+        candidates = [
+            [ids[r] for r in self._ivfpq.search(q, n_candidates, nprobe)[1].tolist()]
+            for q in query
+        ]
+        return self._rerank(query, candidates, cdist, limit, normalization, metric_name)
+
+    def _find_nn_quantized(
+        self,
+        query: 'ArrayType',
+        cdist,
+        limit,
+        normalization,
+        metric_name,
+        metric: Optional[str],
+        quantization: str,
+        n_candidates: int,
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        :param query: the query embeddings to search by.
+        :param cdist: the distance metric
+        :param limit: the maximum number of matches, when not given
+                      all Documents in `darray` are considered as matches
+        :param normalization: a tuple [a, b] to be used with min-max normalization,
+                                the min distance will be rescaled to `a`, the max distance will be rescaled to `b`
+                                all values will be rescaled into range `[a, b]`.
+        :param metric_name: if provided, then match result will be marked with this string.
+        :param metric: the metric computed on int8 codes, unused for binary codes which are compared by hamming distance
+        :param quantization: `int8` or `binary`
+        :param n_candidates: the number of candidates re-ranked with the exact embeddings
+        :return: distances and indices
+        """
+        codes = self._get_quantized_codes(quantization)
+        if not len(codes):
+            return np.empty((len(query), 0)), np.empty((len(query), 0), dtype=int)
+
+        query = ndarray.to_numpy_array(query)
+        candidates = codes.search(query, metric, max(limit, int(n_candidates)))
+        return self._rerank(query, candidates, cdist, limit, normalization, metric_name)
+
+    def _rerank(
+        self,
+        query: 'np.ndarray',
+        candidates: List[List[str]],
+        cdist,
+        limit,
+        normalization,
+        metric_name,
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        :param query: the query embeddings to search by.
+        :param candidates: the ids of the candidates of each query, as many for every query
+        :param cdist: the distance metric
+        :param limit: the maximum number of matches
+        :param normalization: a tuple [a, b] to be used with min-max normalization,
+                                the min distance will be rescaled to `a`, the max distance will be rescaled to `b`
+                                all values will be rescaled into range `[a, b]`.
+        :param metric_name: if provided, then match result will be marked with this string.
+        :return: distances and indices
+        """
+        n_q = len(query)
+        limit = min(limit, len(candidates[0]))
+        if not limit:
+            return np.empty((n_q, 0)), np.empty((n_q, 0), dtype=int)
+
+        # the embeddings of all candidates are loaded at once, ``rows`` are their positions in ``embeddings``
+        ids, embeddings = self._get_embeddings_by_ids(
+            list(dict.fromkeys(chain.from_iterable(candidates)))
+        )
+        id2row = {_id: r for r, _id in enumerate(ids)}
+        rows = np.array([[id2row[_id] for _id in c] for c in candidates], dtype=int)
+
+        dist = np.empty((n_q, limit))
+        idx = np.empty((n_q, limit), dtype=int)
+        # each chunk of queries is scored against the union of its candidates by a single `cdist`, the chunks keep
+        # the distance matrix, at most chunk size squared times the number of candidates, small
+        chunk_size = max(1, int(np.sqrt(_RERANK_MAX_DISTANCES / rows.shape[1])))
+        for start in range(0, n_q, chunk_size):
+            end = start + chunk_size
+            union, inverse = np.unique(rows[start:end], return_inverse=True)
+            dists = np.take_along_axis(
+                cdist(query[start:end], embeddings[union], metric_name),
+                inverse.reshape(rows[start:end].shape),
+                axis=1,
+            )
+            top_dists, top_inds = top_k(dists, limit, descending=False)
+            if isinstance(normalization, (tuple, list)) and normalization is not None:
+                # bounds are taken over the re-ranked candidates, the other distances are never computed
+                top_dists = minmax_normalize(
+                    top_dists,
+                    normalization,
+                    (
+                        np.min(dists, axis=-1, keepdims=True),
+                        np.max(dists, axis=-1, keepdims=True),
+                    ),
+                )
+            dist[start:end] = top_dists
+            idx[start:end] = np.take_along_axis(rows[start:end], top_inds, axis=1)
+
+        # only the offsets of the matches are looked up
+        matched = np.unique(idx)
+        offsets = np.empty(len(ids), dtype=int)
+        offsets[matched] = self._get_offsets_by_ids([ids[r] for r in matched])
+        return dist, offsets[idx]
+
     def _find_nn_online(
         self,
         query,
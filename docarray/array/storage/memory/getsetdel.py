@@ -17,33 +17,47 @@ class GetSetDelMixin(BaseGetSetDelMixin):
     def _del_docs_by_mask(self, mask: Sequence[bool]):
         if len(mask) < len(self._data):
             mask = mask + [False for _ in range(len(self._data) - len(mask))]
+        self._bump_embeddings_version(
+            d.id for d in itertools.compress(self._data, mask)
+        )
         self._data = list(itertools.compress(self._data, (not _i for _i in mask)))
+        self._mark_embeddings_dirty()
 
     @needs_id2offset_rebuild
     def _del_docs_by_slice(self, _slice: slice):
+        self._bump_embeddings_version(d.id for d in self._data[_slice])
         del self._data[_slice]
+        self._mark_embeddings_dirty()
 
     def _del_doc_by_id(self, _id: str):
         self._del_doc_by_offset(self._id2offset[_id])
 
     @needs_id2offset_rebuild
     def _del_doc_by_offset(self, offset: int):
+        self._bump_embeddings_version([self._data[offset].id])
         del self._data[offset]
+        store = self._embedding_store
+        if store is not None:
+            store.delete(offset, self._data)
 
     def _set_doc_by_offset(self, offset: int, value: 'Document'):
         old_id = self._data[offset].id
         self._id2offset[value.id] = offset
         self._data[offset] = value
         self._id2offset.pop(old_id)
+        self._set_embedding_row(offset, old_id)
 
     def _set_doc_by_id(self, _id: str, value: 'Document'):
         old_idx = self._id2offset.pop(_id)
         self._data[old_idx] = value
         self._id2offset[value.id] = old_idx
+        self._set_embedding_row(old_idx, _id)
 
     @needs_id2offset_rebuild
     def _set_docs_by_slice(self, _slice: slice, value: Sequence['Document']):
         self._data[_slice] = value
+        self._bump_embeddings_version()
+        self._mark_embeddings_dirty()
 
     def _set_doc_attr_by_offset(self, offset: int, attr: str, value: Any):
         if attr == 'id' and value is None:
@@ -51,7 +65,10 @@ class GetSetDelMixin(BaseGetSetDelMixin):
                 'setting the ID of a Document stored in a DocumentArray to None is not allowed'
             )
 
+        old_id = self._data[offset].id
         setattr(self._data[offset], attr, value)
+        if attr in ('embedding', 'id'):
+            self._set_embedding_row(offset, old_id)
 
     def _get_doc_by_offset(self, offset: int) -> 'Document':
         return self._data[offset]
@@ -65,6 +82,21 @@ class GetSetDelMixin(BaseGetSetDelMixin):
     def _clear_storage(self):
         self._data.clear()
         self._id2offset.clear()
+        self._bump_embeddings_version()
+        store = self._embedding_store
+        if store is not None:
+            store.clear()
+
+    def _set_embedding_row(self, offset: int, old_id: str):
+        self._bump_embeddings_version([old_id, self._data[offset].id])
+        store = self._embedding_store
+        if store is not None:
+            store.set(offset, self._data[offset], self._data)
+
+    def _mark_embeddings_dirty(self):
+        store = self._embedding_store
+        if store is not None:
+            store.mark_dirty()
 
     def _load_offset2ids(self):
         ...
@@ -0,0 +1,565 @@
+import operator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+from docarray.math.distance.numpy import row_norms
+from docarray.math.helper import top_k
+from docarray.math.ndarray import get_array_rows, get_array_type
+from docarray.math.quantization import binarize, int8_quantize
+
+if TYPE_CHECKING:  # pragma: no cover
+    from docarray import Document
+    from docarray.typing import ArrayType
+
+
+class ColumnarEmbeddings:
+    """A growable, contiguous 2-D buffer that holds the embeddings of an in-memory DocumentArray.
+
+    Row ``i`` of the buffer always belongs to the ``i``-th Document of the array, and the ``.embedding`` of that
+    Document is rebound to a view of the row. Reading :attr:`matrix` therefore never stacks or copies anything.
+    Only 1-D numpy embeddings are stored, the dtype of the buffer is promoted to fit all of them. Documents that
+    leave the array get a copy of their row back, so they never alias the buffer.
+
+    The buffer is kept in sync incrementally on append, extend, insert, set and delete. Operations that reshuffle
+    many rows at once simply mark the buffer as dirty, it is then rebuilt on next access. So do changes that the
+    buffer missed, e.g. made through another DocumentArray sharing the same Documents.
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        self._initial_capacity = max(int(initial_capacity), 1)
+        self._buffer = None  # type: Optional[np.ndarray]
+        self._rows = []  # type: List[Optional[np.ndarray]]
+        # the Document bound to each row
+        self._owners = []  # type: List[Optional['Document']]
+        self._n_missing = 0
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        # views do not survive pickling, they are rebound on next access
+        state['_rows'] = []
+        state['_owners'] = []
+        state['_n_missing'] = 0
+        state['_dirty'] = True
+        return state
+
+    @property
+    def is_complete(self) -> bool:
+        """Return True if every Document has an embedding stored in the buffer.
+
+        :return: whether :attr:`matrix` covers all Documents
+        """
+        return self._buffer is not None and self._n_missing == 0
+
+    @property
+    def matrix(self) -> Optional['np.ndarray']:
+        """Return the used part of the buffer, without copying.
+
+        :return: a 2-D view of shape ``(n_docs, n_dim)`` or None if no embedding is stored yet.
+        """
+        if self._buffer is not None:
+            return self._buffer[: len(self._rows)]
+
+    def sync(self, docs: Sequence['Document']) -> None:
+        """Make sure the buffer reflects ``docs``.
+
+        Embeddings that were re-assigned directly on a Document (e.g. ``da[0].embedding = ...``) are detected by
+        identity and copied into the buffer.
+
+        :param docs: the Documents of the array, in order
+        """
+        if self._dirty or len(docs) != len(self._rows):
+            self.rebuild(docs)
+            return
+        for offset, (d, row) in enumerate(zip(docs, self._rows)):
+            if d._data.embedding is not row:
+                self.set(offset, d, docs)
+
+    def rebuild(self, docs: Sequence['Document']) -> None:
+        """Rebuild the whole buffer from ``docs``.
+
+        :param docs: the Documents of the array, in order
+        """
+        # a new buffer, so that Documents removed from the array keep their views of the old one
+        self._buffer = None
+        self._rows = []
+        self._owners = []
+        self._n_missing = 0
+        self._dirty = False
+        for d in docs:
+            self._add_row()
+            self._bind(len(self._rows) - 1, d, docs)
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def clear(self) -> None:
+        self._buffer = None
+        self._rows.clear()
+        self._owners.clear()
+        self._n_missing = 0
+        self._dirty = False
+
+    def append(self, doc: 'Document', docs: Sequence['Document']) -> None:
+        """Add the embedding of ``doc`` as a new last row.
+
+        :param doc: the Document just appended
+        :param docs: the Documents of the array, already including ``doc``
+        """
+        if not self._is_aligned(docs, 1):
+            return
+        if self._reserve(len(self._rows) + 1):
+            self._rebind_from(0, docs)
+        self._add_row()
+        self._bind(len(self._rows) - 1, doc, docs)
+
+    def extend(self, values: Sequence['Document'], docs: Sequence['Document']) -> None:
+        """Add the embeddings of ``values`` as new last rows.
+
+        :param values: the Documents just added
+        :param docs: the Documents of the array, already including ``values``
+        """
+        if not self._is_aligned(docs, len(values)):
+            return
+        if self._reserve(len(self._rows) + len(values)):
+            self._rebind_from(0, docs)
+        for d in values:
+            self._add_row()
+            self._bind(len(self._rows) - 1, d, docs)
+
+    def insert(self, offset: int, doc: 'Document', docs: Sequence['Document']) -> None:
+        """Insert the embedding of ``doc`` at row ``offset`` and shift the following rows down by one.
+
+        :param offset: the position of ``doc`` in ``docs``
+        :param doc: the Document just inserted
+        :param docs: the Documents of the array, already including ``doc``
+        """
+        if not self._is_aligned(docs, 1):
+            return
+        n = len(self._rows)
+        offset = _normalize_offset(offset, n + 1)
+        grown = self._reserve(n + 1)
+        if self._buffer is not None and offset < n:
+            self._buffer[offset + 1 : n + 1] = self._buffer[offset:n]
+        self._rows.insert(offset, None)
+        self._owners.insert(offset, None)
+        self._n_missing += 1
+        self._rebind_from(0 if grown else offset + 1, docs)
+        self._bind(offset, doc, docs)
+
+    def set(self, offset: int, doc: 'Document', docs: Sequence['Document']) -> None:
+        """Replace row ``offset`` by the embedding of ``doc``.
+
+        :param offset: the position of ``doc`` in ``docs``
+        :param doc: the Document just set
+        :param docs: the Documents of the array
+        """
+        if not self._is_aligned(docs, 0):
+            return
+        self._bind(_normalize_offset(offset, len(self._rows)), doc, docs)
+
+    def delete(self, offset: int, docs: Sequence['Document']) -> None:
+        """Remove row ``offset`` and shift the following rows up by one.
+
+        :param offset: the position of the deleted Document
+        :param docs: the Documents of the array, already without the deleted Document
+        """
+        if not self._is_aligned(docs, -1):
+            return
+        n = len(self._rows)
+        offset = _normalize_offset(offset, n)
+        self._unbind(offset)
+        if self._buffer is not None and offset < n - 1:
+            self._buffer[offset : n - 1] = self._buffer[offset + 1 : n]
+        del self._rows[offset]
+        del self._owners[offset]
+        self._n_missing -= 1
+        self._rebind_from(offset, docs)
+
+    def _is_aligned(self, docs: Sequence['Document'], n_added: int) -> bool:
+        # whether the rows still match ``docs`` before the change of ``n_added`` Documents, otherwise rebuild later
+        if not self._dirty and len(self._rows) + n_added != len(docs):
+            self._dirty = True
+        return not self._dirty
+
+    def _add_row(self) -> None:
+        self._rows.append(None)
+        self._owners.append(None)
+        self._n_missing += 1
+
+    def _unbind(self, offset: int) -> None:
+        # give the Document of the row a copy of its embedding, the row is about to be reused
+        row = self._rows[offset]
+        if row is None:
+            return
+        owner = self._owners[offset]
+        if owner is not None and owner._data.embedding is row:
+            owner._data.embedding = row.copy()
+        self._rows[offset] = None
+        self._owners[offset] = None
+        self._n_missing += 1
+
+    def _bind(self, offset: int, doc: 'Document', docs: Sequence['Document']) -> None:
+        emb = doc._data.embedding
+        if self._rows[offset] is not None:
+            if emb is self._rows[offset]:
+                return
+            self._unbind(offset)
+
+        # torch, tensorflow, sparse embeddings, etc. are kept as they are, `.embeddings` then stacks them
+        if not isinstance(emb, np.ndarray):
+            return
+
+        if emb.ndim != 1:
+            raise ValueError(
+                f'columnar embeddings only support 1-D embeddings, but Document {doc.id} '
+                f'has an embedding of shape {emb.shape}'
+            )
+
+        if self._buffer is None:
+            self._buffer = np.zeros(
+                (max(self._initial_capacity, len(docs)), emb.shape[0]),
+                dtype=emb.dtype,
+            )
+        elif emb.shape[0] != self._buffer.shape[1]:
+            raise ValueError(
+                f'columnar embeddings must all have the same dimension {self._buffer.shape[1]}, '
+                f'but Document {doc.id} has an embedding of dimension {emb.shape[0]}'
+            )
+        else:
+            dtype = np.result_type(self._buffer.dtype, emb.dtype)
+            if dtype != self._buffer.dtype:
+                self._buffer = self._buffer.astype(dtype)
+                self._rebind_from(0, docs)
+
+        row = self._buffer[offset]
+        row[:] = emb
+        doc._data.embedding = row
+        self._rows[offset] = row
+        self._owners[offset] = doc
+        self._n_missing -= 1
+
+    def _rebind_from(self, start: int, docs: Sequence['Document']) -> None:
+        # rows after `start` moved in the buffer, point their Documents to the new views. Embeddings re-assigned
+        # since they were bound are left alone, :meth:`sync` copies them in later
+        for offset in range(start, len(self._rows)):
+            old = self._rows[offset]
+            if old is not None:
+                row = self._buffer[offset]
+                if docs[offset]._data.embedding is old:
+                    docs[offset]._data.embedding = row
+                self._rows[offset] = row
+                self._owners[offset] = docs[offset]
+
+    def _reserve(self, size: int) -> bool:
+        # grow the buffer geometrically, return True if the rows were moved
+        if self._buffer is None or size <= self._buffer.shape[0]:
+            return False
+
+        capacity = self._buffer.shape[0]
+        while capacity < size:
+            capacity *= 2
+
+        buffer = np.zeros((capacity, self._buffer.shape[1]), dtype=self._buffer.dtype)
+        n = len(self._rows)
+        buffer[:n] = self._buffer[:n]
+        self._buffer = buffer
+        return True
+
+
+class EmbeddingsCache:
+    """The stacked embeddings of an in-memory DocumentArray, stamped with the version of the array they were built from.
+
+    The version is bumped by every change made through the DocumentArray. Besides the version, the cache remembers the
+    embedding object of every Document, so that embeddings re-assigned directly on a Document (e.g.
+    ``da[0].embedding = ...``) also invalidate it. Embeddings modified in place (e.g. ``da[0].embedding[:] = ...``) can
+    not be detected, they must be re-assigned afterwards.
+    """
+
+    def __init__(self, version: int, refs: List[Any], matrix: 'ArrayType'):
+        self.version = version
+        self.refs = refs
+        self.matrix = matrix
+        self._norms = None
+        self._shards = {}  # type: Dict[Tuple[int, bool], List[Tuple]]
+
+    def is_valid(self, version: int, refs: List[Any]) -> bool:
+        """Check whether the cache still reflects the array.
+
+        :param version: the current version of the array
+        :param refs: the current embedding object of every Document, in order
+        :return: True if the cached matrix can be reused
+        """
+        return (
+            self.version == version
+            and len(self.refs) == len(refs)
+            and all(map(operator.is_, self.refs, refs))
+        )
+
+    @property
+    def norms(self) -> Optional['np.ndarray']:
+        """Return the L2 norm of every row of the cached matrix, computed once.
+
+        :return: a 1-D ndarray, or None if the matrix is not a dense numpy array
+        """
+        if self._norms is None and get_array_type(self.matrix) == ('numpy', False):
+            self._norms = row_norms(self.matrix)
+        return self._norms
+
+    def shards(
+        self, n_shards: int, with_norms: bool = False
+    ) -> Optional[List[Tuple[int, int, 'ArrayType', Optional['np.ndarray']]]]:
+        """Split the cached matrix into contiguous shards of rows, once for each number of shards.
+
+        :param n_shards: the maximum number of shards
+        :param with_norms: if set, also split the row norms, if the matrix has any
+        :return: the offsets of the first and after the last row, the rows and their norms or None of each shard, or
+            None if the matrix is empty or can not be sliced, e.g. a sparse matrix
+        """
+        if self.matrix is None or get_array_type(self.matrix)[1]:
+            return None
+        n_rows, _ = get_array_rows(self.matrix)
+        if not n_rows:
+            return None
+
+        key = (n_shards, with_norms)
+        shards = self._shards.get(key)
+        if shards is None:
+            norms = self.norms if with_norms else None
+            bounds = np.linspace(0, n_rows, min(n_shards, n_rows) + 1, dtype=int)
+            shards = self._shards[key] = [
+                (
+                    int(start),
+                    int(end),
+                    self.matrix[start:end],
+                    None if norms is None else norms[start:end],
+                )
+                for start, end in zip(bounds[:-1], bounds[1:])
+            ]
+        return shards
+
+
+class EmbeddingsChangeLog:
+    """Counts the changes to the embeddings of a DocumentArray and remembers which Documents they touched.
+
+    Codes derived from the embeddings, e.g. quantized or IVF-PQ codes, remember the :attr:`version` they were built at
+    and only re-encode the Documents touched since then, see :meth:`since`. Touched ids are only recorded while
+    :attr:`tracking` is set, i.e. once such codes exist.
+    """
+
+    def __init__(self, max_changes: int = 100_000):
+        self.version = 0
+        self.tracking = False
+        self._max_changes = max_changes
+        # the version of the last change of each touched id
+        self._changes = {}  # type: Dict[str, int]
+        self._start = 0
+
+    def record(self, ids: Optional[Iterable[str]] = None) -> None:
+        """Record a change to the embeddings.
+
+        :param ids: the ids of the touched Documents, None if the change may have touched any Document
+        """
+        if ids is None:
+            self.reset()
+        else:
+            self.touch(ids)
+
+    def touch(self, ids: Iterable[str]) -> None:
+        """Record that the Documents of ``ids`` were added, removed or that their embeddings changed.
+
+        :param ids: the ids of the touched Documents
+        """
+        if not self.tracking:
+            self.reset()
+            return
+        for _id in ids:
+            self.version += 1
+            self._changes[_id] = self.version
+        if len(self._changes) > self._max_changes:
+            self.reset()
+
+    def reset(self) -> None:
+        """Record a change that may have touched any Document."""
+        self.version += 1
+        self._changes.clear()
+        self._start = self.version
+
+    def since(self, version: int) -> Optional[List[str]]:
+        """Return the ids of the Documents touched after ``version``.
+
+        :param version: a former :attr:`version`
+        :return: the touched ids, or None if they are unknown and everything must be rebuilt
+        """
+        if version < self._start:
+            return None
+        if version == self.version:
+            return []
+        return [_id for _id, v in self._changes.items() if v > version]
+
+    def discard(self, version: int) -> None:
+        """Forget the changes up to ``version``, codes older than that are rebuilt.
+
+        :param version: the oldest version any codes were built at
+        """
+        if version > self._start:
+            self._changes = {k: v for k, v in self._changes.items() if v > version}
+            self._start = version
+
+
+class CodeRows:
+    """Map the ids of Documents to the rows of an array of codes, the rows of removed Documents are reused."""
+
+    def __init__(self):
+        self.ids = []  # type: List[Optional[str]]
+        self._rows = {}  # type: Dict[str, int]
+        self._free = []  # type: List[int]
+
+    def __len__(self):
+        return len(self._rows)
+
+    def assign(self, ids: Sequence[str]) -> 'np.ndarray':
+        """Give a row to each of ``ids``, which must not have one yet.
+
+        :param ids: the ids of the Documents
+        :return: the rows, free rows first, then new rows at the end
+        """
+        rows = np.empty(len(ids), dtype=np.int64)
+        for i, _id in enumerate(ids):
+            if self._free:
+                row = self._free.pop()
+                self.ids[row] = _id
+            else:
+                row = len(self.ids)
+                self.ids.append(_id)
+            self._rows[_id] = row
+            rows[i] = row
+        return rows
+
+    def remove(self, ids: Iterable[str]) -> 'np.ndarray':
+        """Free the rows of ``ids``, ids without a row are ignored.
+
+        :param ids: the ids of the Documents
+        :return: the freed rows
+        """
+        rows = []
+        for _id in ids:
+            row = self._rows.pop(_id, None)
+            if row is not None:
+                self.ids[row] = None
+                self._free.append(row)
+                rows.append(row)
+        return np.array(rows, dtype=np.int64)
+
+
+class QuantizedCodes:
+    """The int8 or binary codes of the embeddings of a DocumentArray, one row per Document with an embedding.
+
+    Only the codes are kept: candidates found by scanning them are re-ranked with the stored embeddings. Documents
+    are added and removed row by row, the int8 ``scales`` stay those computed when the codes were first built.
+    """
+
+    def __init__(self, quantization: str, scales: Optional['np.ndarray'] = None):
+        self.quantization = quantization
+        self.scales = scales
+        self.rows = CodeRows()
+        self.version = 0
+        self._codes = None  # type: Optional[np.ndarray]
+        self._norms = None  # type: Optional[np.ndarray]
+        self._used = np.zeros(0, dtype=bool)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def add(self, ids: Sequence[str], embeddings: 'np.ndarray') -> None:
+        """Encode the embeddings of Documents that have no codes yet.
+
+        :param ids: the ids of the Documents
+        :param embeddings: their embeddings, ndarray of shape ``(len(ids), n_dim)``
+        """
+        if self.quantization == 'binary':
+            codes, norms = binarize(embeddings), None
+        else:
+            codes, _ = int8_quantize(embeddings, self.scales)
+            norms = row_norms(codes * self.scales)
+
+        rows = self.rows.assign(ids)
+        self._reserve(len(self.rows.ids), codes)
+        self._codes[rows] = codes
+        if norms is not None:
+            self._norms[rows] = norms
+        self._used[rows] = True
+
+    def remove(self, ids: Iterable[str]) -> None:
+        """Drop the codes of Documents, their rows are reused by the next :meth:`add`.
+
+        :param ids: the ids of the Documents, ids without codes are ignored
+        """
+        self._used[self.rows.remove(ids)] = False
+
+    def search(
+        self, query: 'np.ndarray', metric: Optional[str], n_candidates: int
+    ) -> List[List[str]]:
+        """Find the candidates of each query by scanning the codes.
+
+        :param query: the query embeddings, ndarray with ndim=2
+        :param metric: the metric computed on int8 codes, unused for binary codes compared by hamming distance
+        :param n_candidates: the number of candidates of each query
+        :return: the ids of the candidates of each query, ``min(n_candidates, len(self))`` of them
+        """
+        from docarray.math.distance import cdist
+
+        n_rows = len(self.rows.ids)
+        codes = self._codes[:n_rows]
+        if self.quantization == 'binary':
+            dists = cdist(binarize(query), codes, 'hamming')
+        else:
+            dists = cdist(
+                query,
+                codes,
+                f'int8_{metric}',
+                scales=self.scales,
+                y_norm=self._norms[:n_rows],
+            )
+        if len(self.rows) < n_rows:
+            dists[:, ~self._used[:n_rows]] = np.inf
+
+        _, rows = top_k(dists, min(n_candidates, len(self.rows)), descending=False)
+        return [[self.rows.ids[r] for r in _rows] for _rows in rows.tolist()]
+
+    def _reserve(self, size: int, codes: 'np.ndarray') -> None:
+        # grow the arrays geometrically, like :class:`ColumnarEmbeddings`
+        capacity = 0 if self._codes is None else len(self._codes)
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+
+        buffer = np.zeros((capacity, codes.shape[1]), dtype=codes.dtype)
+        used = np.zeros(capacity, dtype=bool)
+        if self._codes is not None:
+            buffer[: len(self._codes)] = self._codes
+            used[: len(self._used)] = self._used
+        self._codes, self._used = buffer, used
+
+        if self.quantization != 'binary':
+            norms = np.zeros(capacity, dtype=np.float32)
+            if self._norms is not None:
+                norms[: len(self._norms)] = self._norms
+            self._norms = norms
+
+
+def _normalize_offset(offset: int, size: int) -> int:
+    return offset + size if offset < 0 else offset
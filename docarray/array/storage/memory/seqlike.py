@@ -17,6 +17,13 @@ class SequenceLikeMixin(BaseSequenceLikeMixin):
         :param value: The doc needs to be inserted.
         """
         self._data.insert(index, value)
+        self._bump_embeddings_version([value.id])
+        store = self._embedding_store
+        if store is not None:
+            # resolve the actual position the same way `list.insert` does
+            n = len(self._data) - 1
+            offset = max(n + index, 0) if index < 0 else min(index, n)
+            store.insert(offset, value, self._data)
 
     def _append(self, value: 'Document', **kwargs):
         """Append `doc` to the end of the array.
@@ -24,6 +31,10 @@ class SequenceLikeMixin(BaseSequenceLikeMixin):
         :param value: The doc needs to be appended.
         """
         self._data.append(value)
+        self._bump_embeddings_version([value.id])
+        store = self._embedding_store
+        if store is not None:
+            store.append(value, self._data)
         if not self._needs_id2offset_rebuild:
             self._id_to_index[value.id] = len(self) - 1
 
@@ -52,7 +63,7 @@ class SequenceLikeMixin(BaseSequenceLikeMixin):
         return f'<DocumentArray (length={len(self)}) at {id(self)}>'
 
     def __add__(self, other: Union['Document', Iterable['Document']]):
-        v = type(self)(self, copy=True)
+        v = type(self)(self, copy=True, config=getattr(self, '_config', None))
         v.extend(other)
         return v
 
@@ -60,4 +71,8 @@ class SequenceLikeMixin(BaseSequenceLikeMixin):
         values = list(values)  # consume the iterator only once
         last_idx = len(self._id2offset)
         self._data.extend(values)
+        self._bump_embeddings_version(d.id for d in values)
+        store = self._embedding_store
+        if store is not None:
+            store.extend(values, self._data)
         self._id_to_index.update({d.id: i + last_idx for i, d in enumerate(values)})
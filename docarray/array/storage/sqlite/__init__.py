@@ -3,9 +3,7 @@ from abc import ABC
 from docarray.array.storage.sqlite.backend import BackendMixin, SqliteConfig
 from docarray.array.storage.sqlite.getsetdel import GetSetDelMixin
 from docarray.array.storage.sqlite.seqlike import SequenceLikeMixin
-from docarray.array.storage.memory.find import (
-    FindMixin,
-)  # temporary delegate to in-memory find API
+from docarray.array.storage.sqlite.find import FindMixin
 
 __all__ = ['StorageMixins', 'SqliteConfig']
 
@@ -1,12 +1,21 @@
 import copy
 import sqlite3
+import threading
 import warnings
+import weakref
 from dataclasses import dataclass, field
 from tempfile import NamedTemporaryFile
-from typing import Iterable, Dict, Optional, TYPE_CHECKING, Union
+from typing import Iterable, Dict, Optional, TYPE_CHECKING, Union, List, Tuple
 
-from docarray.array.storage.sqlite.helper import initialize_table
-from docarray.array.storage.base.backend import BaseBackendMixin
+from docarray.array.storage.sqlite.helper import (
+    initialize_table,
+    column_values,
+    number_column_value,
+    text_column_value,
+    regexp,
+)
+from docarray.array.storage.base.backend import BaseBackendMixin, TypeMap
+from docarray.array.storage.memory.helper import EmbeddingsChangeLog
 from docarray.helper import random_identity, dataclass_from_dict
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -20,6 +29,74 @@ def _sanitize_table_name(table_name: str, raise_warning=True) -> str:
     return ret
 
 
+def _connect(config: 'SqliteConfig') -> 'sqlite3.Connection':
+    connection = sqlite3.connect(
+        config.connection,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        check_same_thread=False,
+        **config.conn_config,
+    )
+    connection.create_function('regexp', 2, regexp, deterministic=True)
+    return connection
+
+
+class _Reader:
+    # holds the read-only connection of one thread, which is closed together with the thread's ``threading.local``
+    def __init__(self, config: 'SqliteConfig'):
+        self.connection = _connect(config)
+        self.connection.execute('PRAGMA query_only=ON')
+
+    def close(self) -> None:
+        self.connection.close()
+
+    __del__ = close
+
+
+class _ReadConnections:
+    """The read-only connections of the worker threads, one per thread.
+
+    A connection is closed when its thread exits, all remaining ones are closed by :meth:`close` or once the
+    DocumentArray is garbage collected.
+    """
+
+    def __init__(self, config: 'SqliteConfig'):
+        self._config = config
+        self._local = threading.local()
+        self._readers = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def get(self) -> 'sqlite3.Connection':
+        reader = getattr(self._local, 'reader', None)
+        if reader is None:
+            reader = self._local.reader = _Reader(self._config)
+            with self._lock:
+                self._readers.add(reader)
+        return reader.connection
+
+    def close(self) -> None:
+        with self._lock:
+            readers = list(self._readers)
+            self._readers.clear()
+            # the threads still holding a closed reader open a new one on their next read
+            self._local = threading.local()
+        for reader in readers:
+            reader.close()
+
+    __del__ = close
+
+
+def _new_readers(config: 'SqliteConfig') -> Optional[_ReadConnections]:
+    # readers can only run next to the writer with a write-ahead log, and they need a database file to open
+    if (
+        not isinstance(config.connection, str)
+        or config.connection == ':memory:'
+        or 'mode=memory' in config.connection
+        or config.journal_mode.upper() != 'WAL'
+    ):
+        return None
+    return _ReadConnections(config)
+
+
 @dataclass
 class SqliteConfig:
     connection: Optional[Union[str, 'sqlite3.Connection']] = None
@@ -29,6 +106,7 @@ class SqliteConfig:
     conn_config: Dict = field(default_factory=dict)
     journal_mode: str = 'WAL'
     synchronous: str = 'OFF'
+    columns: Optional[Union[List[Tuple[str, str]], Dict[str, str]]] = None
 
 
 class BackendMixin(BaseBackendMixin):
@@ -36,9 +114,37 @@ class BackendMixin(BaseBackendMixin):
 
     schema_version = '0'
 
+    TYPE_MAP = {
+        'str': TypeMap(type='TEXT', converter=text_column_value),
+        'float': TypeMap(type='REAL', converter=number_column_value),
+        'int': TypeMap(type='INTEGER', converter=number_column_value),
+        'bool': TypeMap(type='INTEGER', converter=number_column_value),
+    }
+
     def _sql(self, *args, **kwargs) -> 'sqlite3.Cursor':
         return self._cursor.execute(*args, **kwargs)
 
+    def _read_sql(self, *args, **kwargs) -> 'sqlite3.Cursor':
+        return self._read_connection.execute(*args, **kwargs)
+
+    @property
+    def _read_connection(self) -> 'sqlite3.Connection':
+        # each worker thread reads through its own connection, so readers do not queue on the writer connection.
+        # The main thread keeps reading through the writer, and while a write transaction is open, only the writer
+        # sees its changes, so reads go there as well
+        readers = self._readers
+        if (
+            readers is None
+            or self._connection.in_transaction
+            or threading.current_thread() is threading.main_thread()
+        ):
+            return self._connection
+        return readers.get()
+
+    def _bump_embeddings_version(self, ids: Optional[Iterable[str]] = None) -> None:
+        # any change to the rows, with ``ids`` only the Documents of these ids were touched
+        self._embeddings_changes.record(ids)
+
     def _commit(self):
         self._connection.commit()
 
@@ -68,20 +174,14 @@ class BackendMixin(BaseBackendMixin):
             'Document', lambda x: Document.from_bytes(x, **config.serialize_config)
         )
 
-        _conn_kwargs = dict()
-        _conn_kwargs.update(config.conn_config)
         if config.connection is None:
             config.connection = NamedTemporaryFile().name
 
         if isinstance(config.connection, str):
-            self._connection = sqlite3.connect(
-                config.connection,
-                detect_types=sqlite3.PARSE_DECLTYPES,
-                check_same_thread=False,
-                **_conn_kwargs,
-            )
+            self._connection = _connect(config)
         elif isinstance(config.connection, sqlite3.Connection):
             self._connection = config.connection
+            self._connection.create_function('regexp', 2, regexp, deterministic=True)
         else:
             raise TypeError(
                 f'connection argument must be None or a string or a sqlite3.Connection, not `{type(config.connection)}`'
@@ -95,12 +195,24 @@ class BackendMixin(BaseBackendMixin):
             else _sanitize_table_name(config.table_name)
         )
         config.table_name = self._table_name
-        initialize_table(
-            self._table_name, self.__class__.__name__, self.schema_version, self._cursor
-        )
+        config.columns = self._normalize_columns(config.columns)
+        self._column_converters = {
+            col: self.TYPE_MAP[col_type].converter
+            for col, col_type in config.columns.items()
+        }
+        if initialize_table(
+            self._table_name,
+            self.__class__.__name__,
+            self.schema_version,
+            self._cursor,
+            {col: self._map_type(col_type) for col, col_type in config.columns.items()},
+        ):
+            self._fill_columns()
         self._connection.commit()
         self._config = config
+        self._readers = _new_readers(config)
         self._list_like = config.list_like
+        self._embeddings_changes = EmbeddingsChangeLog()
         super()._init_storage()
 
         if _docs is None:
@@ -113,6 +225,42 @@ class BackendMixin(BaseBackendMixin):
             if isinstance(_docs, Document):
                 self.append(_docs)
 
+    @property
+    def _extra_columns(self) -> List[str]:
+        # the columns filled by ``column_values``, in the same order
+        return ['embedding', 'embedding_dtype'] + [
+            f'"{col}"' for col in self._column_converters
+        ]
+
+    def _insert_statement(self) -> str:
+        columns = ['doc_id', 'item_order', 'serialized_value'] + self._extra_columns
+        return (
+            f'INSERT INTO {self._table_name} ({", ".join(columns)}) '
+            f'VALUES ({", ".join("?" * len(columns))})'
+        )
+
+    def _update_statement(self) -> str:
+        columns = ['doc_id', 'serialized_value'] + self._extra_columns
+        return (
+            f'UPDATE {self._table_name} SET {", ".join(f"{col}=?" for col in columns)} '
+            f'WHERE doc_id=?'
+        )
+
+    def _fill_columns(self, batch_size: int = 1000):
+        # one-off migration of a table written before some of its columns existed
+        r = self._connection.execute(
+            f'SELECT doc_id, serialized_value FROM {self._table_name}'
+        )
+        assignments = ', '.join(f'{col}=?' for col in self._extra_columns)
+        while True:
+            rows = r.fetchmany(batch_size)
+            if not rows:
+                break
+            self._cursor.executemany(
+                f'UPDATE {self._table_name} SET {assignments} WHERE doc_id=?',
+                ((*column_values(d, self._column_converters), _id) for _id, d in rows),
+            )
+
     def _ensure_unique_config(
         self,
         config_root: dict,
@@ -131,15 +279,10 @@ class BackendMixin(BaseBackendMixin):
     def __getstate__(self):
         d = dict(self.__dict__)
         del d['_connection']
+        del d['_readers']
         return d
 
     def __setstate__(self, state):
         self.__dict__ = state
-        _conn_kwargs = dict()
-        _conn_kwargs.update(state['_config'].conn_config)
-        self._connection = sqlite3.connect(
-            state['_config'].connection,
-            detect_types=sqlite3.PARSE_DECLTYPES,
-            check_same_thread=False,
-            **_conn_kwargs,
-        )
+        self._connection = _connect(state['_config'])
+        self._readers = _new_readers(state['_config'])
@@ -0,0 +1,327 @@
+from typing import (
+    Optional,
+    Union,
+    Tuple,
+    Callable,
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+)
+
+import numpy as np
+
+from docarray import Document, DocumentArray
+from docarray.array.storage.memory.find import FindMixin as MemoryFindMixin
+from docarray.array.storage.sqlite.helper import blobs_to_array, filter_to_sql
+from docarray.math import ndarray
+from docarray.math.helper import top_k, minmax_normalize, update_rows_x_mat_best
+
+if TYPE_CHECKING:  # pragma: no cover
+    from docarray.typing import ArrayType
+
+
+class FindMixin(MemoryFindMixin):
+    """Exhaustive vector search that reads only the ``embedding`` column, never the serialized Documents."""
+
+    def _get_embeddings_by_offsets(self, offsets: 'np.ndarray') -> 'np.ndarray':
+        ids = [self._offset2ids.get_id(int(o)) for o in offsets]
+        blobs = {}
+        # stay below the default limit of 999 variables per statement
+        for start in range(0, len(ids), 900):
+            chunk = ids[start : start + 900]
+            r = self._read_sql(
+                f"SELECT doc_id, embedding, embedding_dtype FROM {self._table_name} WHERE doc_id in ({','.join(['?'] * len(chunk))})",
+                chunk,
+            )
+            blobs.update((_id, (b, dtype)) for _id, b, dtype in r)
+        if any(blobs.get(_id, (None,))[0] is None for _id in ids):
+            raise ValueError('IVF-PQ requires all Documents to have an embedding')
+        return blobs_to_array(
+            [blobs[_id][0] for _id in ids], [blobs[_id][1] for _id in ids]
+        )
+
+    def _iter_embeddings(
+        self, batch_size: int
+    ) -> Iterator[Tuple[List[str], 'np.ndarray']]:
+        r = self._read_sql(
+            f'SELECT doc_id, embedding, embedding_dtype FROM {self._table_name} WHERE embedding IS NOT NULL'
+        )
+        while True:
+            rows = r.fetchmany(batch_size)
+            if not rows:
+                return
+            yield [_id for _id, _, _ in rows], blobs_to_array(
+                [b for _, b, _ in rows], [dtype for _, _, dtype in rows]
+            )
+
+    def _get_embeddings_by_ids(
+        self, ids: Sequence[str]
+    ) -> Tuple[List[str], Optional['np.ndarray']]:
+        blobs = {}
+        # stay below the default limit of 999 variables per statement
+        for start in range(0, len(ids), 900):
+            chunk = ids[start : start + 900]
+            blobs.update(
+                (_id, (b, dtype))
+                for _id, b, dtype in self._read_sql(
+                    f"SELECT doc_id, embedding, embedding_dtype FROM {self._table_name} WHERE embedding IS NOT NULL AND doc_id in ({','.join(['?'] * len(chunk))})",
+                    chunk,
+                )
+            )
+        ids = [_id for _id in ids if _id in blobs]
+        if not ids:
+            return [], None
+        return ids, blobs_to_array(
+            [blobs[_id][0] for _id in ids], [blobs[_id][1] for _id in ids]
+        )
+
+    def _get_offsets_by_ids(self, ids: Sequence[str]) -> List[int]:
+        return [self._offset2ids.index(_id) for _id in ids]
+
+    def _filter_to_sql(self, filter) -> Optional[Tuple[str, List]]:
+        if not isinstance(filter, (dict, list)):
+            return None
+        return filter_to_sql(filter, self._config.columns)
+
+    def _filter(
+        self,
+        filter: Union[Dict, List[Dict]],
+        limit: Optional[Union[int, float]] = 20,
+    ) -> 'DocumentArray':
+        """Returns the Documents matching the filter.
+
+        If the filter only uses the tag ``columns`` of the config, it is evaluated by SQLite as a ``WHERE`` clause
+        and only the matching Documents are loaded. Otherwise every Document is loaded and evaluated with
+        :class:`~docarray.array.queryset.QueryParser`.
+
+        :param filter: the filter in the DocArray query language
+        :param limit: not used, all matching Documents are returned
+        :return: a `DocumentArray` containing the `Document` objects that verify the filter.
+        """
+        where = self._filter_to_sql(filter)
+        if where is None:
+            return super()._filter(filter, limit=limit)
+        sql, params = where
+        # the unary `+` keeps SQLite from scanning the whole table in `item_order` just to skip the sort, so the
+        # indices of the tag columns can be used
+        r = self._read_sql(
+            f'SELECT serialized_value FROM {self._table_name} WHERE {sql} ORDER BY +item_order',
+            params,
+        )
+        return DocumentArray(d for (d,) in r)
+
+    def _iter_embedding_chunks(
+        self, batch_size: int, where: Optional[Tuple[str, List]] = None
+    ) -> Iterator[Tuple['np.ndarray', 'np.ndarray']]:
+        # the embeddings in order and their offsets, Documents without an embedding are skipped. With a
+        # ``WHERE`` clause the offsets are unknown, the ``item_order`` keys are returned instead
+        if where is None:
+            r = self._read_sql(
+                f'SELECT NULL, embedding, embedding_dtype FROM {self._table_name} ORDER BY item_order'
+            )
+        else:
+            r = self._read_sql(
+                f'SELECT item_order, embedding, embedding_dtype FROM {self._table_name} '
+                f'WHERE embedding IS NOT NULL AND ({where[0]})',
+                where[1],
+            )
+        offset = 0
+        while True:
+            rows = r.fetchmany(batch_size)
+            if not rows:
+                return
+            if where is None:
+                keys = [
+                    i for i, (_, b, _) in enumerate(rows, start=offset) if b is not None
+                ]
+            else:
+                keys = [k for k, _, _ in rows]
+            offset += len(rows)
+            if keys:
+                rows = [row for row in rows if row[1] is not None]
+                yield blobs_to_array(
+                    [b for _, b, _ in rows], [dtype for _, _, dtype in rows]
+                ), np.array(keys, dtype=np.int64)
+
+    def _find(
+        self,
+        query: 'ArrayType',
+        metric: Union[
+            str, Callable[['ArrayType', 'ArrayType'], 'np.ndarray']
+        ] = 'cosine',
+        limit: Optional[Union[int, float]] = 20,
+        normalization: Optional[Tuple[float, float]] = None,
+        metric_name: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        use_scipy: bool = False,
+        device: str = 'cpu',
+        filter: Optional[Dict] = None,
+        nprobe: Optional[int] = None,
+        quantization: Optional[str] = None,
+        only_id: bool = False,
+        **kwargs,
+    ) -> Union[Tuple['np.ndarray', 'np.ndarray'], List['DocumentArray']]:
+        """Returns the nearest neighbours of a batch of queries.
+
+        The ``embedding`` column is read in chunks of ``batch_size`` rows with ``fetchmany``, so memory stays bounded
+        by the chunk size and ``limit`` whatever the size of the table. Documents without an embedding are never
+        matched. With a ``filter`` on the tag ``columns`` of the config, only the rows matching it are read.
+        ``nprobe`` and ``quantization`` work as for the in-memory DocumentArray, see
+        :meth:`~docarray.array.storage.memory.find.FindMixin._find`.
+
+        :param query: the query embeddings to search
+        :param metric: the distance metric.
+        :param limit: the maximum number of matches, when not given defaults to 20.
+        :param normalization: a tuple [a, b] to be used with min-max normalization,
+                                the min distance will be rescaled to `a`, the max distance will be rescaled to `b`
+                                all values will be rescaled into range `[a, b]`.
+        :param metric_name: if provided, then match result will be marked with this string.
+        :param batch_size: the number of embeddings read from the database at once, defaults to 10,000
+        :param use_scipy: if set, use ``scipy`` as the computation backend.
+        :param device: the computational device for ``.search()``, can be either `cpu` or `cuda`.
+        :param filter: filter query used for pre-filtering, it can only use the tag ``columns`` of the config
+        :param nprobe: if provided, search the IVF-PQ index built by :meth:`train_ivfpq`
+        :param quantization: if provided, either `int8` or `binary`, search the quantized codes of the embeddings
+        :param only_id: if set, then returning matches will only contain ``id``
+        :param kwargs: other kwargs.
+
+        :return: distances and indices, or the matches of each query if ``filter`` is set
+        """
+        if nprobe is not None or quantization is not None:
+            return super()._find(
+                query,
+                metric=metric,
+                limit=limit,
+                normalization=normalization,
+                metric_name=metric_name,
+                use_scipy=use_scipy,
+                device=device,
+                filter=filter,
+                nprobe=nprobe,
+                quantization=quantization,
+                only_id=only_id,
+                **kwargs,
+            )
+
+        where = None
+        if filter is not None:
+            where = self._filter_to_sql(filter)
+            if where is None:
+                raise ValueError(
+                    'Filtered vector search of the SQLite backend only supports filters on the tag `columns` of '
+                    'the config'
+                )
+
+        if batch_size is None:
+            batch_size = 10_000
+        elif batch_size <= 0:
+            raise ValueError(
+                f'`batch_size` must be larger than 0, receiving {batch_size}'
+            )
+
+        if callable(metric):
+            cdist = lambda *x: metric(*x[:2])
+        elif isinstance(metric, str):
+            if use_scipy:
+                from scipy.spatial.distance import cdist as cdist
+            else:
+                from docarray.math.distance import cdist as _cdist
+
+                cdist = lambda *x, **k: _cdist(*x, device=device, **k)
+        else:
+            raise TypeError(
+                f'metric must be either string or a 2-arity function, received: {metric!r}'
+            )
+
+        metric_name = metric_name or (metric.__name__ if callable(metric) else metric)
+        # the embeddings are read back as numpy arrays, so the query must be one too
+        query = np.asarray(ndarray.to_numpy_array(query))
+        dist, idx = self._find_nn_stream(
+            query, cdist, limit, normalization, metric_name, int(batch_size), where
+        )
+        if where is None:
+            return dist, idx
+        return self._get_matches_by_order_keys(dist, idx, metric_name, only_id)
+
+    def _get_matches_by_order_keys(
+        self,
+        dist: 'np.ndarray',
+        keys: 'np.ndarray',
+        metric_name: str,
+        only_id: bool,
+    ) -> List['DocumentArray']:
+        from docarray.score import NamedScore
+
+        unique_keys = np.unique(keys).tolist()
+        docs = {}
+        # stay below the default limit of 999 variables per statement
+        for start in range(0, len(unique_keys), 900):
+            chunk = unique_keys[start : start + 900]
+            docs.update(
+                self._read_sql(
+                    f"SELECT item_order, serialized_value FROM {self._table_name} WHERE item_order in ({','.join(['?'] * len(chunk))})",
+                    chunk,
+                )
+            )
+
+        result = []
+        for _keys, _dists in zip(keys.tolist(), dist):
+            matches = DocumentArray()
+            for _key, _dist in zip(_keys, _dists):
+                d = docs[_key]
+                d = Document(id=d.id) if only_id else Document(d, copy=True)
+                d.pop('matches')
+                d.scores[metric_name] = NamedScore(value=_dist)
+                matches.append(d)
+            result.append(matches)
+        return result
+
+    def _find_nn_stream(
+        self,
+        query: 'ArrayType',
+        cdist,
+        limit,
+        normalization,
+        metric_name,
+        batch_size: int,
+        where: Optional[Tuple[str, List]] = None,
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        :param query: the query embeddings to search by.
+        :param cdist: the distance metric
+        :param limit: the maximum number of matches
+        :param normalization: a tuple [a, b] to be used with min-max normalization,
+                              the min distance will be rescaled to `a`, the max distance will be rescaled to `b`
+                              all values will be rescaled into range `[a, b]`.
+        :param metric_name: if provided, then match result will be marked with this string.
+        :param batch_size: the number of embeddings read from the database at once
+        :param where: if provided, the ``WHERE`` clause and its parameters, the indices are then ``item_order`` keys
+        :return: distances and indices
+        """
+        n_q, _ = ndarray.get_array_rows(query)
+        limit = int(limit)
+
+        top_dists = np.full((n_q, limit), np.inf)
+        top_inds = np.zeros((n_q, limit), dtype=np.int64)
+        min_d = np.full((n_q, 1), np.inf)
+        max_d = np.full((n_q, 1), -np.inf)
+        n_seen = 0
+        for embeddings, offsets in self._iter_embedding_chunks(batch_size, where):
+            dists = ndarray.to_numpy_array(cdist(query, embeddings, metric_name))
+            min_d = np.minimum(min_d, np.min(dists, axis=-1, keepdims=True))
+            max_d = np.maximum(max_d, np.max(dists, axis=-1, keepdims=True))
+            k = min(limit, len(offsets))
+            dists, inds = top_k(dists, k, descending=False)
+            top_dists, top_inds = update_rows_x_mat_best(
+                top_dists, top_inds, dists, offsets[inds], limit
+            )
+            n_seen += len(offsets)
+
+        permutation = np.argsort(top_dists, axis=1)[:, : min(limit, n_seen)]
+        dist = np.take_along_axis(top_dists, permutation, axis=1)
+        idx = np.take_along_axis(top_inds, permutation, axis=1)
+        if isinstance(normalization, (tuple, list)) and normalization is not None:
+            dist = minmax_normalize(dist, normalization, (min_d, max_d))
+        return dist, idx
@@ -3,6 +3,7 @@ from typing import Sequence, Iterable
 
 from docarray.array.storage.base.getsetdel import BaseGetSetDelMixin
 from docarray.array.storage.base.helper import Offset2ID
+from docarray.array.storage.sqlite.helper import column_values
 from docarray import Document
 
 
@@ -13,18 +14,20 @@ class GetSetDelMixin(BaseGetSetDelMixin):
 
     def _del_doc_by_id(self, _id: str):
         self._sql(f'DELETE FROM {self._table_name} WHERE doc_id=?', (_id,))
-        self._save_offset2ids()
+        self._bump_embeddings_version([_id])
         self._commit()
 
     def _set_doc_by_id(self, _id: str, value: 'Document'):
         self._sql(
-            f'UPDATE {self._table_name} SET serialized_value=?, doc_id=? WHERE doc_id=?',
-            (value, value.id, _id),
+            self._update_statement(),
+            (value.id, value, *column_values(value, self._column_converters), _id),
         )
+        # also when the id is kept, the embedding may have changed
+        self._bump_embeddings_version([_id, value.id])
         self._commit()
 
     def _get_doc_by_id(self, id: str) -> 'Document':
-        r = self._sql(
+        r = self._read_sql(
             f'SELECT serialized_value FROM {self._table_name} WHERE doc_id = ?', (id,)
         )
         res = r.fetchone()
@@ -41,6 +44,7 @@ class GetSetDelMixin(BaseGetSetDelMixin):
 
     def _clear_storage(self):
         self._sql(f'DELETE FROM {self._table_name}')
+        self._bump_embeddings_version()
         self._commit()
 
     def _del_docs_by_ids(self, ids: str) -> Iterable['Document']:
@@ -48,12 +52,12 @@ class GetSetDelMixin(BaseGetSetDelMixin):
             f"DELETE FROM {self._table_name} WHERE doc_id in ({','.join(['?'] * len(ids))})",
             ids,
         )
-        self._save_offset2ids()
+        self._bump_embeddings_version(ids)
         self._commit()
 
     def _load_offset2ids(self):
         if self._list_like:
-            r = self._sql(
+            r = self._read_sql(
                 f"SELECT doc_id FROM {self._table_name} ORDER BY item_order",
             )
             self._offset2ids = Offset2ID(
@@ -63,20 +67,5 @@ class GetSetDelMixin(BaseGetSetDelMixin):
             self._offset2ids = Offset2ID([], list_like=self._list_like)
 
     def _save_offset2ids(self):
-        if self._list_like:
-            for offset, doc_id in enumerate(self._offset2ids):
-                self._sql(
-                    f"""
-                        UPDATE {self._table_name} SET item_order = ? WHERE {self._table_name}.doc_id = ?
-                    """,
-                    (offset, doc_id),
-                )
-            self._commit()
-
-    def _del_docs(self, ids):
-        super()._del_docs(ids)
-        self._save_offset2ids()
-
-    def _del_doc_by_offset(self, offset: int):
-        super()._del_doc_by_offset(offset)
-        self._save_offset2ids()
+        # the order is kept in the gapped ``item_order`` keys, which inserts and deletes maintain row by row
+        pass
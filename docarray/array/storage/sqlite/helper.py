@@ -1,15 +1,171 @@
+import re
 import sqlite3
+from typing import (
+    Optional,
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Tuple,
+    Callable,
+    Union,
+    Any,
+    Sequence,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover
+    from docarray.typing import ArrayType
+    from docarray import Document
+
+_RESERVED_COLUMNS = (
+    'doc_id',
+    'embedding',
+    'embedding_dtype',
+    'serialized_value',
+    'item_order',
+)
+
+# stored instead of a tag whose type does not fit its column, blobs are never equal to nor in the range of a filter
+# value, and the empty one marks a falsy tag for `$exists`
+_OTHER_TYPE = b'\x01'
+_OTHER_TYPE_EMPTY = b''
+_INT64_RANGE = (-(2**63), 2**63)
 
 
 def initialize_table(
-    table_name: str, container_type_name: str, schema_version: str, cur: sqlite3.Cursor
-) -> None:
+    table_name: str,
+    container_type_name: str,
+    schema_version: str,
+    cur: sqlite3.Cursor,
+    columns: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    """Create the table if it does not exist yet, and an index on each tag column.
+
+    :param table_name: the name of the table
+    :param container_type_name: the class name of the DocumentArray
+    :param schema_version: the schema version of the table
+    :param cur: the cursor to the database
+    :param columns: the tag columns and their SQL types
+    :return: the columns that were just added to an existing table, their values still have to be filled in
+    """
+    columns = columns or {}
+    for col in columns:
+        if col in _RESERVED_COLUMNS or not re.fullmatch(r'[A-Za-z_][A-Za-z0-9_]*', col):
+            raise ValueError(
+                f'`{col}` can not be used as a column name of the SQLite backend'
+            )
+
     if not _is_metadata_table_initialized(cur):
         _do_initialize_metadata_table(cur)
 
     if not _is_table_initialized(table_name, container_type_name, schema_version, cur):
-        _do_create_table(table_name, cur)
+        _do_create_table(table_name, cur, columns)
         _do_tidy_table_metadata(table_name, container_type_name, schema_version, cur)
+        added = []
+    else:
+        added = _ensure_columns(
+            table_name,
+            cur,
+            {'embedding': 'BLOB', 'embedding_dtype': 'TEXT', **columns},
+        )
+    for col in columns:
+        cur.execute(
+            f'CREATE INDEX IF NOT EXISTS "{table_name}_{col}" ON {table_name} ("{col}")'
+        )
+    return added
+
+
+def embedding_to_blob(
+    embedding: Optional['ArrayType'],
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """Convert an embedding to the raw bytes and the dtype stored in the ``embedding`` and ``embedding_dtype`` columns.
+
+    :param embedding: the embedding of a Document, of any framework
+    :return: the bytes and the numpy dtype string, e.g. ``'<f4'``, or None twice if there is no embedding. Embeddings
+        that are not numeric are stored as float32.
+    """
+    if embedding is None:
+        return None, None
+    from docarray.math.ndarray import to_numpy_array
+
+    embedding = np.ascontiguousarray(to_numpy_array(embedding))
+    if embedding.dtype.kind not in 'biuf':
+        embedding = embedding.astype(np.float32)
+    return embedding.tobytes(), embedding.dtype.str
+
+
+def blobs_to_array(
+    blobs: Sequence[bytes], dtypes: Sequence[Optional[str]]
+) -> 'np.ndarray':
+    """Stack the embeddings read from the ``embedding`` and ``embedding_dtype`` columns.
+
+    :param blobs: the bytes of the embeddings, none of them None
+    :param dtypes: the dtype of each embedding
+    :return: a 2-D ndarray with one row per embedding, of the widest of their dtypes
+    """
+    if len(set(dtypes)) == 1:
+        return np.frombuffer(b''.join(blobs), dtype=dtypes[0] or np.float32).reshape(
+            len(blobs), -1
+        )
+    return np.stack(
+        [np.frombuffer(b, dtype=d or np.float32) for b, d in zip(blobs, dtypes)]
+    )
+
+
+def column_values(doc: 'Document', converters: Dict[str, Callable]) -> Tuple:
+    """Get the values of the ``embedding`` column and of the tag columns of a Document.
+
+    :param doc: the Document
+    :param converters: the tag columns and the functions converting a tag to the value stored in its column, see
+        :func:`text_column_value` and :func:`number_column_value`
+    :return: the embedding bytes and dtype followed by the tag values in the order of ``converters``, None if a tag is
+        missing
+    """
+    values = [*embedding_to_blob(doc.embedding)]
+    for col, converter in converters.items():
+        value = doc.tags.get(col)
+        values.append(None if value is None else converter(value))
+    return tuple(values)
+
+
+def text_column_value(value: Any) -> Union[str, bytes]:
+    """Get the value stored in a `str` column for a tag.
+
+    :param value: the tag, not None
+    :return: the tag if it is a string, otherwise a marker that no filter on the column matches, as in Python
+    """
+    if isinstance(value, str):
+        return str(value)
+    return _other_type(value)
+
+
+def number_column_value(value: Any) -> Union[int, float, bytes]:
+    """Get the value stored in an `int`, `float` or `bool` column for a tag.
+
+    Numbers of all these types compare with each other as in Python, so they are stored as they are.
+
+    :param value: the tag, not None
+    :return: the tag if it is a number, otherwise a marker that no filter on the column matches, as in Python
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, int):
+        if _INT64_RANGE[0] <= value < _INT64_RANGE[1]:
+            return int(value)
+        return float(value)
+    if isinstance(value, float):
+        return value
+    return _other_type(value)
+
+
+def _other_type(value: Any) -> bytes:
+    try:
+        is_empty = not value
+    except Exception:
+        # ndarray-like
+        is_empty = False
+    return _OTHER_TYPE_EMPTY if is_empty else _OTHER_TYPE
 
 
 def _is_metadata_table_initialized(cur: sqlite3.Cursor) -> bool:
@@ -36,19 +192,34 @@ def _do_initialize_metadata_table(cur: sqlite3.Cursor) -> None:
 
 
 def _do_create_table(
-    table_name: str,
-    cur: 'sqlite3.Cursor',
+    table_name: str, cur: 'sqlite3.Cursor', columns: Dict[str, str]
 ) -> None:
+    # small columns come first, so reading them never has to skip over a large Document
+    tag_columns = ''.join(f'"{col}" {col_type}, ' for col, col_type in columns.items())
     cur.execute(
         f'''
             CREATE TABLE {table_name} (
             doc_id TEXT NOT NULL UNIQUE, 
+            {tag_columns}
+            embedding BLOB, 
+            embedding_dtype TEXT, 
             serialized_value Document NOT NULL, 
             item_order INTEGER PRIMARY KEY)
             '''
     )
 
 
+def _ensure_columns(
+    table_name: str, cur: 'sqlite3.Cursor', columns: Dict[str, str]
+) -> List[str]:
+    cur.execute(f'PRAGMA table_info({table_name})')
+    existing = {row[1] for row in cur}
+    added = [col for col in columns if col not in existing]
+    for col in added:
+        cur.execute(f'ALTER TABLE {table_name} ADD COLUMN "{col}" {columns[col]}')
+    return added
+
+
 def _is_table_initialized(
     table_name: str, container_type_name: str, schema_version: str, cur: sqlite3.Cursor
 ) -> bool:
@@ -78,3 +249,135 @@ def _do_tidy_table_metadata(
         'INSERT INTO metadata (table_name, schema_version, container_type) VALUES (?, ?, ?)',
         (table_name, schema_version, container_type_name),
     )
+
+
+_COMPARISONS = {'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+
+
+class _NotCompilable(Exception):
+    pass
+
+
+def filter_to_sql(
+    filter: Union[Dict, List[Dict]], columns: Dict[str, str]
+) -> Optional[Tuple[str, List[Any]]]:
+    """Compile a filter of the DocArray query language into a SQL ``WHERE`` clause over the tag columns.
+
+    A field is a column if it is ``tags__<column>``, the bare ``<column>`` when no Document attribute has that name,
+    or ``id``. Lookups on missing tags are ``NULL``, which ``WHERE``, ``AND`` and ``OR`` treat as false, and negations
+    turn ``NULL`` into false before inverting it. Missing tags thus behave as with
+    :class:`~docarray.array.queryset.QueryParser`, and plain lookups can use the index of their column.
+
+    :param filter: the filter, see :meth:`~docarray.array.mixins.find.FindMixin.find`
+    :param columns: the tag columns and their types, e.g. ``{'price': 'float'}``
+    :return: the clause and its parameters, or None if the filter uses fields that are not columns, placeholders
+        or operators that SQLite can not evaluate
+    """
+    from docarray.array.queryset.parser import _parse_lookups
+
+    node = _parse_lookups(filter)
+    if node is None:
+        return '1', []
+    params = []
+    try:
+        return _node_to_sql(node, columns, params), params
+    except _NotCompilable:
+        return None
+
+
+def _node_to_sql(node, columns: Dict[str, str], params: List) -> str:
+    from docarray.array.queryset.lookup import LookupLeaf
+
+    if isinstance(node, LookupLeaf):
+        sql = ' AND '.join(
+            _lookup_to_sql(key, value, columns, params)
+            for key, value in node.lookups.items()
+        )
+    elif node.children:
+        sql = (' OR ' if node.op == 'or' else ' AND ').join(
+            f'({_node_to_sql(child, columns, params)})' for child in node.children
+        )
+    else:
+        sql = '0' if node.op == 'or' else '1'
+    return f'NOT COALESCE({sql}, 0)' if node.negate else sql
+
+
+def _get_column(field: str, columns: Dict[str, str]) -> Tuple[str, str]:
+    from docarray import Document
+
+    if field == 'id':
+        return 'doc_id', 'str'
+    if field.startswith('tags__') and field[len('tags__') :] in columns:
+        field = field[len('tags__') :]
+    elif field not in columns or hasattr(Document, field):
+        raise _NotCompilable
+    return f'"{field}"', columns[field]
+
+
+def _check_value(value, col_type: str) -> None:
+    # values of another type never compare equal in Python, but SQLite would convert them
+    is_str = isinstance(value, str)
+    if not (is_str or isinstance(value, (int, float))) or is_str != (col_type == 'str'):
+        raise _NotCompilable
+
+
+def _lookup_to_sql(key: str, value, columns: Dict[str, str], params: List) -> str:
+    from docarray.array.queryset.lookup import dunder_partition
+
+    field, op = dunder_partition(key)
+    col, col_type = _get_column(field, columns)
+    if isinstance(value, str) and value.startswith('{'):
+        # placeholders refer to other fields of the same Document
+        raise _NotCompilable
+
+    if op == 'exact' and value is None:
+        sql = f'{col} IS NULL'
+    elif op in ('exact', 'neq'):
+        _check_value(value, col_type)
+        sql = f'{col} = ?' if op == 'exact' else f'{col} IS NOT ?'
+        params.append(value)
+    elif op in _COMPARISONS:
+        _check_value(value, col_type)
+        # blobs sort after all numbers and strings
+        sql = f"{col} {_COMPARISONS[op]} ? AND {col} < X''"
+        params.append(value)
+    elif op in ('in', 'nin'):
+        values = list(value)
+        for v in values:
+            if v is not None:
+                _check_value(v, col_type)
+        not_null = [v for v in values if v is not None]
+        sql = f'{col} IN ({", ".join("?" * len(not_null))})' if not_null else '0'
+        params.extend(not_null)
+        if len(not_null) < len(values):
+            sql = f'{sql} OR {col} IS NULL'
+        if op == 'nin':
+            sql = f'NOT COALESCE({sql}, 0)'
+    elif op == 'regex' and col_type == 'str':
+        sql = f'{col} REGEXP ?'
+        params.append(value)
+    elif op == 'exists':
+        if not isinstance(value, bool):
+            raise ValueError(
+                '$exists operator can only accept True/False as value for comparison'
+            )
+        # like the query language, empty strings and zeros do not exist
+        sql = (
+            f"{col} IS NOT NULL AND {col} != {repr('') if col_type == 'str' else 0} "
+            f"AND {col} != X''"
+        )
+        if not value:
+            sql = f'NOT COALESCE({sql}, 0)'
+    else:
+        raise _NotCompilable
+    return sql
+
+
+def regexp(pattern: str, value: Optional[str]) -> bool:
+    """The ``REGEXP`` function of SQLite, searching ``pattern`` in ``value`` like the ``$regex`` operator.
+
+    :param pattern: the regular expression
+    :param value: the value of the column
+    :return: True if the pattern is found
+    """
+    return isinstance(value, str) and re.search(pattern, value) is not None
@@ -1,56 +1,119 @@
-from typing import Union, Optional, Iterable
+import sqlite3
+from itertools import islice
+from typing import Union, Optional, Iterable, Iterator, List, Tuple
 
 from docarray.array.storage.base.seqlike import BaseSequenceLikeMixin
+from docarray.array.storage.sqlite.helper import column_values
 from docarray import Document
 
+# the distance between the order keys of neighbouring Documents when they are appended, which leaves room for 20
+# inserts in a row at the same position before the keys have to be compacted
+_ORDER_GAP = 1 << 20
+
 
 class SequenceLikeMixin(BaseSequenceLikeMixin):
     """Implement sequence-like methods"""
 
-    def _insert_doc_at_idx(self, doc, idx: Optional[int] = None):
-        if idx is None:
-            idx = len(self)
-        self._sql(
-            f'INSERT INTO {self._table_name} (doc_id, serialized_value, item_order) VALUES (?, ?, ?)',
-            (doc.id, doc, idx),
-        )
-        self._offset2ids.insert(idx, doc.id)
+    def _next_order_key(self) -> int:
+        # ``item_order`` is the rowid, so ``MAX`` is a lookup at the end of the table
+        r = self._sql(f'SELECT MAX(item_order) FROM {self._table_name}').fetchone()[0]
+        return 0 if r is None else r + _ORDER_GAP
+
+    def _order_key_at(self, idx: int) -> int:
+        if self._list_like:
+            r = self._sql(
+                f'SELECT item_order FROM {self._table_name} WHERE doc_id=?',
+                (self._offset2ids.get_id(idx),),
+            )
+        else:
+            r = self._sql(
+                f'SELECT item_order FROM {self._table_name} ORDER BY item_order LIMIT 1 OFFSET ?',
+                (idx,),
+            )
+        return r.fetchone()[0]
 
-    def _shift_index_right_backward(self, start: int):
-        idx = len(self) - 1
-        while idx >= start:
+    def _order_key_before(self, idx: int) -> int:
+        # a free key between the Documents at ``idx - 1`` and ``idx``
+        hi = self._order_key_at(idx)
+        lo = self._order_key_at(idx - 1) if idx > 0 else hi - 2 * _ORDER_GAP
+        if hi - lo < 2:
+            self._compact_order_keys()
+            return self._order_key_before(idx)
+        return (lo + hi) // 2
+
+    def _compact_order_keys(self):
+        """Space all order keys ``_ORDER_GAP`` apart again.
+
+        The new keys are all above the current ones, so rows never collide while being renumbered. This only
+        runs once repeated inserts at the same position have used up the gap there. The rows are renumbered by a
+        single ``UPDATE ... FROM`` over a ``ROW_NUMBER()`` window, older SQLite versions without ``UPDATE ... FROM``
+        update them one by one.
+        """
+        start = self._sql(f'SELECT MAX(item_order) FROM {self._table_name}').fetchone()[
+            0
+        ]
+        if sqlite3.sqlite_version_info >= (3, 33, 0):
             self._sql(
-                f'UPDATE {self._table_name} SET item_order = ? WHERE item_order = ?',
-                (idx + 1, idx),
+                f'UPDATE {self._table_name} SET item_order = r.new_order FROM ('
+                f'SELECT item_order AS old_order, ? + ROW_NUMBER() OVER (ORDER BY item_order) * ? AS new_order '
+                f'FROM {self._table_name}) AS r WHERE {self._table_name}.item_order = r.old_order',
+                (start, _ORDER_GAP),
+            )
+            return
+        keys = [
+            k
+            for (k,) in self._sql(
+                f'SELECT item_order FROM {self._table_name} ORDER BY item_order'
             )
-            idx -= 1
+        ]
+        self._cursor.executemany(
+            f'UPDATE {self._table_name} SET item_order = ? WHERE item_order = ?',
+            ((start + (i + 1) * _ORDER_GAP, k) for i, k in enumerate(keys)),
+        )
 
     def insert(self, index: int, value: 'Document'):
         """Insert `doc` at `index`.
 
+        The Document gets an order key between the keys of its neighbours, so no other row is updated.
+
         :param index: Position of the insertion.
         :param value: The doc needs to be inserted.
         """
-        length = len(self)
+        length = len(self._offset2ids) if self._list_like else len(self)
         if index < 0:
             index = length + index
         index = max(0, min(length, index))
-        self._shift_index_right_backward(index)
-        self._insert_doc_at_idx(doc=value, idx=index)
+        order = (
+            self._next_order_key() if index == length else self._order_key_before(index)
+        )
+        self._sql(
+            self._insert_statement(),
+            (value.id, order, value, *column_values(value, self._column_converters)),
+        )
+        self._offset2ids.insert(index, value.id)
+        self._bump_embeddings_version([value.id])
         self._commit()
 
     def _append(self, doc: 'Document', commit: bool = True, **kwargs) -> None:
         self._sql(
-            f'INSERT INTO {self._table_name} (doc_id, serialized_value, item_order) VALUES (?, ?, ?)',
-            (doc.id, doc, len(self)),
+            self._insert_statement(),
+            (
+                doc.id,
+                self._next_order_key(),
+                doc,
+                *column_values(doc, self._column_converters),
+            ),
         )
         self._offset2ids.append(doc.id)
+        self._bump_embeddings_version([doc.id])
         if commit:
             self._commit()
 
     def __contains__(self, item: Union[str, 'Document']):
         if isinstance(item, str):
-            r = self._sql(f'SELECT 1 FROM {self._table_name} WHERE doc_id=?', (item,))
+            r = self._read_sql(
+                f'SELECT 1 FROM {self._table_name} WHERE doc_id=?', (item,)
+            )
             return len(list(r)) > 0
         elif isinstance(item, Document):
             return item.id in self  # fall back to str check
@@ -58,7 +121,7 @@ class SequenceLikeMixin(BaseSequenceLikeMixin):
             return False
 
     def __len__(self) -> int:
-        request = self._sql(f'SELECT COUNT(*) FROM {self._table_name}')
+        request = self._read_sql(f'SELECT COUNT(*) FROM {self._table_name}')
         return request.fetchone()[0]
 
     def __repr__(self):
@@ -72,7 +135,96 @@ class SequenceLikeMixin(BaseSequenceLikeMixin):
             and self._config == other._config
         )
 
-    def _extend(self, docs: Iterable['Document'], **kwargs) -> None:
-        for doc in docs:
-            self._append(doc, commit=False)
+    def _extend(
+        self,
+        docs: Iterable['Document'],
+        batch_size: int = 1000,
+        num_worker: int = 1,
+        backend: str = 'thread',
+        show_progress: bool = False,
+        **kwargs,
+    ) -> None:
+        """Insert Documents in batches with ``executemany``, all in a single transaction. If any of them fails, none
+        is inserted.
+
+        :param docs: the Documents to insert
+        :param batch_size: the number of Documents serialized and inserted at once
+        :param num_worker: the number of parallel workers serializing the Documents. The inserts are still run in
+            order by the calling thread.
+        :param backend: `thread` or `process`, the backend of the managed pool used when ``num_worker`` is more than
+            one, see :func:`~docarray.array.mixins.parallel.get_managed_pool`
+        :param show_progress: show a progress bar with the insert throughput
+        :param kwargs: not used
+        """
+        from docarray.array.mixins.io.pbar import get_progressbar
+
+        total = len(docs) if hasattr(docs, '__len__') else None
+        pbar, t = get_progressbar('Indexing', disable=not show_progress, total=total)
+        order = self._next_order_key()
+        n_ids = len(self._offset2ids.ids)
+        try:
+            with pbar:
+                pbar.start_task(t)
+                for ids, values, extras in self._iter_serialized_batches(
+                    docs, batch_size, num_worker, backend
+                ):
+                    self._cursor.executemany(
+                        self._insert_statement(),
+                        (
+                            (_id, o, v, *e)
+                            for _id, o, v, e in zip(
+                                ids,
+                                range(order, order + len(ids) * _ORDER_GAP, _ORDER_GAP),
+                                values,
+                                extras,
+                            )
+                        ),
+                    )
+                    self._offset2ids.extend(ids)
+                    self._bump_embeddings_version(ids)
+                    order += len(ids) * _ORDER_GAP
+                    pbar.update(t, advance=len(ids))
+        except BaseException:
+            # none of the Documents is inserted, e.g. on a duplicate id or a Document that fails to serialize
+            self._connection.rollback()
+            del self._offset2ids.ids[n_ids:]
+            self._bump_embeddings_version()
+            raise
         self._commit()
+
+    def _iter_serialized_batches(
+        self, docs: Iterable['Document'], batch_size: int, num_worker: int, backend: str
+    ) -> Iterator[Tuple[List[str], List[bytes], List[Tuple]]]:
+        # the ids, the serialized values and the values of the other columns of the Documents, in order
+        batches = _iter_batches(docs, batch_size)
+        config = (self._config.serialize_config, self._column_converters)
+        if num_worker <= 1:
+            for batch in batches:
+                yield _serialize_batch((batch, *config))
+            return
+
+        from docarray.array.mixins.parallel import _get_pool_and_context
+
+        p, ctx_p = _get_pool_and_context(backend, num_worker, None, True)
+        with ctx_p:
+            yield from p.imap(_serialize_batch, ((batch, *config) for batch in batches))
+
+
+def _iter_batches(
+    docs: Iterable['Document'], batch_size: int
+) -> Iterator[List['Document']]:
+    it = iter(docs)
+    while True:
+        batch = list(islice(it, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _serialize_batch(args) -> Tuple[List[str], List[bytes], List[Tuple]]:
+    docs, serialize_config, converters = args
+    return (
+        [d.id for d in docs],
+        [d.to_bytes(**serialize_config) for d in docs],
+        [column_values(d, converters) for d in docs],
+    )
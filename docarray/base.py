@@ -11,6 +11,10 @@ if TYPE_CHECKING:  # pragma: no cover
     from docarray.typing import T
 
 
+# mutable containers that a shallow copy does not share with its origin
+_SHALLOW_COPIED_FIELDS = ('tags', '_metadata', 'location', 'evaluations', 'scores')
+
+
 @lru_cache()
 def _get_fields(dc):
     return [f.name for f in fields(dc)]
@@ -89,12 +93,23 @@ class BaseDCType:
                 f'Failed to initialize {typename(self)} from obj={_obj}, kwargs={kwargs}'
             )
 
-    def copy_from(self: 'T', other: 'T') -> None:
+    def copy_from(self: 'T', other: 'T', shallow: bool = False) -> None:
         """Overwrite self by copying from another :class:`Document`.
 
         :param other: the other Document to copy from
+        :param shallow: if set, only copy the fields and the ``dict``/``list`` values of `other`, arrays and nested
+            Documents are shared with `other`
         """
-        self._data = cp.deepcopy(other._data)
+        if shallow:
+            self._data = cp.copy(other._data)
+            if hasattr(self._data, '_reference_doc'):
+                self._data._reference_doc = self
+            for f in _SHALLOW_COPIED_FIELDS:
+                v = getattr(self._data, f, None)
+                if v is not None:
+                    setattr(self._data, f, cp.copy(v))
+        else:
+            self._data = cp.deepcopy(other._data)
 
     def clear(self) -> None:
         """Clear all fields from this :class:`Document` to their default values."""
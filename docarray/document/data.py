@@ -2,7 +2,7 @@ import mimetypes
 import os
 from collections import defaultdict
 from dataclasses import dataclass, field, fields
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 from docarray.math.ndarray import check_arraylike_equality
 
@@ -160,3 +160,104 @@ class DocumentData:
                 if getattr(self, key) != getattr(other, key):
                     return False
         return True
+
+
+class _LazyField:
+    """A field of :class:`LazyDocumentData` whose pending value is decoded on first access."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        d = obj.__dict__
+        pending = d.get('_lazy_fields')
+        if pending and self.name in pending:
+            raw, decode = pending[self.name]
+            d[self.name] = self._wrap(obj, decode(raw))
+            _drop_pending(obj, pending, self.name)
+        return d.get(self.name)
+
+    def __set__(self, obj, value):
+        d = obj.__dict__
+        pending = d.get('_lazy_fields')
+        if pending and self.name in pending:
+            _drop_pending(obj, pending, self.name)
+        d[self.name] = value
+
+    def _wrap(self, obj, value):
+        return value
+
+
+class _LazyDocsField(_LazyField):
+    """A ``chunks`` or ``matches`` field of :class:`LazyDocumentData`."""
+
+    def _wrap(self, obj, value):
+        if self.name == 'chunks':
+            from docarray.array.chunk import ChunkArray
+
+            return ChunkArray(value, reference_doc=obj._reference_doc)
+        else:
+            from docarray.array.match import MatchArray
+
+            return MatchArray(value, reference_doc=obj._reference_doc)
+
+
+def _drop_pending(obj: 'LazyDocumentData', pending: Dict, name: str):
+    # never mutate in place, shallow copies share the dict
+    rest = {k: v for k, v in pending.items() if k != name}
+    obj.__dict__['_lazy_fields'] = rest
+    if not rest:
+        # all fields are decoded, fall back to plain attribute access
+        obj.__class__ = DocumentData
+
+
+class LazyDocumentData(DocumentData):
+    """A :class:`DocumentData` that keeps some fields in their serialized form until they are accessed.
+
+    The pending fields are stored in ``_lazy_fields`` as ``{name: (raw, decode)}``, the field value is
+    ``decode(raw)``. Once all of them are decoded, the instance becomes a plain :class:`DocumentData`.
+    """
+
+    tensor = _LazyField('tensor')
+    embedding = _LazyField('embedding')
+    tags = _LazyField('tags')
+    _metadata = _LazyField('_metadata')
+    location = _LazyField('location')
+    evaluations = _LazyField('evaluations')
+    scores = _LazyField('scores')
+    chunks = _LazyDocsField('chunks')
+    matches = _LazyDocsField('matches')
+
+    @classmethod
+    def _from_data(
+        cls, data: 'DocumentData', lazy_fields: Dict[str, Tuple[Any, Callable]]
+    ) -> 'LazyDocumentData':
+        data.__class__ = cls
+        data.__dict__['_lazy_fields'] = lazy_fields
+        return data
+
+    def __copy__(self):
+        # keep the pending fields, a shallow copy does not need them decoded
+        r = object.__new__(type(self))
+        r.__dict__.update(self.__dict__)
+        return r
+
+    def __reduce_ex__(self, protocol):
+        # decode everything, the raw messages are not picklable
+        for name in list(self.__dict__.get('_lazy_fields') or ()):
+            getattr(self, name)
+        return object.__reduce_ex__(self, protocol)
+
+    @property
+    def _non_empty_fields(self) -> Tuple[str]:
+        pending = self.__dict__.get('_lazy_fields') or {}
+        r = []
+        for f in fields(self):
+            f_name = f.name
+            if not f_name.startswith('_') or f_name == '_metadata':
+                if f_name in pending or _is_not_empty(f_name, getattr(self, f_name)):
+                    r.append(f_name)
+
+        return tuple(r)
@@ -83,12 +83,23 @@ class PortingMixin:
             raise ValueError(f'protocol=`{protocol}` is not supported')
 
     def to_bytes(
-        self, protocol: str = 'pickle', compress: Optional[str] = None
+        self,
+        protocol: str = 'pickle',
+        compress: Optional[str] = None,
+        tags_codec: str = 'struct',
     ) -> bytes:
+        """Serialize itself into bytes.
+
+        :param protocol: protocol to use
+        :param compress: compress method to use
+        :param tags_codec: `struct` or `msgpack`, how ``tags`` are encoded when protocol is `protobuf`, see
+            :meth:`to_protobuf`
+        :return: the binary serialization in bytes
+        """
         if protocol == 'pickle':
             bstr = pickle.dumps(self)
         elif protocol == 'protobuf':
-            bstr = self.to_protobuf().SerializePartialToString()
+            bstr = self.to_protobuf(tags_codec=tags_codec).SerializePartialToString()
         else:
             raise ValueError(
                 f'protocol={protocol} is not supported. Can be only `protobuf` or pickle protocols 0-5.'
@@ -101,12 +112,14 @@ class PortingMixin:
         data: bytes,
         protocol: str = 'pickle',
         compress: Optional[str] = None,
+        lazy: bool = False,
     ) -> 'T':
         """Build Document object from binary bytes
 
         :param data: binary bytes
         :param protocol: protocol to use
         :param compress: compress method to use
+        :param lazy: if set and protocol is `protobuf`, only the scalar fields are decoded, the others on first access
         :return: a Document object
         """
         bstr = decompress_bytes(data, algorithm=compress)
@@ -117,7 +130,7 @@ class PortingMixin:
 
             pb_msg = DocumentProto()
             pb_msg.ParseFromString(bstr)
-            return cls.from_protobuf(pb_msg)
+            return cls.from_protobuf(pb_msg, lazy=lazy)
         else:
             raise ValueError(
                 f'protocol={protocol} is not supported. Can be only `protobuf` or pickle protocols 0-5.'
@@ -166,9 +179,11 @@ class PortingMixin:
         """
         return cls.from_bytes(base64.b64decode(data), protocol, compress)
 
-    def _to_stream_bytes(self, protocol, compress) -> bytes:
+    def _to_stream_bytes(self, protocol, compress, tags_codec='struct') -> bytes:
         # 4 bytes (uint32)
-        doc_as_bytes = self.to_bytes(protocol=protocol, compress=compress)
+        doc_as_bytes = self.to_bytes(
+            protocol=protocol, compress=compress, tags_codec=tags_codec
+        )
 
         # variable size bytes
         len_doc_as_bytes = len(doc_as_bytes).to_bytes(4, 'big', signed=False)
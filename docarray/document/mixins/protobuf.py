@@ -7,17 +7,44 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class ProtobufMixin:
     @classmethod
-    def from_protobuf(cls: Type['T'], pb_msg: 'DocumentProto') -> 'T':
+    def from_protobuf(
+        cls: Type['T'],
+        pb_msg: 'DocumentProto',
+        writable_ndarrays: bool = False,
+        lazy_ndarrays: bool = False,
+        lazy: bool = False,
+    ) -> 'T':
+        """Build a Document from a Protobuf message.
+
+        :param pb_msg: the protobuf message
+        :param writable_ndarrays: if set, ``tensor`` and ``embedding`` are copied into writable, aligned buffers.
+            Otherwise ``numpy`` and ``torch`` arrays are read-only views of the message.
+        :param lazy_ndarrays: if set, ``tensor`` and ``embedding`` are only decoded when they are accessed. Until then
+            the Document keeps a reference to ``pb_msg``.
+        :param lazy: if set, every field but the scalar ones, e.g. ``chunks``, ``matches``, ``tags`` and ``scores``, is
+            only decoded when it is accessed. Nested Documents are parsed lazily as well.
+        :return: the Document
+        """
         from docarray.proto.io import parse_proto
 
-        return parse_proto(pb_msg)
+        return parse_proto(
+            pb_msg,
+            writable_ndarrays=writable_ndarrays,
+            lazy_ndarrays=lazy_ndarrays,
+            lazy=lazy,
+        )
 
-    def to_protobuf(self, ndarray_type: Optional[str] = None) -> 'DocumentProto':
+    def to_protobuf(
+        self, ndarray_type: Optional[str] = None, tags_codec: str = 'struct'
+    ) -> 'DocumentProto':
         """Convert Document into a Protobuf message.
 
         :param ndarray_type: can be ``list`` or ``numpy``, if set it will force all ndarray-like object to be ``List`` or ``numpy.ndarray``.
+        :param tags_codec: `struct` or `msgpack`. With `msgpack` the ``tags`` are stored as a MessagePack map in
+            ``tags_msgpack`` instead of a ``google.protobuf.Struct``, which is faster and keeps ``int``, ``bool``,
+            ``None`` and ``bytes`` values as they are.
         :return: the protobuf message
         """
         from docarray.proto.io import flush_proto
 
-        return flush_proto(self, ndarray_type)
+        return flush_proto(self, ndarray_type, tags_codec=tags_codec)
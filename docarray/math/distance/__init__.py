@@ -6,6 +6,9 @@ if TYPE_CHECKING:  # pragma: no cover
     from docarray.typing import ArrayType
     import numpy as np
 
+# metrics over int8 scalar-quantized codes, they require the ``scales`` keyword argument
+INT8_METRICS = ('int8_cosine', 'int8_sqeuclidean', 'int8_euclidean')
+
 
 def pdist(
     x_mat: 'ArrayType',
@@ -21,7 +24,11 @@ def pdist(
 
 
 def cdist(
-    x_mat: 'ArrayType', y_mat: 'ArrayType', metric: str, device: str = 'cpu'
+    x_mat: 'ArrayType',
+    y_mat: 'ArrayType',
+    metric: str,
+    device: str = 'cpu',
+    **kwargs,
 ) -> 'np.ndarray':
     """Computes the pairwise distance between each row of X and each row on Y according to `metric`.
     - Let `n_x = x_mat.shape[0]`
@@ -31,6 +38,9 @@ def cdist(
     :param y_mat: numpy or scipy array of ndim 2
     :param metric: string describing the metric type
     :param device: the computational device, can be either `cpu` or `cuda`.
+    :param kwargs: extra keyword arguments passed to the dense numpy implementation of the metric, i.e. ``x_norm``,
+        ``y_norm``, ``normalized`` and ``out``. They are ignored by the other frameworks. The `int8_*` metrics take
+        ``scales`` and ``y_norm``.
     :return: np.ndarray of ndim 2
     """
 
@@ -54,7 +64,7 @@ def cdist(
         elif framework == 'numpy':
             from docarray.math.distance.numpy import cosine
 
-            dists = cosine(x_mat, y_mat)
+            dists = cosine(x_mat, y_mat, **kwargs)
         elif framework == 'tensorflow':
             from docarray.math.distance.tensorflow import cosine
 
@@ -76,7 +86,7 @@ def cdist(
         elif framework == 'numpy':
             from docarray.math.distance.numpy import sqeuclidean
 
-            dists = sqeuclidean(x_mat, y_mat)
+            dists = sqeuclidean(x_mat, y_mat, **kwargs)
         elif framework == 'tensorflow':
             from docarray.math.distance.tensorflow import sqeuclidean
 
@@ -98,7 +108,7 @@ def cdist(
         elif framework == 'numpy':
             from docarray.math.distance.numpy import euclidean
 
-            dists = euclidean(x_mat, y_mat)
+            dists = euclidean(x_mat, y_mat, **kwargs)
         elif framework == 'tensorflow':
             from docarray.math.distance.tensorflow import euclidean
 
@@ -111,6 +121,25 @@ def cdist(
             from docarray.math.distance.paddle import euclidean
 
             dists = euclidean(x_mat, y_mat, device=device)
+    elif metric == 'hamming':
+        if framework == 'numpy':
+            from docarray.math.distance.numpy import hamming
+
+            dists = hamming(x_mat, y_mat)
+        else:
+            raise NotImplementedError(
+                f'metric `{metric}` only supports dense numpy arrays of binary codes'
+            )
+
+    elif metric in INT8_METRICS:
+        if framework == 'numpy':
+            from docarray.math.distance.numpy import int8
+
+            dists = int8(x_mat, y_mat, metric[len('int8_') :], **kwargs)
+        else:
+            raise NotImplementedError(
+                f'metric `{metric}` only supports dense numpy arrays of int8 codes'
+            )
     else:
         raise NotImplementedError(f'metric `{metric}` is not supported')
 
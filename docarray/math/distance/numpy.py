@@ -1,40 +1,107 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 
 if TYPE_CHECKING:  # pragma: no cover
     from docarray.typing import ArrayType
 
+# max number of elements of the temporary denominator in `cosine`
+_DENOMINATOR_BLOCK_SIZE = 1 << 20
 
-def cosine(x_mat: 'np.ndarray', y_mat: 'np.ndarray', eps: float = 1e-7) -> 'np.ndarray':
+
+def row_norms(x_mat: 'np.ndarray') -> 'np.ndarray':
+    """L2 norm of each row in x_mat, without upcasting float32 inputs.
+
+    :param x_mat: np.ndarray with ndim=2
+    :return: np.ndarray with ndim=1
+    """
+    return np.sqrt(np.einsum('ij,ij->i', x_mat, x_mat))
+
+
+def _dot(
+    x_mat: 'np.ndarray', y_mat: 'np.ndarray', out: Optional['np.ndarray']
+) -> 'np.ndarray':
+    # float32 inputs stay float32, integer inputs are computed in float64
+    if out is None:
+        out = np.empty(
+            (x_mat.shape[0], y_mat.shape[0]),
+            dtype=np.result_type(x_mat.dtype, y_mat.dtype, np.float32),
+        )
+    return np.matmul(x_mat, y_mat.T, out=out)
+
+
+def cosine(
+    x_mat: 'np.ndarray',
+    y_mat: 'np.ndarray',
+    eps: float = 1e-7,
+    *,
+    x_norm: Optional['np.ndarray'] = None,
+    y_norm: Optional['np.ndarray'] = None,
+    normalized: bool = False,
+    out: Optional['np.ndarray'] = None,
+) -> 'np.ndarray':
     """Cosine distance between each row in x_mat and each row in y_mat.
 
+    All the intermediate results are computed in place, so the only full-size allocation is the returned matrix.
+
     :param x_mat: np.ndarray with ndim=2
     :param y_mat: np.ndarray with ndim=2
     :param eps: a small jitter to avoid divde by zero
+    :param x_norm: the precomputed L2 norm of each row in x_mat, computed if not given
+    :param y_norm: the precomputed L2 norm of each row in y_mat, computed if not given
+    :param normalized: set it if all rows of x_mat and y_mat are already L2-normalized, norms are then skipped
+    :param out: a float np.ndarray of shape ``(n_x, n_y)`` to write the result into, e.g. to reuse it across calls
     :return: np.ndarray  with ndim=2
     """
-    return 1 - np.clip(
-        (np.dot(x_mat, y_mat.T) + eps)
-        / (
-            np.outer(np.linalg.norm(x_mat, axis=1), np.linalg.norm(y_mat, axis=1)) + eps
-        ),
-        -1,
-        1,
-    )
-
-
-def sqeuclidean(x_mat: 'np.ndarray', y_mat: 'np.ndarray') -> 'np.ndarray':
+    dists = _dot(x_mat, y_mat, out)
+    if not normalized:
+        if x_norm is None:
+            x_norm = row_norms(x_mat)
+        if y_norm is None:
+            y_norm = row_norms(y_mat)
+        dists += eps
+        # divide block by block to bound the size of the temporary denominator
+        block = max(1, _DENOMINATOR_BLOCK_SIZE // max(1, dists.shape[1]))
+        for start in range(0, dists.shape[0], block):
+            denominator = np.multiply.outer(x_norm[start : start + block], y_norm)
+            denominator += eps
+            dists[start : start + block] /= denominator
+    np.clip(dists, -1, 1, out=dists)
+    return np.subtract(1, dists, out=dists)
+
+
+def sqeuclidean(
+    x_mat: 'np.ndarray',
+    y_mat: 'np.ndarray',
+    *,
+    x_norm: Optional['np.ndarray'] = None,
+    y_norm: Optional['np.ndarray'] = None,
+    normalized: bool = False,
+    out: Optional['np.ndarray'] = None,
+) -> 'np.ndarray':
     """Squared Euclidean distance between each row in x_mat and each row in y_mat.
+
     :param x_mat: np.ndarray with ndim=2
     :param y_mat: np.ndarray with ndim=2
+    :param x_norm: the precomputed L2 norm of each row in x_mat, computed if not given
+    :param y_norm: the precomputed L2 norm of each row in y_mat, computed if not given
+    :param normalized: set it if all rows of x_mat and y_mat are already L2-normalized, norms are then skipped
+    :param out: a float np.ndarray of shape ``(n_x, n_y)`` to write the result into, e.g. to reuse it across calls
     :return: np.ndarray with ndim=2
     """
-    return (
-        np.sum(y_mat**2, axis=1)
-        + np.sum(x_mat**2, axis=1)[:, np.newaxis]
-        - 2 * np.dot(x_mat, y_mat.T)
-    )
+    dists = _dot(x_mat, y_mat, out)
+    dists *= -2
+    if normalized:
+        dists += 2
+    else:
+        if x_norm is None:
+            x_norm = row_norms(x_mat)
+        if y_norm is None:
+            y_norm = row_norms(y_mat)
+        dists += np.square(y_norm)
+        dists += np.square(x_norm)[:, np.newaxis]
+    # rounding errors can make the distance of identical rows slightly negative
+    return np.maximum(dists, 0, out=dists)
 
 
 def sparse_cosine(x_mat: 'ArrayType', y_mat: 'ArrayType') -> 'np.ndarray':
@@ -80,11 +147,103 @@ def sparse_euclidean(x_mat: 'ArrayType', y_mat: 'ArrayType') -> 'np.ndarray':
     return np.sqrt(sparse_sqeuclidean(x_mat, y_mat))
 
 
-def euclidean(x_mat: 'ArrayType', y_mat: 'ArrayType') -> 'np.ndarray':
+def euclidean(x_mat: 'ArrayType', y_mat: 'ArrayType', **kwargs) -> 'np.ndarray':
     """Euclidean distance between each row in x_mat and each row in y_mat.
 
     :param x_mat:  scipy.sparse like array with ndim=2
     :param y_mat:  scipy.sparse like array with ndim=2
+    :param kwargs: ``x_norm``, ``y_norm``, ``normalized`` and ``out``, see :func:`sqeuclidean`
     :return: np.ndarray  with ndim=2
     """
-    return np.sqrt(sqeuclidean(x_mat, y_mat))
+    dists = sqeuclidean(x_mat, y_mat, **kwargs)
+    return np.sqrt(dists, out=dists)
+
+
+# above this number of rows in x_mat, hamming distances are computed by a matrix product instead of popcounts
+_HAMMING_POPCOUNT_MAX_ROWS = 2
+
+# number of set bits of every byte value
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1).sum(
+    axis=1, dtype=np.uint8
+)
+
+
+def hamming(x_mat: 'np.ndarray', y_mat: 'np.ndarray') -> 'np.ndarray':
+    """Hamming distance between each row in x_mat and each row in y_mat, both holding bit-packed binary codes.
+
+    :param x_mat: np.ndarray of dtype uint8 with ndim=2, e.g. the output of :func:`docarray.math.quantization.binarize`
+    :param y_mat: np.ndarray of dtype uint8 with ndim=2
+    :return: np.ndarray with ndim=2, the number of differing bits
+    """
+    dists = np.empty((x_mat.shape[0], y_mat.shape[0]), dtype=np.float32)
+    if x_mat.shape[0] <= _HAMMING_POPCOUNT_MAX_ROWS:
+        # popcount block by block to bound the size of the temporary xor
+        block = max(
+            1, _DENOMINATOR_BLOCK_SIZE // max(1, y_mat.shape[0] * y_mat.shape[1])
+        )
+        for start in range(0, x_mat.shape[0], block):
+            xor = np.bitwise_xor(x_mat[start : start + block, np.newaxis], y_mat)
+            dists[start : start + block] = _POPCOUNT[xor].sum(axis=-1, dtype=np.uint32)
+        return dists
+
+    # with more rows, a matrix product of the bits as -1/+1 is faster: the dot product of two rows is the number of
+    # equal bits minus the number of differing bits
+    n_bits = 8 * x_mat.shape[1]
+    x_signs = np.unpackbits(x_mat, axis=1).astype(np.float32)
+    x_signs *= 2
+    x_signs -= 1
+    block = max(1, _DENOMINATOR_BLOCK_SIZE // n_bits)
+    for start in range(0, y_mat.shape[0], block):
+        y_signs = np.unpackbits(y_mat[start : start + block], axis=1).astype(np.float32)
+        y_signs *= 2
+        y_signs -= 1
+        out = dists[:, start : start + block]
+        np.matmul(x_signs, y_signs.T, out=out)
+        out *= -0.5
+        out += n_bits / 2
+    return dists
+
+
+def int8(
+    x_mat: 'np.ndarray',
+    y_mat: 'np.ndarray',
+    metric: str,
+    *,
+    scales: 'np.ndarray',
+    y_norm: Optional['np.ndarray'] = None,
+) -> 'np.ndarray':
+    """Distance between each row in x_mat and each row in y_mat, where y_mat holds int8 scalar-quantized codes.
+
+    ``y_mat`` is de-quantized block by block, so only a small float copy of it exists at any time. ``x_mat`` can be
+    either int8 codes quantized with the same ``scales`` or float vectors, the latter giving asymmetric distances.
+
+    :param x_mat: np.ndarray with ndim=2
+    :param y_mat: np.ndarray of dtype int8 with ndim=2, e.g. the output of :func:`docarray.math.quantization.int8_quantize`
+    :param metric: `cosine`, `sqeuclidean` or `euclidean`
+    :param scales: the per-dimension scales used to quantize y_mat
+    :param y_norm: the precomputed L2 norm of each de-quantized row in y_mat, computed if not given
+    :return: np.ndarray with ndim=2
+    """
+    kernel = {'cosine': cosine, 'sqeuclidean': sqeuclidean, 'euclidean': sqeuclidean}[
+        metric
+    ]
+    scales = np.asarray(scales, dtype=np.float32)
+    if x_mat.dtype == np.int8:
+        x_mat = x_mat * scales
+    x_mat = np.asarray(x_mat, dtype=np.float32)
+    x_norm = row_norms(x_mat)
+
+    dists = np.empty((x_mat.shape[0], y_mat.shape[0]), dtype=np.float32)
+    block = max(1, _DENOMINATOR_BLOCK_SIZE // max(1, y_mat.shape[1]))
+    for start in range(0, y_mat.shape[0], block):
+        end = min(start + block, y_mat.shape[0])
+        kernel(
+            x_mat,
+            y_mat[start:end] * scales,
+            x_norm=x_norm,
+            y_norm=None if y_norm is None else y_norm[start:end],
+            out=dists[:, start:end],
+        )
+    if metric == 'euclidean':
+        np.sqrt(dists, out=dists)
+    return dists
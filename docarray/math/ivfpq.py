@@ -0,0 +1,292 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+SUPPORTED_METRICS = ('cosine', 'euclidean', 'sqeuclidean')
+
+# max number of elements of a temporary distance matrix when assigning vectors to centroids
+_ASSIGN_BLOCK_SIZE = 1 << 22
+
+
+class IVFPQIndex:
+    """An inverted file index with product quantization (IVF-PQ).
+
+    Vectors are assigned to the closest of ``n_clusters`` coarse centroids. The residual of each vector to its centroid
+    is split into ``n_subvectors`` sub-vectors, each of them encoded by the id of its closest centroid in a codebook of
+    ``2 ** n_bits`` entries. A vector is thus stored as ``n_subvectors`` bytes.
+
+    At query time, only the ``nprobe`` inverted lists closest to the query are scanned, and the distances to their
+    vectors are approximated from per-query lookup tables (asymmetric distance computation).
+
+    For `cosine`, vectors are L2-normalized before training and encoding, so that the squared euclidean distance
+    between them ranks as the cosine distance.
+    """
+
+    def __init__(
+        self,
+        n_dim: int,
+        n_clusters: int = 256,
+        n_subvectors: int = 8,
+        n_bits: int = 8,
+        metric: str = 'cosine',
+    ):
+        if metric not in SUPPORTED_METRICS:
+            raise ValueError(
+                f'metric `{metric}` is not supported, must be one of {SUPPORTED_METRICS}'
+            )
+        if n_dim % n_subvectors:
+            raise ValueError(
+                f'`n_dim`={n_dim} must be divisible by `n_subvectors`={n_subvectors}'
+            )
+        if not 1 <= n_bits <= 8:
+            raise ValueError(f'`n_bits` must be between 1 and 8, receiving {n_bits}')
+
+        self.n_dim = n_dim
+        self.n_clusters = n_clusters
+        self.n_subvectors = n_subvectors
+        self.n_bits = n_bits
+        self.metric = metric
+
+        self.centroids = None  # type: Optional[np.ndarray]
+        self.codebooks = None  # type: Optional[np.ndarray]
+        self._list_offsets = None  # type: Optional[np.ndarray]
+        self._codes = None  # type: Optional[np.ndarray]
+        self._labels = None  # type: Optional[np.ndarray]
+        # vectors added since the inverted lists were last built
+        self._pending_assignments = []  # type: List[np.ndarray]
+        self._pending_codes = []  # type: List[np.ndarray]
+        self._pending_labels = []  # type: List[np.ndarray]
+        self._next_label = 0
+
+    @property
+    def is_trained(self) -> bool:
+        """Return True if :meth:`train` was called.
+
+        :return: whether vectors can be added
+        """
+        return self.codebooks is not None
+
+    def __len__(self):
+        return sum(len(labels) for labels in self._pending_labels) + (
+            0 if self._labels is None else len(self._labels)
+        )
+
+    def train(
+        self, x: 'np.ndarray', n_iter: int = 20, random_seed: Optional[int] = None
+    ) -> None:
+        """Learn the coarse centroids and the sub-vector codebooks.
+
+        :param x: the training vectors, ndarray of shape ``(n, n_dim)``, usually a sample of the indexed vectors
+        :param n_iter: the number of k-means iterations
+        :param random_seed: the seed used to initialize k-means
+        """
+        rng = np.random.default_rng(random_seed)
+        x = self._prepare(x)
+
+        self.centroids = _kmeans(x, self.n_clusters, n_iter, rng)
+        residuals = x - self.centroids[_assign(x, self.centroids)]
+
+        sub_dim = self.n_dim // self.n_subvectors
+        codebooks = np.zeros(
+            (self.n_subvectors, 2**self.n_bits, sub_dim), dtype=np.float32
+        )
+        for j in range(self.n_subvectors):
+            codebook = _kmeans(
+                residuals[:, j * sub_dim : (j + 1) * sub_dim],
+                2**self.n_bits,
+                n_iter,
+                rng,
+            )
+            codebooks[j, : len(codebook)] = codebook
+            # pad small training sets with copies so that every code maps to a centroid
+            codebooks[j, len(codebook) :] = codebook[0]
+        self.codebooks = codebooks
+
+    def add(self, x: 'np.ndarray', labels: Optional['np.ndarray'] = None) -> None:
+        """Encode vectors and append them to the inverted lists.
+
+        :param x: ndarray of shape ``(n, n_dim)``
+        :param labels: the labels returned by :meth:`search` for these vectors, they must not be in the index yet. If
+            not given, labels are assigned in order, i.e. the label of a vector is the number of vectors added before it.
+        """
+        if not self.is_trained:
+            raise ValueError('the index must be trained before adding vectors')
+
+        x = self._prepare(x)
+        if labels is None:
+            labels = np.arange(self._next_label, self._next_label + len(x))
+        else:
+            labels = np.asarray(labels, dtype=np.int64)
+            if labels.shape != (len(x),):
+                raise ValueError(
+                    f'expected {len(x)} labels, but got shape {labels.shape}'
+                )
+        if len(labels):
+            self._next_label = max(self._next_label, int(labels.max()) + 1)
+
+        assignments = _assign(x, self.centroids)
+        self._pending_assignments.append(assignments)
+        self._pending_codes.append(self._encode(x - self.centroids[assignments]))
+        self._pending_labels.append(labels)
+
+    def remove(self, labels: 'np.ndarray') -> None:
+        """Remove vectors from the inverted lists, the other vectors are not re-encoded.
+
+        :param labels: the labels of the vectors, labels that are not in the index are ignored
+        """
+        self._build_lists()
+        if self._labels is None or not len(labels):
+            return
+
+        keep = ~np.isin(self._labels, labels)
+        if keep.all():
+            return
+        cluster_ids = np.repeat(
+            np.arange(len(self.centroids)), np.diff(self._list_offsets)
+        )
+        self._labels = self._labels[keep]
+        self._codes = self._codes[keep]
+        self._list_offsets = _list_offsets(cluster_ids[keep], len(self.centroids))
+
+    def reset(self) -> None:
+        """Remove all the vectors, but keep the trained centroids and codebooks."""
+        self._list_offsets = self._codes = self._labels = None
+        self._clear_pending()
+        self._next_label = 0
+
+    def _build_lists(self) -> None:
+        if not self._pending_codes:
+            return
+
+        assignments = self._pending_assignments
+        codes = self._pending_codes
+        labels = self._pending_labels
+        if self._labels is not None:
+            # the current lists are merged with the pending vectors, their codes are kept as they are
+            cluster_ids = np.repeat(
+                np.arange(len(self.centroids)), np.diff(self._list_offsets)
+            )
+            assignments = [cluster_ids] + assignments
+            codes = [self._codes] + codes
+            labels = [self._labels] + labels
+        assignments = np.concatenate(assignments)
+
+        order = np.argsort(assignments, kind='stable')
+        self._labels = np.concatenate(labels)[order]
+        self._codes = np.concatenate(codes)[order]
+        self._list_offsets = _list_offsets(assignments, len(self.centroids))
+        self._clear_pending()
+
+    def _clear_pending(self) -> None:
+        self._pending_assignments = []
+        self._pending_codes = []
+        self._pending_labels = []
+
+    def search(
+        self, query: 'np.ndarray', limit: int, nprobe: int = 8
+    ) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Find approximate nearest neighbors of a single query.
+
+        If the ``nprobe`` closest inverted lists hold less than ``limit`` vectors, the following lists are scanned as
+        well, so that ``min(limit, len(self))`` results are always returned.
+
+        :param query: a 1-D array of dimension ``n_dim``
+        :param limit: the number of neighbors to return
+        :param nprobe: the number of inverted lists to scan
+        :return: approximate squared euclidean distances and labels, sorted by distance
+        """
+        self._build_lists()
+        query = self._prepare(query.reshape(1, -1))[0]
+        limit = min(limit, len(self))
+        if limit <= 0:
+            return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64)
+
+        coarse = np.einsum('ij,ij->i', self.centroids - query, self.centroids - query)
+        probes = np.argsort(coarse)
+        sizes = np.diff(self._list_offsets)[probes]
+        n_probes = max(nprobe, int(np.searchsorted(np.cumsum(sizes), limit)) + 1)
+        probes = probes[: min(n_probes, len(probes))]
+
+        dists, labels = [], []
+        sub_dim = self.n_dim // self.n_subvectors
+        sub_range = np.arange(self.n_subvectors)
+        for c in probes.tolist():
+            start, end = self._list_offsets[c], self._list_offsets[c + 1]
+            if start == end:
+                continue
+            residual = (query - self.centroids[c]).reshape(
+                self.n_subvectors, 1, sub_dim
+            )
+            # lookup table of shape (n_subvectors, 2 ** n_bits)
+            table = np.sum(np.square(self.codebooks - residual), axis=-1)
+            dists.append(table[sub_range, self._codes[start:end]].sum(axis=1))
+            labels.append(self._labels[start:end])
+
+        dists = np.concatenate(dists)
+        labels = np.concatenate(labels)
+        if limit < len(dists):
+            top = np.argpartition(dists, limit)[:limit]
+            dists, labels = dists[top], labels[top]
+        order = np.argsort(dists)
+        return dists[order], labels[order]
+
+    def _prepare(self, x: 'np.ndarray') -> 'np.ndarray':
+        x = np.asarray(x, dtype=np.float32)
+        if x.ndim != 2 or x.shape[1] != self.n_dim:
+            raise ValueError(
+                f'expected vectors of dimension {self.n_dim}, but got shape {x.shape}'
+            )
+        if self.metric == 'cosine':
+            norms = np.linalg.norm(x, axis=1, keepdims=True)
+            x = x / np.where(norms > 0, norms, 1)
+        return x
+
+    def _encode(self, residuals: 'np.ndarray') -> 'np.ndarray':
+        sub_dim = self.n_dim // self.n_subvectors
+        codes = np.empty((len(residuals), self.n_subvectors), dtype=np.uint8)
+        for j in range(self.n_subvectors):
+            codes[:, j] = _assign(
+                residuals[:, j * sub_dim : (j + 1) * sub_dim], self.codebooks[j]
+            )
+        return codes
+
+
+def _list_offsets(assignments: 'np.ndarray', n_clusters: int) -> 'np.ndarray':
+    # start of each inverted list in the codes sorted by cluster, followed by the total size
+    return np.concatenate(
+        ([0], np.cumsum(np.bincount(assignments, minlength=n_clusters)))
+    )
+
+
+def _assign(x: 'np.ndarray', centroids: 'np.ndarray') -> 'np.ndarray':
+    # index of the closest centroid of each row, computed block by block to bound memory
+    sq_norms = np.einsum('ij,ij->i', centroids, centroids)
+    block = max(1, _ASSIGN_BLOCK_SIZE // len(centroids))
+    assignments = np.empty(len(x), dtype=np.int64)
+    for start in range(0, len(x), block):
+        dists = x[start : start + block] @ centroids.T
+        dists *= -2
+        dists += sq_norms
+        assignments[start : start + block] = np.argmin(dists, axis=1)
+    return assignments
+
+
+def _kmeans(
+    x: 'np.ndarray', k: int, n_iter: int, rng: 'np.random.Generator'
+) -> 'np.ndarray':
+    k = min(k, len(x))
+    centroids = x[rng.choice(len(x), k, replace=False)].copy()
+    for _ in range(n_iter):
+        assignments = _assign(x, centroids)
+        counts = np.bincount(assignments, minlength=k)
+        order = np.argsort(assignments, kind='stable')
+        non_empty = counts > 0
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[non_empty]
+        centroids[non_empty] = (
+            np.add.reduceat(x[order], starts, axis=0) / counts[non_empty, np.newaxis]
+        )
+        # re-seed empty clusters with random vectors
+        n_empty = int((~non_empty).sum())
+        if n_empty:
+            centroids[~non_empty] = x[rng.choice(len(x), n_empty, replace=False)]
+    return centroids
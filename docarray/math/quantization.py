@@ -0,0 +1,41 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def int8_scales(x_mat: 'np.ndarray') -> 'np.ndarray':
+    """Per-dimension scales mapping the range of each column of x_mat to ``[-127, 127]``.
+
+    :param x_mat: np.ndarray with ndim=2
+    :return: np.ndarray of dtype float32 with ndim=1
+    """
+    scales = np.max(np.abs(x_mat), axis=0).astype(np.float32) / 127
+    return np.where(scales > 0, scales, 1).astype(np.float32)
+
+
+def int8_quantize(
+    x_mat: 'np.ndarray', scales: Optional['np.ndarray'] = None
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Scalar-quantize every value of x_mat to one signed byte.
+
+    :param x_mat: np.ndarray with ndim=2
+    :param scales: the per-dimension scales, computed from x_mat with :func:`int8_scales` if not given
+    :return: the int8 codes and the scales, ``codes * scales`` approximates x_mat
+    """
+    if scales is None:
+        scales = int8_scales(x_mat)
+    codes = np.rint(x_mat / scales)
+    np.clip(codes, -127, 127, out=codes)
+    return codes.astype(np.int8), scales
+
+
+def binarize(x_mat: 'np.ndarray') -> 'np.ndarray':
+    """Encode every value of x_mat by its sign bit, packed 8 values per byte.
+
+    The hamming distance between two codes, see :func:`docarray.math.distance.numpy.hamming`, approximates the angle
+    between the original vectors.
+
+    :param x_mat: np.ndarray with ndim=2
+    :return: np.ndarray of dtype uint8 and shape ``(n, ceil(n_dim / 8))``
+    """
+    return np.packbits(np.asarray(x_mat) > 0, axis=-1)
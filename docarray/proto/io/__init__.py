@@ -1,46 +1,167 @@
 from collections import defaultdict
-from typing import TYPE_CHECKING, Optional
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Sequence
 
 from google.protobuf.json_format import MessageToDict
 from google.protobuf.struct_pb2 import Struct
 
 from docarray.proto.io.ndarray import flush_ndarray, read_ndarray
+from docarray.proto.io.tags import check_tags_codec, decode_tags, encode_tags
 from docarray.proto.docarray_pb2 import NdArrayProto, DocumentProto
 
 if TYPE_CHECKING:  # pragma: no cover
     from docarray import Document
 
 
-def parse_proto(pb_msg: 'DocumentProto') -> 'Document':
+# the fields that are kept in the message until first access when parsing lazily
+_LAZY_FIELDS = (
+    'tensor',
+    'embedding',
+    'tags',
+    '_metadata',
+    'location',
+    'evaluations',
+    'scores',
+    'chunks',
+    'matches',
+)
+
+
+def parse_proto(
+    pb_msg: 'DocumentProto',
+    writable_ndarrays: bool = False,
+    lazy_ndarrays: bool = False,
+    lazy: bool = False,
+) -> 'Document':
+    """Build a Document from a protobuf message.
+
+    :param pb_msg: the protobuf message
+    :param writable_ndarrays: if set, ``tensor`` and ``embedding`` are decoded into writable buffers instead of
+        read-only views of the message
+    :param lazy_ndarrays: if set, ``tensor`` and ``embedding`` are decoded on first access. Until then the Document
+        refers to ``pb_msg``.
+    :param lazy: if set, all fields but the scalar ones are decoded on first access, including ``chunks``,
+        ``matches`` and ``tags``. Nested Documents are parsed lazily as well.
+    :return: the Document
+    """
     from docarray import Document
-    from docarray.score import NamedScore
+    from docarray.document.data import LazyDocumentData
+
+    if lazy:
+        lazy_names = _LAZY_FIELDS
+    elif lazy_ndarrays:
+        lazy_names = ('tensor', 'embedding')
+    else:
+        lazy_names = ()
 
     fields = {}
+    lazy_fields = {}
     for (field, value) in pb_msg.ListFields():
         f_name = field.name
-        if f_name == 'chunks' or f_name == 'matches':
-            fields[f_name] = [Document.from_protobuf(d) for d in value]
-        elif isinstance(value, NdArrayProto):
-            fields[f_name] = read_ndarray(value)
-        elif isinstance(value, Struct):
-            fields[f_name] = MessageToDict(value, preserving_proto_field_name=True)
-        elif f_name == 'location':
-            fields[f_name] = list(value)
-        elif f_name == 'scores' or f_name == 'evaluations':
-            fields[f_name] = defaultdict(NamedScore)
-            for k, v in value.items():
-                fields[f_name][k] = NamedScore(
-                    {ff.name: vv for (ff, vv) in v.ListFields()}
-                )
+        key = 'tags' if f_name == 'tags_msgpack' else f_name
+        if key in lazy_names:
+            if isinstance(value, Struct) and not value.fields:
+                continue
+            lazy_fields[key] = (
+                pb_msg,
+                partial(
+                    _read_lazy_field,
+                    f_name=f_name,
+                    writable_ndarrays=writable_ndarrays,
+                    lazy_ndarrays=lazy_ndarrays,
+                    lazy=lazy,
+                ),
+            )
         else:
-            fields[f_name] = value
-    return Document(**fields)
+            fields[key] = _read_field(
+                f_name, value, writable_ndarrays, lazy_ndarrays, lazy
+            )
+    d = Document(**fields)
+    if lazy_fields:
+        LazyDocumentData._from_data(d._data, lazy_fields)
+    return d
+
+
+def _read_field(
+    f_name: str, value, writable_ndarrays: bool, lazy_ndarrays: bool, lazy: bool
+):
+    from docarray import Document
+    from docarray.score import NamedScore
+
+    if f_name == 'chunks' or f_name == 'matches':
+        return [
+            Document.from_protobuf(
+                d,
+                writable_ndarrays=writable_ndarrays,
+                lazy_ndarrays=lazy_ndarrays,
+                lazy=lazy,
+            )
+            for d in value
+        ]
+    elif isinstance(value, NdArrayProto):
+        return read_ndarray(value, writable=writable_ndarrays)
+    elif isinstance(value, Struct):
+        return MessageToDict(value, preserving_proto_field_name=True)
+    elif f_name == 'tags_msgpack':
+        return decode_tags(value)
+    elif f_name == 'location':
+        return list(value)
+    elif f_name == 'scores' or f_name == 'evaluations':
+        scores = defaultdict(NamedScore)
+        for k, v in value.items():
+            scores[k] = NamedScore({ff.name: vv for (ff, vv) in v.ListFields()})
+        return scores
+    else:
+        return value
+
+
+def _read_lazy_field(pb_msg: 'DocumentProto', f_name: str, **kwargs):
+    return _read_field(f_name, getattr(pb_msg, f_name), **kwargs)
+
+
+def _can_copy_field(
+    source: 'DocumentProto', key: str, ndarray_type: Optional[str], tags_codec: str
+) -> bool:
+    if key == 'tags':
+        return bool(source.tags_msgpack) == (tags_codec == 'msgpack')
+    elif key in ('chunks', 'matches'):
+        return ndarray_type is None and tags_codec == 'struct'
+    elif key in ('tensor', 'embedding'):
+        return ndarray_type is None
+    return True
+
+
+def _copy_field(pb_msg: 'DocumentProto', source: 'DocumentProto', key: str):
+    if key in ('chunks', 'matches', 'location'):
+        getattr(pb_msg, key).extend(getattr(source, key))
+    elif key in ('scores', 'evaluations'):
+        for k, v in getattr(source, key).items():
+            getattr(pb_msg, key)[k].CopyFrom(v)
+    elif key == 'tags' and source.tags_msgpack:
+        pb_msg.tags_msgpack = source.tags_msgpack
+    else:
+        getattr(pb_msg, key).CopyFrom(getattr(source, key))
 
 
-def flush_proto(doc: 'Document', ndarray_type: Optional[str] = None) -> 'DocumentProto':
+def flush_proto(
+    doc: 'Document',
+    ndarray_type: Optional[str] = None,
+    exclude_fields: Sequence[str] = (),
+    tags_codec: str = 'struct',
+) -> 'DocumentProto':
+    check_tags_codec(tags_codec)
     pb_msg = DocumentProto()
+    pending = getattr(doc._data, '_lazy_fields', None) or {}
     for key in doc.non_empty_fields:
+        if key in exclude_fields:
+            continue
         try:
+            if key in pending and _can_copy_field(
+                pending[key][0], key, ndarray_type, tags_codec
+            ):
+                # not decoded yet, copy it as is
+                _copy_field(pb_msg, pending[key][0], key)
+                continue
             value = getattr(doc, key)
             if key in ('tensor', 'embedding'):
                 flush_ndarray(getattr(pb_msg, key), value, ndarray_type=ndarray_type)
@@ -48,9 +169,12 @@ def flush_proto(doc: 'Document', ndarray_type: Optional[str] = None) -> 'Documen
                 for d in value:
                     d: Document
                     docs = getattr(pb_msg, key)
-                    docs.append(d.to_protobuf())
+                    docs.append(d.to_protobuf(tags_codec=tags_codec))
             elif key == 'tags':
-                pb_msg.tags.update(value)
+                if tags_codec == 'msgpack':
+                    pb_msg.tags_msgpack = encode_tags(value)
+                else:
+                    pb_msg.tags.update(value)
             elif key == '_metadata':
                 pb_msg._metadata.update(value)
             elif key in ('scores', 'evaluations'):
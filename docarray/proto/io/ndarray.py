@@ -1,31 +1,49 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from docarray.math.ndarray import get_array_type, to_numpy_array
 
 if TYPE_CHECKING:  # pragma: no cover
+    from docarray import Document
     from docarray.typing import ArrayType
-    from docarray.proto.docarray_pb2 import NdArrayProto
+    from docarray.proto.docarray_pb2 import NdArrayProto, PackedNdArrayProto
 
+# the `cls_name` of the dense frameworks that can be packed into a single array
+_PACKABLE_CLS_NAMES = {
+    'numpy': 'numpy',
+    'python': 'list',
+    'torch': 'torch',
+    'tensorflow': 'tensorflow',
+    'paddle': 'paddle',
+}
 
-def read_ndarray(pb_msg: 'NdArrayProto') -> 'ArrayType':
+_BUFFER_ALIGNMENT = 64
+
+
+def read_ndarray(pb_msg: 'NdArrayProto', writable: bool = False) -> 'ArrayType':
+    """Read an ndarray-like object from a protobuf message.
+
+    :param pb_msg: the protobuf message
+    :param writable: if set, dense values are copied into writable, 64-byte aligned buffers. Otherwise ``numpy`` and
+        ``torch`` arrays are read-only views of the message buffer.
+    :return: the ndarray-like object
+    """
     is_sparse = pb_msg.WhichOneof('content') == 'sparse'
     framework = pb_msg.cls_name
 
     if is_sparse:
         if framework == 'scipy':
-            idx, val, shape = _get_raw_sparse_array(pb_msg)
+            idx, val, shape = _get_raw_sparse_array(pb_msg, writable)
+            sp_format = pb_msg.parameters['sparse_format']
+            if sp_format in ('csr', 'csc'):
+                return _get_scipy_compressed(idx, val, shape, sp_format)
+
             from scipy.sparse import coo_matrix
 
             x = coo_matrix((val, idx.T), shape=shape)
-            sp_format = pb_msg.parameters['sparse_format']
             if sp_format == 'bsr':
                 return x.tobsr()
-            elif sp_format == 'csc':
-                return x.tocsc()
-            elif sp_format == 'csr':
-                return x.tocsr()
             elif sp_format == 'coo':
                 return x
         elif framework == 'tensorflow':
@@ -40,7 +58,7 @@ def read_ndarray(pb_msg: 'NdArrayProto') -> 'ArrayType':
             return sparse_coo_tensor(idx, val, shape)
     else:
         if framework in {'numpy', 'torch', 'paddle', 'tensorflow', 'list'}:
-            x = _get_dense_array(pb_msg.dense)
+            x = _get_dense_array(pb_msg.dense, writable)
             return _to_framework_array(x, framework)
 
 
@@ -88,6 +106,75 @@ def flush_ndarray(
                 _set_dense_array(pb_msg.dense, value.numpy())
 
 
+def flush_packed_ndarray(
+    pb_msg: 'PackedNdArrayProto',
+    field: str,
+    docs: Sequence['Document'],
+    ndarray_type: Optional[str] = None,
+) -> bool:
+    """Pack the ``field`` ndarrays of ``docs`` into a single dense array.
+
+    The ids of the Documents are written only if some of them have no value. Nothing is written unless all the non-empty values are dense, of the same framework, shape and dtype, and there are
+    at least two of them.
+
+    :param pb_msg: the message to write into
+    :param field: the name of the ndarray field, e.g. ``embedding``
+    :param docs: the Documents
+    :param ndarray_type: can be ``list`` or ``numpy``, if set it will force the rows to ``List`` or ``numpy.ndarray``
+        on decoding
+    :return: True if the values were packed
+    """
+    ids, rows, cls_name = [], [], None
+    for d in docs:
+        value = getattr(d._data, field)
+        if value is None:
+            continue
+        framework, is_sparse = get_array_type(value)
+        if is_sparse or framework not in _PACKABLE_CLS_NAMES:
+            return False
+        if cls_name is None:
+            cls_name = _PACKABLE_CLS_NAMES[framework]
+        elif cls_name != _PACKABLE_CLS_NAMES[framework]:
+            return False
+
+        if framework == 'torch':
+            value = value.detach().cpu().numpy()
+        else:
+            value = to_numpy_array(value)
+        if value.dtype.hasobject or (
+            rows and (value.shape != rows[0].shape or value.dtype != rows[0].dtype)
+        ):
+            return False
+        ids.append(d.id)
+        rows.append(value)
+
+    if len(rows) < 2:
+        return False
+
+    pb_msg.field = field
+    if len(ids) < len(docs):
+        pb_msg.ids.extend(ids)
+    pb_msg.rows.cls_name = ndarray_type or cls_name
+    _set_dense_array(pb_msg.rows.dense, np.stack(rows))
+    return True
+
+
+def read_packed_ndarray(
+    pb_msg: 'PackedNdArrayProto', writable: bool = False
+) -> Tuple[str, List[str], List['ArrayType']]:
+    """Unpack the rows written by :func:`flush_packed_ndarray`.
+
+    The rows of ``numpy`` and ``torch`` arrays are views of a single array read from the message buffer without copy.
+
+    :param pb_msg: the packed message
+    :param writable: if set, the rows are views of a single writable copy of the message buffer
+    :return: the field name, the Document ids and their values. The ids are empty if all Documents have a value.
+    """
+    dense = pb_msg.rows.dense
+    rows = _to_framework_array(_get_dense_array(dense, writable), pb_msg.rows.cls_name)
+    return pb_msg.field, list(pb_msg.ids), [rows[i] for i in range(dense.shape[0])]
+
+
 def _set_dense_array(pb_msg, value):
     pb_msg.buffer = value.tobytes()
     pb_msg.ClearField('shape')
@@ -121,21 +208,57 @@ def _set_torch_sparse(pb_msg, value):
     pb_msg.cls_name = 'torch'
 
 
-def _get_raw_sparse_array(pb_msg):
-    idx = _get_dense_array(pb_msg.sparse.indices)
-    val = _get_dense_array(pb_msg.sparse.values)
+def _get_raw_sparse_array(pb_msg, writable: bool = False):
+    idx = _get_dense_array(pb_msg.sparse.indices, writable)
+    val = _get_dense_array(pb_msg.sparse.values, writable)
     shape = list(pb_msg.sparse.shape)
     return idx, val, shape
 
 
-def _get_dense_array(source):
+def _get_scipy_compressed(idx, val, shape, sp_format):
+    """Build a CSR or CSC matrix directly from the ``(row, col)`` indices, without a COO intermediate."""
+    from scipy.sparse import csc_matrix, csr_matrix
+
+    axis = 0 if sp_format == 'csr' else 1
+    n_major = shape[axis]
+    if val is None:
+        idx, val = np.zeros((0, 2), dtype=np.int64), np.zeros(0)
+    else:
+        idx = idx.astype(np.int64, copy=False)
+    major, minor = idx[:, axis], idx[:, 1 - axis]
+    if major.size and np.any(major[1:] < major[:-1]):
+        # entries written from a CSR (CSC) matrix are already sorted by row (column)
+        order = np.argsort(major, kind='stable')
+        major, minor, val = major[order], minor[order], val[order]
+    elif not val.flags.writeable:
+        val = val.copy()
+
+    indptr = np.zeros(n_major + 1, dtype=np.int64)
+    np.cumsum(np.bincount(major, minlength=n_major), out=indptr[1:])
+    cls = csr_matrix if sp_format == 'csr' else csc_matrix
+    return cls((val, np.ascontiguousarray(minor), indptr), shape=shape)
+
+
+def _get_dense_array(source, writable: bool = False):
     if source.buffer:
         x = np.frombuffer(source.buffer, dtype=source.dtype)
-        return x.reshape(source.shape)
+        x = x.reshape(source.shape)
+        if writable:
+            out = _get_aligned_buffer(x.nbytes).view(x.dtype).reshape(x.shape)
+            np.copyto(out, x)
+            return out
+        return x
     elif len(source.shape) > 0:
         return np.zeros(source.shape)
 
 
+def _get_aligned_buffer(nbytes: int) -> 'np.ndarray':
+    # each array owns its buffer, so that it is freed with the array
+    buf = np.empty(nbytes + _BUFFER_ALIGNMENT, dtype=np.uint8)
+    start = -buf.ctypes.data % _BUFFER_ALIGNMENT
+    return buf[start : start + nbytes]
+
+
 def _to_framework_array(x, framework):
     if framework == 'numpy':
         return x
@@ -0,0 +1,53 @@
+"""A MessagePack codec for the ``tags`` of a Document.
+
+Unlike ``google.protobuf.Struct`` it keeps ``int``, ``bool``, ``None`` and ``bytes`` values as they are. It needs the
+``msgpack`` package, which is only imported when the codec is used.
+"""
+
+from typing import Any, Dict
+
+import numpy as np
+
+_TAGS_CODECS = ('struct', 'msgpack')
+
+
+def check_tags_codec(tags_codec: str) -> None:
+    if tags_codec not in _TAGS_CODECS:
+        raise ValueError(
+            f'tags_codec={tags_codec} is not supported. Can be only `struct` or `msgpack`.'
+        )
+
+
+def encode_tags(value: Dict[str, Any]) -> bytes:
+    """Encode a ``dict`` as a MessagePack map.
+
+    :param value: the tags, the values can be ``dict``, ``list``, ``tuple``, ``str``, ``bytes``, ``int``, ``float``,
+        ``bool``, ``None`` or numpy scalars
+    :return: the encoded bytes
+    """
+    return _import_msgpack().packb(value, use_bin_type=True, default=_to_builtin)
+
+
+def decode_tags(data: bytes) -> Dict[str, Any]:
+    """Decode the bytes written by :func:`encode_tags`.
+
+    :param data: the encoded bytes
+    :return: the tags
+    """
+    return _import_msgpack().unpackb(data, raw=False, strict_map_key=False)
+
+
+def _import_msgpack():
+    try:
+        import msgpack
+    except ImportError as ex:
+        raise ImportError(
+            '`tags_codec=\'msgpack\'` requires `msgpack`. You can install it via `pip install msgpack`.'
+        ) from ex
+    return msgpack
+
+
+def _to_builtin(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f'Unexpected type {type(obj)} in tags')
@@ -0,0 +1,56 @@
+import argparse
+from time import perf_counter
+
+from docarray import Document, DocumentArray
+
+
+def get_docs(n_docs: int, n_tags: int) -> DocumentArray:
+    return DocumentArray(
+        Document(
+            text=f'doc {i}',
+            tags={
+                **{f'int_{j}': i * j for j in range(n_tags // 3)},
+                **{f'float_{j}': i / (j + 1) for j in range(n_tags // 3)},
+                **{f'str_{j}': f'value {i} {j}' for j in range(n_tags // 3)},
+                'nested': {'list': list(range(10)), 'flag': True},
+            },
+        )
+        for i in range(n_docs)
+    )
+
+
+def timeit(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Benchmark the `struct` and `msgpack` codecs of Document tags'
+    )
+    parser.add_argument('--n-docs', type=int, default=10_000)
+    parser.add_argument('--n-tags', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    docs = get_docs(args.n_docs, args.n_tags)
+    print(f'{args.n_docs} Documents with {args.n_tags + 1} tags each')
+    print(f'{"codec":<10}{"encode (s)":>12}{"decode (s)":>12}{"size (MB)":>12}')
+    results = {}
+    for codec in ('struct', 'msgpack'):
+        data = docs.to_bytes(protocol='protobuf', tags_codec=codec)
+        t_encode = timeit(
+            lambda: docs.to_bytes(protocol='protobuf', tags_codec=codec), args.repeat
+        )
+        t_decode = timeit(
+            lambda: DocumentArray.from_bytes(data, protocol='protobuf'), args.repeat
+        )
+        results[codec] = (t_encode, t_decode)
+        print(f'{codec:<10}{t_encode:>12.3f}{t_decode:>12.3f}{len(data) / 1e6:>12.2f}')
+
+    (se, sd), (me, md) = results['struct'], results['msgpack']
+    print(f'speedup: encode {se / me:.1f}x, decode {sd / md:.1f}x')
@@ -65,6 +65,7 @@ setup(
             'fastapi',
             'uvicorn',
             'strawberry-graphql',
+            'msgpack',
         ],
         'qdrant': [
             'qdrant-client~=0.10.3',
@@ -5,6 +5,7 @@ from docarray import DocumentArray
 from docarray.array.qdrant import DocumentArrayQdrant
 from docarray.array.sqlite import DocumentArraySqlite
 from docarray.array.annlite import DocumentArrayAnnlite, AnnliteConfig
+from docarray.array.hnsw import DocumentArrayHnsw, HnswConfig
 from docarray.array.storage.qdrant import QdrantConfig
 from docarray.array.storage.weaviate import WeaviateConfig
 from docarray.array.weaviate import DocumentArrayWeaviate
@@ -19,6 +20,7 @@ from docarray.array.milvus import DocumentArrayMilvus, MilvusConfig
         DocumentArray,
         DocumentArraySqlite,
         DocumentArrayAnnlite,
+        DocumentArrayHnsw,
         DocumentArrayWeaviate,
         DocumentArrayQdrant,
         DocumentArrayElastic,
@@ -32,6 +34,7 @@ from docarray.array.milvus import DocumentArrayMilvus, MilvusConfig
 def test_content_empty_getter_return_none(cls, content_attr, start_storage):
     if cls in [
         DocumentArrayAnnlite,
+        DocumentArrayHnsw,
         DocumentArrayWeaviate,
         DocumentArrayQdrant,
         DocumentArrayElastic,
@@ -50,6 +53,7 @@ def test_content_empty_getter_return_none(cls, content_attr, start_storage):
         DocumentArray,
         DocumentArraySqlite,
         DocumentArrayAnnlite,
+        DocumentArrayHnsw,
         DocumentArrayWeaviate,
         DocumentArrayQdrant,
         DocumentArrayElastic,
@@ -70,6 +74,7 @@ def test_content_empty_getter_return_none(cls, content_attr, start_storage):
 def test_content_empty_setter(cls, content_attr, start_storage):
     if cls in [
         DocumentArrayAnnlite,
+        DocumentArrayHnsw,
         DocumentArrayWeaviate,
         DocumentArrayQdrant,
         DocumentArrayElastic,
@@ -89,6 +94,7 @@ def test_content_empty_setter(cls, content_attr, start_storage):
         (DocumentArray, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=128)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=128)),
         (DocumentArrayWeaviate, WeaviateConfig(n_dim=128)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=128)),
         (DocumentArrayElastic, ElasticConfig(n_dim=128)),
@@ -125,6 +131,7 @@ def test_content_getter_setter(cls, content_attr, config, start_storage):
         (DocumentArray, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=128)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=128)),
         (DocumentArrayWeaviate, WeaviateConfig(n_dim=128)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=128)),
         (DocumentArrayElastic, ElasticConfig(n_dim=128)),
@@ -164,6 +171,7 @@ def test_content_empty(da_len, da_cls, config, start_storage):
         (DocumentArray, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=5)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=5)),
         (DocumentArrayWeaviate, WeaviateConfig(n_dim=5)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=5)),
         (DocumentArrayElastic, ElasticConfig(n_dim=5)),
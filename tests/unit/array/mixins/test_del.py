@@ -115,6 +115,7 @@ def test_del_da_attribute():
         ('memory', None),
         ('weaviate', {'n_dim': 3, 'distance': 'l2-squared'}),
         ('annlite', {'n_dim': 3, 'metric': 'Euclidean'}),
+        ('hnsw', {'n_dim': 3, 'metric': 'euclidean'}),
         ('qdrant', {'n_dim': 3, 'distance': 'euclidean'}),
         ('elasticsearch', {'n_dim': 3, 'distance': 'l2_norm'}),
         ('sqlite', dict()),
@@ -25,12 +25,314 @@ def test_customize_metric_fn():
     assert list(reversed(r1)) == r2
 
 
+@pytest.mark.parametrize('storage', ['memory', 'sqlite'])
+@pytest.mark.parametrize('metric', ['cosine', 'euclidean', 'sqeuclidean'])
+@pytest.mark.parametrize('normalization', [None, (0, 1)])
+@pytest.mark.parametrize('num_worker', [2, 3, 100, None])
+def test_find_sharded(storage, metric, normalization, num_worker):
+    da = DocumentArray(storage=storage)
+    da.extend(Document(embedding=np.random.random(16)) for _ in range(50))
+    query = np.random.random((7, 16))
+
+    expected = da.find(query, metric=metric, limit=5, normalization=normalization)
+    result = da.find(
+        query,
+        metric=metric,
+        limit=5,
+        normalization=normalization,
+        num_worker=num_worker,
+    )
+    for r, e in zip(result, expected):
+        assert r[:, 'id'] == e[:, 'id']
+        np.testing.assert_allclose(
+            r[:, f'scores__{metric}__value'], e[:, f'scores__{metric}__value']
+        )
+
+
+def test_find_sharded_reuses_shards_and_pool(monkeypatch):
+    from docarray.array.mixins import parallel
+
+    da = DocumentArray(Document(embedding=np.random.random(16)) for _ in range(5))
+    query = np.random.random((2, 16))
+    da.find(query, num_worker=8)
+    cache = da._get_embeddings_cache()
+    shards = cache.shards(8, True)
+    assert len(shards) == 5
+    n_pools = len(parallel._MANAGED_POOLS)
+
+    da.find(query, num_worker=8)
+    assert da._get_embeddings_cache().shards(8, True) is shards
+    assert len(parallel._MANAGED_POOLS) == n_pools
+    assert parallel.get_managed_pool('thread', 8) is not None
+
+
+def test_find_sharded_sparse():
+    import scipy.sparse as sp
+
+    da = DocumentArray(
+        Document(embedding=sp.coo_matrix(np.random.random((1, 8)))) for _ in range(10)
+    )
+    query = sp.coo_matrix(np.random.random((2, 8)))
+    expected = da.find(query, metric='euclidean', limit=3)
+    result = da.find(query, metric='euclidean', limit=3, num_worker=2)
+    for r, e in zip(result, expected):
+        assert r[:, 'id'] == e[:, 'id']
+
+
+@pytest.mark.parametrize('storage', ['memory', 'sqlite'])
+def test_find_shallow_copy(storage):
+    da = DocumentArray(storage=storage)
+    da.extend(
+        Document(
+            embedding=np.random.random(8),
+            tensor=np.random.random((4, 4)),
+            tags={'a': 1},
+            chunks=[Document(text='chunk')],
+        )
+        for _ in range(10)
+    )
+    query = np.random.random(8)
+
+    expected = da.find(query, limit=3)
+    result = da.find(query, limit=3, copy=False)
+    assert result[:, 'id'] == expected[:, 'id']
+    assert result[:, 'scores__cosine__value'] == expected[:, 'scores__cosine__value']
+
+    m = result[0]
+    np.testing.assert_equal(m.tensor, da[m.id].tensor)
+    assert m.chunks[0].text == 'chunk'
+    assert not m.matches
+
+    m.tags['a'] = 2
+    m.text = 'changed'
+    assert da[m.id].tags == {'a': 1}
+    assert not da[m.id].text
+    assert not da[m.id].scores
+
+
+@pytest.mark.parametrize('storage', ['memory', 'sqlite'])
+@pytest.mark.parametrize('metric', ['cosine', 'euclidean', 'sqeuclidean'])
+@pytest.mark.parametrize('normalization', [None, (0, 1)])
+@pytest.mark.parametrize('memory_budget', [1, 1000, 10**9])
+def test_find_memory_budget(storage, metric, normalization, memory_budget):
+    da = DocumentArray(storage=storage)
+    da.extend(Document(embedding=np.random.random(16)) for _ in range(50))
+    query = np.random.random((7, 16))
+
+    expected = da.find(query, metric=metric, limit=5, normalization=normalization)
+    result = da.find(
+        query,
+        metric=metric,
+        limit=5,
+        normalization=normalization,
+        memory_budget=memory_budget,
+    )
+    for r, e in zip(result, expected):
+        assert r[:, 'id'] == e[:, 'id']
+        np.testing.assert_allclose(
+            r[:, f'scores__{metric}__value'], e[:, f'scores__{metric}__value']
+        )
+
+
+def test_find_memory_budget_empty():
+    assert DocumentArray().find(np.random.random((2, 16)), memory_budget=1000) == [
+        DocumentArray(),
+        DocumentArray(),
+    ]
+
+
+def test_find_memory_budget_torch_query():
+    torch = pytest.importorskip('torch')
+    da = DocumentArray(Document(embedding=np.random.random(16)) for _ in range(50))
+    query = np.random.random((3, 16))
+
+    expected = da.find(query, limit=5)
+    result = da.find(torch.from_numpy(query), limit=5, memory_budget=1000)
+    for r, e in zip(result, expected):
+        assert r[:, 'id'] == e[:, 'id']
+
+
+@pytest.mark.parametrize('storage', ['memory', 'sqlite'])
+@pytest.mark.parametrize('metric', ['cosine', 'euclidean', 'sqeuclidean'])
+@pytest.mark.parametrize('normalization', [None, (0, 1)])
+def test_find_ivfpq(storage, metric, normalization):
+    da = DocumentArray(storage=storage)
+    da.extend(Document(embedding=np.random.random(16)) for _ in range(100))
+    query = np.random.random((7, 16))
+
+    with pytest.raises(ValueError, match='train_ivfpq'):
+        da.find(query, metric=metric, nprobe=1)
+
+    da.train_ivfpq(n_clusters=4, n_subvectors=4, metric=metric, random_seed=0)
+
+    # scanning all lists and re-ranking all candidates is exact
+    expected = da.find(query, metric=metric, limit=5, normalization=normalization)
+    result = da.find(
+        query,
+        metric=metric,
+        limit=5,
+        normalization=normalization,
+        nprobe=4,
+        n_candidates=len(da),
+    )
+    for r, e in zip(result, expected):
+        assert r[:, 'id'] == e[:, 'id']
+        np.testing.assert_allclose(
+            r[:, f'scores__{metric}__value'], e[:, f'scores__{metric}__value']
+        )
+
+    result = da.find(query, metric=metric, limit=5, nprobe=1)
+    assert all(len(r) == 5 for r in result)
+
+    # Documents added after training are encoded on next search
+    da.append(Document(embedding=np.random.random(16)))
+    assert (
+        da.find(da[-1].embedding, metric=metric, limit=1, nprobe=4)[0].id == da[-1].id
+    )
+
+    with pytest.raises(ValueError, match='trained for metric'):
+        da.find(query, metric=lambda x, y: x @ y.T, nprobe=1)
+
+
+@pytest.mark.parametrize('storage', ['memory', 'sqlite'])
+@pytest.mark.parametrize('metric', ['cosine', 'euclidean', 'sqeuclidean'])
+@pytest.mark.parametrize('quantization', ['int8', 'binary'])
+def test_find_quantized(storage, metric, quantization):
+    da = DocumentArray(storage=storage)
+    da.extend(Document(embedding=np.random.random(16) - 0.5) for _ in range(100))
+    query = np.random.random((7, 16)) - 0.5
+
+    # re-ranking all candidates is exact
+    expected = da.find(query, metric=metric, limit=5, normalization=(0, 1))
+    result = da.find(
+        query,
+        metric=metric,
+        limit=5,
+        normalization=(0, 1),
+        quantization=quantization,
+        n_candidates=len(da),
+    )
+    for r, e in zip(result, expected):
+        assert r[:, 'id'] == e[:, 'id']
+        np.testing.assert_allclose(
+            r[:, f'scores__{metric}__value'], e[:, f'scores__{metric}__value']
+        )
+
+    # codes are rebuilt when the embeddings change
+    da.append(Document(embedding=np.random.random(16) - 0.5))
+    result = da.find(
+        da[-1].embedding, metric=metric, limit=3, quantization=quantization
+    )
+    assert result[0].id == da[-1].id
+
+
+@pytest.mark.parametrize('storage', ['memory', 'sqlite'])
+@pytest.mark.parametrize('max_distances', [200, 40000])
+def test_find_quantized_reranks_in_batches(storage, max_distances, monkeypatch):
+    from docarray.array.storage.memory import find as memory_find
+
+    monkeypatch.setattr(memory_find, '_RERANK_MAX_DISTANCES', max_distances)
+    da = DocumentArray(storage=storage)
+    da.extend(Document(embedding=np.random.random(16) - 0.5) for _ in range(100))
+    query = np.random.random((7, 16)) - 0.5
+    expected = da.find(query, limit=5, normalization=(0, 1))
+    da.find(query, limit=5, quantization='int8')
+
+    loads = []
+    get_embeddings = type(da)._get_embeddings_by_ids
+    monkeypatch.setattr(
+        type(da),
+        '_get_embeddings_by_ids',
+        lambda self, ids: loads.append(len(ids)) or get_embeddings(self, ids),
+    )
+    result = da.find(
+        query,
+        limit=5,
+        normalization=(0, 1),
+        quantization='int8',
+        n_candidates=len(da),
+    )
+    # the candidates of all queries are loaded at once
+    assert loads == [len(da)]
+    for r, e in zip(result, expected):
+        assert r[:, 'id'] == e[:, 'id']
+        np.testing.assert_allclose(
+            r[:, 'scores__cosine__value'], e[:, 'scores__cosine__value']
+        )
+
+
+@pytest.mark.parametrize('storage', ['memory', 'sqlite'])
+@pytest.mark.parametrize('quantization', ['int8', 'binary'])
+def test_find_quantized_updates_changed_rows(storage, quantization):
+    da = DocumentArray(storage=storage)
+    da.extend(
+        Document(id=str(i), embedding=np.random.random(16) - 0.5) for i in range(50)
+    )
+    da.find(np.random.random(16), quantization=quantization)
+    codes = da._quantized[quantization]
+
+    # replaced under the same id
+    query = np.random.random(16) - 0.5
+    da['3'] = Document(id='3', embedding=query)
+    del da['7']
+    da.append(Document(id='new', embedding=-query))
+    da.insert(0, Document(id='no embedding'))
+
+    result = da.find(query, limit=50, quantization=quantization, n_candidates=50)
+    assert da._quantized[quantization] is codes
+    assert len(codes) == 50
+    assert result[0].id == '3'
+    assert '7' not in result[:, 'id']
+    assert 'no embedding' not in result[:, 'id']
+    np.testing.assert_allclose(result[0].embedding, query)
+    assert da[result[0].id].id == '3'
+
+
+@pytest.mark.parametrize('storage', ['memory', 'sqlite'])
+def test_find_ivfpq_updates_changed_rows(storage):
+    da = DocumentArray(storage=storage)
+    da.extend(
+        Document(id=str(i), embedding=np.random.random(16) - 0.5) for i in range(50)
+    )
+    da.train_ivfpq(n_clusters=4, n_subvectors=4, random_seed=0)
+    index = da._ivfpq
+    encoded = []
+    encode = index._encode
+    index._encode = lambda residuals: encoded.append(len(residuals)) or encode(
+        residuals
+    )
+
+    # replaced under the same id
+    query = np.random.random(16) - 0.5
+    da['3'] = Document(id='3', embedding=query)
+    del da['7']
+    da.append(Document(id='new', embedding=-query))
+
+    result = da.find(query, limit=50, nprobe=4, n_candidates=50)
+    assert da._ivfpq is index
+    assert len(index) == 50
+    assert result[0].id == '3'
+    assert '7' not in result[:, 'id']
+    np.testing.assert_allclose(result[0].embedding, query)
+    # only the replaced and the new Documents were encoded
+    assert sum(encoded) == 2
+
+
+def test_find_quantized_invalid():
+    da = DocumentArray(Document(embedding=np.random.random(16)) for _ in range(10))
+    with pytest.raises(ValueError):
+        da.find(np.random.random(16), quantization='int4')
+    with pytest.raises(ValueError):
+        da.find(np.random.random(16), metric=lambda x, y: x @ y.T, quantization='int8')
+
+
 @pytest.mark.parametrize(
     'storage, config',
     [
         ('memory', None),
         ('weaviate', {'n_dim': 32, 'distance': 'cosine'}),
         ('annlite', {'n_dim': 32}),
+        ('hnsw', {'n_dim': 32}),
         ('qdrant', {'n_dim': 32}),
         ('elasticsearch', {'n_dim': 32}),
         ('redis', {'n_dim': 32}),
@@ -81,7 +383,7 @@ def test_find(storage, config, limit, query, start_storage):
         if storage == 'redis':
             cosine_distances = [t['score'].value for t in da[:, 'scores']]
             assert sorted(cosine_distances, reverse=False) == cosine_distances
-        elif storage in ['memory', 'annlite', 'elasticsearch']:
+        elif storage in ['memory', 'annlite', 'hnsw', 'elasticsearch']:
             cosine_distances = [t['cosine'].value for t in da[:, 'scores']]
             assert sorted(cosine_distances, reverse=False) == cosine_distances
     else:
@@ -95,7 +397,7 @@ def test_find(storage, config, limit, query, start_storage):
             for da in result:
                 cosine_distances = [t['score'].value for t in da[:, 'scores']]
                 assert sorted(cosine_distances, reverse=False) == cosine_distances
-        elif storage in ['memory', 'annlite', 'elasticsearch']:
+        elif storage in ['memory', 'annlite', 'hnsw', 'elasticsearch']:
             for da in result:
                 cosine_distances = [t['cosine'].value for t in da[:, 'scores']]
                 assert sorted(cosine_distances, reverse=False) == cosine_distances
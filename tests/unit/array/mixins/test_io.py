@@ -1,3 +1,4 @@
+import inspect
 import os
 import uuid
 
@@ -9,6 +10,7 @@ from docarray.array.memory import DocumentArrayInMemory
 from docarray.array.qdrant import DocumentArrayQdrant
 from docarray.array.sqlite import DocumentArraySqlite
 from docarray.array.annlite import DocumentArrayAnnlite, AnnliteConfig
+from docarray.array.hnsw import DocumentArrayHnsw, HnswConfig
 from docarray.array.storage.qdrant import QdrantConfig
 from docarray.array.storage.weaviate import WeaviateConfig
 from docarray.array.weaviate import DocumentArrayWeaviate
@@ -33,6 +35,7 @@ def docs():
         (DocumentArrayInMemory, lambda: None),
         (DocumentArraySqlite, lambda: None),
         (DocumentArrayAnnlite, lambda: AnnliteConfig(n_dim=10)),
+        (DocumentArrayHnsw, lambda: HnswConfig(n_dim=10)),
         (DocumentArrayWeaviate, lambda: WeaviateConfig(n_dim=10)),
         (DocumentArrayQdrant, lambda: QdrantConfig(n_dim=10)),
         (DocumentArrayElastic, lambda: ElasticConfig(n_dim=10)),
@@ -77,6 +80,7 @@ def test_document_save_load(
         (DocumentArrayInMemory, lambda: None),
         (DocumentArraySqlite, lambda: None),
         (DocumentArrayAnnlite, lambda: AnnliteConfig(n_dim=10)),
+        (DocumentArrayHnsw, lambda: HnswConfig(n_dim=10)),
         (DocumentArrayWeaviate, lambda: WeaviateConfig(n_dim=10)),
         (DocumentArrayQdrant, lambda: QdrantConfig(n_dim=10)),
         (DocumentArrayElastic, lambda: ElasticConfig(n_dim=10)),
@@ -92,12 +96,41 @@ def test_da_csv_write(docs, flatten_tags, tmp_path, da_cls, config, start_storag
         assert len([v for v in fp]) == len(da) + 1
 
 
+@pytest.mark.parametrize('protocol', ['jsonschema', 'protobuf'])
+@pytest.mark.parametrize('save_streaming', [True, False])
+def test_save_load_json_streaming(docs, tmp_path, protocol, save_streaming):
+    tmp_file = os.path.join(tmp_path, 'test.json')
+    docs.save_json(tmp_file, protocol=protocol, streaming=save_streaming)
+    if save_streaming:
+        with open(tmp_file) as fp:
+            assert len(fp.readlines()) == len(docs)
+
+    da = DocumentArray.load_json(tmp_file, protocol=protocol, streaming=True)
+    assert inspect.isgenerator(da)
+    for d, d_r in zip(docs, da):
+        assert d.id == d_r.id
+        np.testing.assert_equal(d.embedding, d_r.embedding)
+
+    da = DocumentArray.load_json(tmp_file, protocol=protocol)
+    assert da[:, 'id'] == docs[:, 'id']
+
+
+def test_load_csv_streaming(docs, tmp_path):
+    tmp_file = os.path.join(tmp_path, 'test.csv')
+    docs.save_csv(tmp_file, exclude_fields=['embedding', 'chunks'])
+
+    da = DocumentArray.load_csv(tmp_file, streaming=True)
+    assert inspect.isgenerator(da)
+    assert [d.id for d in da] == docs[:, 'id']
+
+
 @pytest.mark.parametrize(
     'da_cls,config',
     [
         (DocumentArrayInMemory, lambda: None),
         (DocumentArraySqlite, lambda: None),
         (DocumentArrayAnnlite, lambda: AnnliteConfig(n_dim=256)),
+        (DocumentArrayHnsw, lambda: HnswConfig(n_dim=256)),
         (DocumentArrayWeaviate, lambda: WeaviateConfig(n_dim=256)),
         (DocumentArrayQdrant, lambda: QdrantConfig(n_dim=256)),
         (DocumentArrayElastic, lambda: ElasticConfig(n_dim=256)),
@@ -117,6 +150,7 @@ def test_from_ndarray(da_cls, config, start_storage):
         (DocumentArrayInMemory, lambda: None),
         (DocumentArraySqlite, lambda: None),
         (DocumentArrayAnnlite, lambda: AnnliteConfig(n_dim=256)),
+        (DocumentArrayHnsw, lambda: HnswConfig(n_dim=256)),
         (DocumentArrayWeaviate, lambda: WeaviateConfig(n_dim=256)),
         (DocumentArrayQdrant, lambda: QdrantConfig(n_dim=256)),
         (DocumentArrayElastic, lambda: ElasticConfig(n_dim=256)),
@@ -159,6 +193,7 @@ def test_from_files_exclude():
         (DocumentArrayInMemory, lambda: None),
         (DocumentArraySqlite, lambda: None),
         (DocumentArrayAnnlite, lambda: AnnliteConfig(n_dim=256)),
+        (DocumentArrayHnsw, lambda: HnswConfig(n_dim=256)),
         (DocumentArrayWeaviate, lambda: WeaviateConfig(n_dim=256)),
         (DocumentArrayQdrant, lambda: QdrantConfig(n_dim=256)),
         (DocumentArrayElastic, lambda: ElasticConfig(n_dim=256)),
@@ -178,6 +213,7 @@ def test_from_ndjson(da_cls, config, start_storage):
         (DocumentArrayInMemory, lambda: None),
         (DocumentArraySqlite, lambda: None),
         (DocumentArrayAnnlite, lambda: AnnliteConfig(n_dim=3)),
+        (DocumentArrayHnsw, lambda: HnswConfig(n_dim=3)),
         (DocumentArrayWeaviate, lambda: WeaviateConfig(n_dim=3)),
         (DocumentArrayQdrant, lambda: QdrantConfig(n_dim=3)),
         (DocumentArrayElastic, lambda: ElasticConfig(n_dim=3)),
@@ -209,6 +245,7 @@ def test_from_to_pd_dataframe(da_cls, config, start_storage):
         (DocumentArrayInMemory, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=3)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=3)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=3)),
         (DocumentArrayElastic, ElasticConfig(n_dim=3)),
         (DocumentArrayRedis, RedisConfig(n_dim=3)),
@@ -252,6 +289,7 @@ def test_from_to_bytes(da_cls, config, start_storage):
         (DocumentArrayInMemory, lambda: None),
         (DocumentArraySqlite, lambda: None),
         (DocumentArrayAnnlite, lambda: AnnliteConfig(n_dim=256)),
+        (DocumentArrayHnsw, lambda: HnswConfig(n_dim=256)),
         (DocumentArrayWeaviate, lambda: WeaviateConfig(n_dim=256)),
         (DocumentArrayQdrant, lambda: QdrantConfig(n_dim=256)),
         (DocumentArrayElastic, lambda: ElasticConfig(n_dim=256)),
@@ -318,3 +356,268 @@ def test_from_to_base64(protocol, compress, da_cls, config):
             assert d1 == d2
     # assert da_r[0].embedding == [1, 2, 3]
     np.testing.assert_array_equal(da_r[0].embedding, [1, 2, 3])
+
+
+@pytest.mark.parametrize(
+    'da_cls, config',
+    [
+        (DocumentArrayInMemory, None),
+        (DocumentArraySqlite, None),
+    ],
+)
+def test_save_load_columnar(docs, tmp_path, da_cls, config):
+    docs[1].embedding = None
+    for j, d in enumerate(docs[:10]):
+        d.tensor = np.random.random([j + 1, 3])
+    da = da_cls(docs, config=config)
+    da.save(tmp_path / 'da', file_format='columnar')
+
+    da_r = da_cls.load(tmp_path / 'da', file_format='columnar', config=config)
+    assert len(da_r) == len(da)
+    for d1, d2 in zip(da, da_r):
+        assert d1 == d2
+        assert len(d2.chunks) == len(d1.chunks)
+
+
+def test_save_columnar_numpy_tags(tmp_path):
+    da = DocumentArray(
+        [Document(tags={'score': np.float32(0.5), 'n': np.int64(3), 'ok': np.bool_(1)})]
+    )
+    da.save_columnar(tmp_path)
+
+    da_r = DocumentArray.load_columnar(tmp_path)
+    assert da_r[0].tags == {'score': 0.5, 'n': 3, 'ok': True}
+
+
+def test_save_columnar_single_pass(tmp_path, monkeypatch):
+    da = DocumentArray(
+        Document(
+            text=str(i), tags={'i': i}, embedding=np.ones(3), tensor=np.ones([i + 1, 2])
+        )
+        for i in range(5)
+    )
+    passes = []
+    iter_docs = type(da).__iter__
+    monkeypatch.setattr(
+        type(da), '__iter__', lambda self: passes.append(1) or iter_docs(self)
+    )
+    da.save_columnar(tmp_path)
+    assert len(passes) == 1
+
+    da_r = DocumentArray.load_columnar(tmp_path)
+    for d1, d2 in zip(da, da_r):
+        assert d1 == d2
+
+
+def test_save_columnar_tensors_not_fitting(tmp_path):
+    da = DocumentArray(Document(tensor=np.ones([2, i + 1])) for i in range(3))
+    da.append(Document())
+    da.append(Document(tensor=np.ones(3, dtype=np.int32)))
+    da.save_columnar(tmp_path)
+
+    lazy = DocumentArray.load_columnar(tmp_path, lazy=True)
+    assert 'tensor' not in lazy._columns
+    for d1, d2 in zip(da, lazy):
+        assert d1 == d2
+    assert sorted(os.listdir(tmp_path)) == [
+        'docs.data',
+        'docs.offsets.npy',
+        'ids.data',
+        'ids.offsets.npy',
+        'meta.json',
+    ]
+
+
+def test_save_columnar_tags(tmp_path):
+    da = DocumentArray([Document(tags={'t': (1, 2), 'nested': {'a': [None, True]}})])
+    da.save_columnar(tmp_path)
+    assert DocumentArray.load_columnar(tmp_path)[0].tags == {
+        't': [1, 2],
+        'nested': {'a': [None, True]},
+    }
+
+    for tags in [{'nested': {1: 'a'}}, {'b': b'x'}, {'a': np.ones(2)}]:
+        with pytest.raises(ValueError, match='can not be saved as a column'):
+            DocumentArray([Document(tags=tags)]).save_columnar(tmp_path)
+
+
+def test_load_columnar_lazy(docs, tmp_path):
+    for j, d in enumerate(docs[:10]):
+        d.tensor = np.random.random([j + 1, 3])
+    docs.save_columnar(tmp_path)
+
+    da = DocumentArray.load_columnar(tmp_path, lazy=True)
+    assert len(da) == len(docs)
+    assert isinstance(da.embeddings, np.memmap)
+    np.testing.assert_array_equal(da.embeddings, docs.embeddings)
+    assert da[3] == docs[3]
+    assert da[-1] == docs[-1]
+    assert da[docs[5].id] == docs[5]
+    assert da[2:4].texts == docs[2:4].texts
+    assert da[[0, 7]][:, 'id'] == [docs[0].id, docs[7].id]
+    assert da.ids == docs[:, 'id']
+    np.testing.assert_array_equal(da[4].tensor, docs[4].tensor)
+    with pytest.raises(IndexError):
+        da[len(docs)]
+
+    matches = da.find(docs[8].embedding, limit=5)
+    assert matches[:, 'id'] == docs.find(docs[8].embedding, limit=5)[:, 'id']
+    assert matches[0].scores['cosine'].value == pytest.approx(0)
+
+
+@pytest.mark.parametrize('protocol', ['protobuf', 'pickle'])
+@pytest.mark.parametrize('compress', ['lz4', None])
+@pytest.mark.parametrize(
+    'index_kwargs', [{}, {'offset_index': True}, {'id_index': True}]
+)
+def test_load_binary_random_access(docs, tmp_path, protocol, compress, index_kwargs):
+    tmp_file = os.path.join(tmp_path, 'test')
+    docs.save_binary(tmp_file, protocol=protocol, compress=compress, **index_kwargs)
+
+    # files with an index are still readable by the sequential loaders
+    da = DocumentArray.load_binary(tmp_file, protocol=protocol, compress=compress)
+    assert da[:, 'id'] == docs[:, 'id']
+
+    with DocumentArray.load_binary(
+        tmp_file, protocol=protocol, compress=compress, random_access=True
+    ) as da:
+        assert len(da) == len(docs)
+        assert da[3] == docs[3]
+        assert da[-1] == docs[-1]
+        assert da[docs[42].id] == docs[42]
+        assert da[10:20][:, 'id'] == docs[10:20][:, 'id']
+        assert da[10:20:3][:, 'id'] == docs[10:20:3][:, 'id']
+        assert da[[5, 6, 7]][:, 'id'] == docs[[5, 6, 7]][:, 'id']
+        assert da[[7, 5]][:, 'id'] == docs[[7, 5]][:, 'id']
+        assert da.ids == docs[:, 'id']
+        with pytest.raises(IndexError):
+            da[len(docs)]
+
+
+def test_load_binary_random_access_invalid(docs, tmp_path):
+    with pytest.raises(ValueError):
+        docs.to_bytes(protocol='pickle-array', offset_index=True)
+
+    tmp_file = os.path.join(tmp_path, 'test')
+    docs.save_binary(tmp_file, protocol='pickle-array')
+    with pytest.raises(ValueError):
+        DocumentArray.load_binary(tmp_file, protocol='pickle-array', random_access=True)
+
+
+@pytest.mark.parametrize('protocol', ['protobuf', 'pickle'])
+@pytest.mark.parametrize('compress', ['lz4', None])
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_load_binary_num_worker(docs, tmp_path, protocol, compress, backend):
+    tmp_file = os.path.join(tmp_path, 'test')
+    docs.save_binary(tmp_file, protocol=protocol, compress=compress)
+
+    da = DocumentArray.load_binary(
+        tmp_file, protocol=protocol, compress=compress, num_worker=3, backend=backend
+    )
+    assert da[:, 'id'] == docs[:, 'id']
+    for d1, d2 in zip(da, docs):
+        assert d1 == d2
+
+
+@pytest.mark.parametrize('protocol', ['protobuf', 'pickle'])
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_save_binary_num_worker(docs, tmp_path, protocol, backend):
+    tmp_file = os.path.join(tmp_path, 'test')
+    docs.save_binary(
+        tmp_file,
+        protocol=protocol,
+        compress='lz4',
+        id_index=True,
+        num_worker=3,
+        backend=backend,
+    )
+
+    da = DocumentArray.load_binary(tmp_file, protocol=protocol, compress='lz4')
+    assert da[:, 'id'] == docs[:, 'id']
+    with DocumentArray.load_binary(
+        tmp_file, protocol=protocol, compress='lz4', random_access=True
+    ) as da:
+        assert da[docs[42].id] == docs[42]
+
+
+def test_binary_num_worker_single_cpu(docs, monkeypatch):
+    from docarray.array.mixins import parallel
+
+    pools = []
+    get_pool = parallel._get_pool
+    monkeypatch.setattr(os, 'cpu_count', lambda: 1)
+    monkeypatch.setattr(
+        parallel,
+        '_get_pool',
+        lambda backend, num_worker: pools.append(num_worker)
+        or get_pool(backend, num_worker),
+    )
+    # an explicit `num_worker` is honoured even on a single CPU
+    data = docs.to_bytes(protocol='protobuf', num_worker=4)
+    da = DocumentArray.from_bytes(data, protocol='protobuf', num_worker=4)
+    assert da[:, 'id'] == docs[:, 'id']
+    assert pools == [4, 4]
+
+
+@pytest.mark.parametrize('protocol', ['protobuf', 'protobuf-array'])
+@pytest.mark.parametrize('streaming', [False, True])
+def test_load_binary_lazy(docs, tmp_path, protocol, streaming):
+    if streaming and protocol == 'protobuf-array':
+        return
+    tmp_file = os.path.join(tmp_path, 'test')
+    docs.save_binary(tmp_file, protocol=protocol)
+
+    da = DocumentArray.load_binary(
+        tmp_file, protocol=protocol, lazy=True, streaming=streaming
+    )
+    for d1, d2 in zip(da, docs):
+        assert d1._data._lazy_fields
+        assert d1.id == d2.id
+        np.testing.assert_equal(d1.embedding, d2.embedding)
+        assert d1 == d2
+
+
+@pytest.mark.parametrize('ndarray_type', [None, 'numpy', 'list'])
+@pytest.mark.parametrize('all_embeddings', [True, False])
+def test_to_from_protobuf_pack_ndarrays(ndarray_type, all_embeddings):
+    da = DocumentArray.empty(10)
+    da.embeddings = np.random.random([10, 5]).astype(np.float32)
+    da.tensors = np.random.random([10, 2, 3])
+    da[0].chunks = [Document(embedding=np.random.random(5))]
+    if not all_embeddings:
+        da[3].embedding = None
+
+    dap = da.to_protobuf(ndarray_type=ndarray_type, pack_ndarrays=True)
+    assert [p.field for p in dap.packed] == ['embedding', 'tensor']
+    assert len(dap.packed[0].ids) == (0 if all_embeddings else 9)
+    assert not dap.docs[0].HasField('embedding')
+    assert dap.docs[0].chunks[0].HasField('embedding')
+
+    da_r = DocumentArray.from_protobuf(dap)
+    assert da_r[:, 'id'] == da[:, 'id']
+    for d1, d2 in zip(da, da_r):
+        if d1.embedding is None:
+            assert d2.embedding is None
+        else:
+            np.testing.assert_allclose(d1.embedding, d2.embedding)
+        np.testing.assert_allclose(d1.tensor, d2.tensor)
+    np.testing.assert_allclose(da_r[0].chunks[0].embedding, da[0].chunks[0].embedding)
+
+    da_r = DocumentArray.from_bytes(
+        da.to_bytes(protocol='protobuf-array', pack_ndarrays=True),
+        protocol='protobuf-array',
+    )
+    assert da_r[:, 'id'] == da[:, 'id']
+
+
+def test_to_protobuf_pack_ndarrays_heterogeneous():
+    da = DocumentArray.empty(3)
+    da.embeddings = np.random.random([3, 5])
+    da[1].embedding = np.random.random(4)
+    da[0].tensor = np.random.random([2, 2])
+
+    dap = da.to_protobuf(pack_ndarrays=True)
+    assert not dap.packed
+    da_r = DocumentArray.from_protobuf(dap)
+    assert da_r[1].embedding.shape == (4,)
+    np.testing.assert_allclose(da_r[0].tensor, da[0].tensor)
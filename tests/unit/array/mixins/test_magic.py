@@ -4,6 +4,7 @@ from docarray import DocumentArray, Document
 from docarray.array.qdrant import DocumentArrayQdrant
 from docarray.array.sqlite import DocumentArraySqlite
 from docarray.array.annlite import DocumentArrayAnnlite, AnnliteConfig
+from docarray.array.hnsw import DocumentArrayHnsw, HnswConfig
 from docarray.array.storage.qdrant import QdrantConfig
 from docarray.array.storage.weaviate import WeaviateConfig
 from docarray.array.weaviate import DocumentArrayWeaviate
@@ -31,6 +32,7 @@ def docs():
         (DocumentArray, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=128)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=128)),
         (DocumentArrayWeaviate, WeaviateConfig(n_dim=128)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=128)),
         (DocumentArrayElastic, ElasticConfig(n_dim=128)),
@@ -59,6 +61,7 @@ def test_iter_len_bool(da_cls, config, start_storage):
         (DocumentArray, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=128)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=128)),
         (DocumentArrayWeaviate, WeaviateConfig(n_dim=128)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=128)),
         (DocumentArrayElastic, ElasticConfig(n_dim=128)),
@@ -80,6 +83,7 @@ def test_repr(da_cls, config, start_storage):
         ('memory', None),
         ('sqlite', None),
         ('annlite', AnnliteConfig(n_dim=128)),
+        ('hnsw', HnswConfig(n_dim=128)),
         ('weaviate', WeaviateConfig(n_dim=128)),
         ('qdrant', QdrantConfig(n_dim=128)),
         ('elasticsearch', ElasticConfig(n_dim=128)),
@@ -105,6 +109,7 @@ def test_repr_str(docs, storage, config, start_storage):
         (DocumentArray, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=10)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=10)),
         (DocumentArrayWeaviate, WeaviateConfig(n_dim=10)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=10)),
         (DocumentArrayElastic, ElasticConfig(n_dim=10)),
@@ -2,6 +2,7 @@ from functools import partial
 from multiprocessing import Pool
 from multiprocessing.pool import ThreadPool
 
+import numpy as np
 import pytest
 
 from docarray import DocumentArray, Document
@@ -269,3 +270,194 @@ def test_apply_diff_backend_storage(storage, config, backend, start_storage):
 
         assert len(q.matches[:5, ('text', 'scores__jaccard__value')]) == 2
         assert len(q.matches[:5, ('text', 'scores__jaccard__value')][0]) == 5
+
+
+def _set_text(d: Document):
+    d.text = 'hello'
+    return d
+
+
+@pytest.mark.parametrize('backend', ['thread', 'process'])
+def test_managed_pool_reused(backend):
+    from docarray.array.mixins.parallel import (
+        get_managed_pool,
+        shutdown_managed_pools,
+        warmup_managed_pool,
+    )
+
+    pool = warmup_managed_pool(backend, num_worker=2)
+    assert get_managed_pool(backend, 2) is pool
+
+    da = DocumentArray.empty(10)
+    for _ in range(3):
+        assert all(
+            d.text == 'hello' for d in da.map(_set_text, backend, 2, reuse_pool=True)
+        )
+        assert get_managed_pool(backend, 2) is pool
+
+    list(da.map(_set_text, backend, 2))
+    assert get_managed_pool(backend, 2) is pool
+
+    shutdown_managed_pools()
+    assert get_managed_pool(backend, 2) is not pool
+    shutdown_managed_pools()
+
+
+def test_thread_pool_reused_by_default(monkeypatch):
+    from docarray.array.mixins import parallel
+
+    parallel.warmup_managed_pool('thread', num_worker=2)
+
+    def _new_pool(*args, **kwargs):
+        raise AssertionError('a new pool was created')
+
+    monkeypatch.setattr(parallel, '_get_pool', _new_pool)
+    da = DocumentArray.empty(4)
+    assert all(d.text == 'hello' for d in da.map(_set_text, 'thread', 2))
+    with pytest.raises(AssertionError):
+        list(da.map(_set_text, 'process', 2))
+    with pytest.raises(AssertionError):
+        list(da.map(_set_text, 'thread', 2, reuse_pool=False))
+
+
+def test_pickled_task_pickles_function_once():
+    import pickle
+
+    from docarray.array.mixins.parallel import _PickledTask
+
+    assert _PickledTask(_set_text)._payload is _PickledTask(_set_text)._payload
+    task = pickle.loads(pickle.dumps(_PickledTask(_set_text)))
+    assert task(Document()).text == 'hello'
+    # other callables are pickled with their current state
+    assert _PickledTask(partial(_set_text))._payload is not (
+        _PickledTask(partial(_set_text))._payload
+    )
+
+
+def test_managed_pool_reports_unknown_function():
+    import sys
+
+    from docarray.array.mixins.parallel import (
+        shutdown_managed_pools,
+        warmup_managed_pool,
+    )
+
+    warmup_managed_pool('process', num_worker=2)
+
+    # defined after the workers were forked, so they cannot unpickle it
+    def _defined_later(d):
+        return d
+
+    _defined_later.__qualname__ = _defined_later.__name__ = '_defined_later'
+    setattr(sys.modules[__name__], '_defined_later', _defined_later)
+    try:
+        with pytest.raises(AttributeError):
+            list(
+                DocumentArray.empty(4).map(
+                    _defined_later, 'process', 2, reuse_pool=True
+                )
+            )
+    finally:
+        delattr(sys.modules[__name__], '_defined_later')
+        shutdown_managed_pools()
+
+
+def test_warmup_managed_pool_in_worker():
+    from docarray.array.mixins.parallel import warmup_managed_pool
+
+    def _warmup(d):
+        return warmup_managed_pool('thread', 2)
+
+    assert list(DocumentArray.empty(2).map(_warmup, num_worker=2, reuse_pool=True)) == [
+        None,
+        None,
+    ]
+
+
+def test_managed_pool_nested_map():
+    da = DocumentArray.empty(4)
+
+    def _nested(d):
+        return list(
+            DocumentArray.empty(4).map(_set_text, num_worker=2, reuse_pool=True)
+        )
+
+    # a worker waiting on its own pool would deadlock
+    for r in da.map(_nested, num_worker=2, reuse_pool=True):
+        assert len(r) == 4
+
+
+def _scale_batch(da: DocumentArray):
+    for d in da:
+        if d.tensor is None:
+            continue
+        # in place, written back into the input segment
+        d.tensor *= 2
+        # new array of another shape, passed back through a new segment
+        d.embedding = np.concatenate([d.embedding, d.embedding])
+        d.tags['done'] = True
+    return da
+
+
+def _batch_size(da: DocumentArray):
+    return len(da)
+
+
+@pytest.mark.parametrize('reuse_pool', [True, False])
+def test_map_batch_shared_memory(reuse_pool):
+    da = DocumentArray(
+        Document(tensor=np.ones((8, 8), dtype=np.float32), embedding=np.arange(4))
+        for _ in range(10)
+    )
+    da.append(Document(text='no arrays'))
+
+    result = DocumentArray()
+    for b in da.map_batch(
+        _scale_batch,
+        batch_size=4,
+        backend='process',
+        num_worker=2,
+        shared_memory=True,
+        reuse_pool=reuse_pool,
+    ):
+        result.extend(b)
+
+    assert result[:, 'id'] == da[:, 'id']
+    for d in result[:10]:
+        np.testing.assert_equal(d.tensor, np.full((8, 8), 2, dtype=np.float32))
+        np.testing.assert_equal(d.embedding, np.concatenate([np.arange(4)] * 2))
+        assert d.tags['done']
+    assert result[-1].text == 'no arrays'
+    # the original Documents are untouched
+    np.testing.assert_equal(da[0].tensor, np.ones((8, 8)))
+    np.testing.assert_equal(da[0].embedding, np.arange(4))
+
+    assert list(
+        da.map_batch(
+            _batch_size,
+            batch_size=4,
+            backend='process',
+            num_worker=2,
+            shared_memory=True,
+        )
+    ) == [4, 4, 3]
+
+
+def test_shared_memory_batches_in_flight(monkeypatch):
+    from multiprocessing.pool import ThreadPool
+
+    from docarray.array.mixins import parallel
+
+    packed = []
+    pack_arrays = parallel._pack_arrays
+    monkeypatch.setattr(
+        parallel, '_pack_arrays', lambda *args: packed.append(1) or pack_arrays(*args)
+    )
+    da = DocumentArray(Document(embedding=np.ones(2)) for _ in range(20))
+    with ThreadPool(2) as pool:
+        results = parallel._imap_shared_memory(
+            pool, _batch_size, da.batch(batch_size=2), 3
+        )
+        assert next(results) == 2
+        assert len(packed) == 3
+        assert list(results) == [2] * 9
@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist
+
+from docarray import Document, DocumentArray
+from docarray.array.hnsw import HnswConfig
+from docarray.array.storage.hnsw.helper import HnswIndex
+
+
+def _recall(index, queries, data, metric, limit=10):
+    expected = np.argsort(cdist(queries, data, metric), axis=1)[:, :limit]
+    hits = 0
+    for q, e in zip(queries, expected):
+        _, labels = index.search(q, limit)
+        hits += len(set(labels.tolist()) & set(e.tolist()))
+    return hits / (len(queries) * limit)
+
+
+@pytest.mark.parametrize('metric', ['cosine', 'euclidean', 'sqeuclidean'])
+def test_index_recall(metric):
+    rng = np.random.default_rng(0)
+    data = rng.random((1000, 16), dtype=np.float32)
+    queries = rng.random((20, 16), dtype=np.float32)
+
+    index = HnswIndex(16, metric=metric, initial_capacity=10, random_seed=0)
+    for v in data:
+        index.add(v)
+
+    assert len(index) == 1000
+    assert _recall(index, queries, data, metric) > 0.9
+
+    dists, labels = index.search(queries[0], 5)
+    np.testing.assert_allclose(
+        dists, cdist(queries[:1], data[labels], metric)[0], rtol=1e-4, atol=1e-5
+    )
+
+
+def test_index_delete_and_save(tmpdir):
+    rng = np.random.default_rng(0)
+    data = rng.random((200, 8), dtype=np.float32)
+    index = HnswIndex(8, random_seed=0)
+    for v in data:
+        index.add(v)
+    for label in range(0, 200, 2):
+        index.delete(label)
+
+    dists, labels = index.search(data[0], 10)
+    assert len(labels) == 10
+    assert all(l % 2 == 1 for l in labels)
+
+    index.save(str(tmpdir / 'index.npz'))
+    loaded = HnswIndex.load(str(tmpdir / 'index.npz'))
+    assert len(loaded) == 100
+    np.testing.assert_array_equal(loaded.search(data[0], 10)[1], labels)
+
+
+def test_index_compact():
+    rng = np.random.default_rng(0)
+    data = rng.random((200, 8), dtype=np.float32)
+    index = HnswIndex(8, random_seed=0)
+    for v in data:
+        index.add(v)
+    for label in range(0, 200, 2):
+        index.delete(label)
+
+    kept = index.compact()
+    np.testing.assert_array_equal(kept, np.arange(1, 200, 2))
+    assert index.size == len(index) == 100
+    _, labels = index.search(data[1], 1)
+    assert kept[labels[0]] == 1
+
+
+def test_index_wrong_dimension():
+    index = HnswIndex(8)
+    with pytest.raises(ValueError):
+        index.add(np.ones(4))
+
+
+def test_find_updates_with_array():
+    da = DocumentArray(storage='hnsw', config=HnswConfig(n_dim=8, random_seed=0))
+    da.extend(Document(id=str(i), embedding=np.random.random(8)) for i in range(100))
+    query = da['42'].embedding
+
+    assert da.find(query, limit=1)[0].id == '42'
+
+    del da['42']
+    assert '42' not in da.find(query, limit=10)[:, 'id']
+
+    da['7'] = Document(id='7', embedding=query)
+    assert da.find(query, limit=1)[0].id == '7'
+
+    da.append(Document(id='no-embedding'))
+    assert len(da) == 100
+    assert 'no-embedding' not in da.find(query, limit=100)[:, 'id']
+
+
+def test_updates_keep_graph_bounded():
+    da = DocumentArray(storage='hnsw', config=HnswConfig(n_dim=8, random_seed=0))
+    da.extend(Document(id=str(i), embedding=np.random.random(8)) for i in range(20))
+
+    for _ in range(5):
+        for i in range(20):
+            da[str(i)] = Document(id=str(i), embedding=np.random.random(8))
+    assert da._hnsw.size <= 40
+
+    # changing other fields keeps the node
+    size = da._hnsw.size
+    da[:, 'tags'] = [{'i': i} for i in range(20)]
+    assert da._hnsw.size == size
+
+    query = da['5'].embedding
+    result = da.find(query, limit=1)[0]
+    assert result.id == '5'
+    assert result.tags == {'i': 5}
+
+
+def test_default_data_path():
+    da = DocumentArray(storage='hnsw', config={'n_dim': 8})
+    with da:
+        da.append(Document(id='a', embedding=np.ones(8)))
+    da2 = DocumentArray(storage='hnsw', config=da._config)
+    assert da2[:, 'id'] == ['a']
+
+
+def test_persistence(tmpdir):
+    config = {'n_dim': 8, 'data_path': str(tmpdir), 'metric': 'euclidean'}
+    da = DocumentArray(storage='hnsw', config=config)
+    with da:
+        da.extend(Document(id=str(i), embedding=np.random.random(8)) for i in range(50))
+        del da['3']
+        da.insert(0, Document(id='first', embedding=np.zeros(8)))
+
+    da2 = DocumentArray(storage='hnsw', config=config)
+    assert da2[:, 'id'] == da[:, 'id']
+    assert da2.find(np.zeros(8), limit=1)[0].id == 'first'
+    assert '3' not in da2.find(da[5].embedding, limit=50)[:, 'id']
+
+
+def test_filter_not_supported():
+    da = DocumentArray(storage='hnsw', config={'n_dim': 8})
+    da.append(Document(embedding=np.ones(8)))
+    with pytest.raises(ValueError):
+        da.find(np.ones(8), filter={'price': {'$gte': 2}})
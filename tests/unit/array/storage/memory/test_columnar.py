@@ -0,0 +1,175 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from docarray import Document, DocumentArray
+from docarray.array.memory import MemoryConfig
+
+
+def _da(n=5, n_dim=4, initial_capacity=2):
+    return DocumentArray(
+        [Document(embedding=np.random.random(n_dim)) for _ in range(n)],
+        config=MemoryConfig(
+            columnar_embeddings=True, initial_capacity=initial_capacity
+        ),
+    )
+
+
+def _assert_in_sync(da):
+    expected = np.stack([d.embedding for d in da])
+    embeddings = da.embeddings
+    np.testing.assert_allclose(embeddings, expected)
+    for d, row in zip(da, embeddings):
+        assert np.shares_memory(d.embedding, embeddings)
+        np.testing.assert_allclose(d.embedding, row)
+
+
+def test_embeddings_is_a_view():
+    da = _da()
+    embeddings = da.embeddings
+    assert embeddings.shape == (5, 4)
+    assert embeddings.base is not None
+    assert np.shares_memory(embeddings, da.embeddings)
+
+
+def test_config_from_dict():
+    da = DocumentArray(
+        [Document(embedding=np.ones(3))], config={'columnar_embeddings': True}
+    )
+    assert da._config.columnar_embeddings
+    assert np.shares_memory(da[0].embedding, da.embeddings)
+
+
+def test_default_is_not_columnar():
+    da = DocumentArray([Document(embedding=np.ones(3)) for _ in range(2)])
+    assert da._embedding_store is None
+    assert not np.shares_memory(da.embeddings, da[0].embedding)
+
+
+@pytest.mark.parametrize(
+    'op',
+    [
+        lambda da: da.append(Document(embedding=np.zeros(4))),
+        lambda da: da.extend(Document(embedding=np.ones(4)) for _ in range(7)),
+        lambda da: da.insert(0, Document(embedding=np.ones(4))),
+        lambda da: da.insert(2, Document(embedding=np.ones(4))),
+        lambda da: da.insert(-1, Document(embedding=np.ones(4))),
+        lambda da: da.insert(100, Document(embedding=np.ones(4))),
+        lambda da: da.__delitem__(0),
+        lambda da: da.__delitem__(-1),
+        lambda da: da.__delitem__(da[2].id),
+        lambda da: da.__delitem__(slice(1, 3)),
+        lambda da: da.__delitem__([True, False, True]),
+        lambda da: da.__setitem__(1, Document(embedding=np.ones(4))),
+        lambda da: da.__setitem__(da[1].id, Document(embedding=np.ones(4))),
+        lambda da: da.__setitem__(slice(0, 2), [Document(embedding=np.ones(4))]),
+        lambda da: da.__setitem__((1, 'embedding'), np.full(4, 3.0)),
+        lambda da: setattr(da[3], 'embedding', np.full(4, 5.0)),
+    ],
+)
+def test_buffer_follows_mutations(op):
+    da = _da()
+    da.embeddings
+    op(da)
+    _assert_in_sync(da)
+
+
+def test_set_embeddings():
+    da = _da()
+    value = np.arange(20, dtype=float).reshape(5, 4)
+    da.embeddings = value
+    np.testing.assert_allclose(da.embeddings, value)
+    _assert_in_sync(da)
+
+
+def test_missing_embedding_falls_back():
+    da = _da()
+    da.append(Document())
+    with pytest.raises(ValueError):
+        da.embeddings
+    da[-1].embedding = np.ones(4)
+    _assert_in_sync(da)
+
+
+def test_clear_and_refill():
+    da = _da()
+    da.clear()
+    assert len(da) == 0
+    da.extend(Document(embedding=np.ones(4)) for _ in range(3))
+    _assert_in_sync(da)
+
+
+def test_dimension_mismatch():
+    da = _da()
+    with pytest.raises(ValueError):
+        da.append(Document(embedding=np.ones(5)))
+
+
+def test_add_and_pickle_keep_columnar():
+    da = _da()
+    for other in (da + da, pickle.loads(pickle.dumps(da))):
+        assert other._embedding_store is not None
+        _assert_in_sync(other)
+
+
+@pytest.mark.parametrize('source_columnar', [False, True])
+def test_columnar_shares_source_documents(source_columnar):
+    source = _da() if source_columnar else DocumentArray(_da())
+    da = DocumentArray(source, config={'columnar_embeddings': True})
+    assert da._data is source._data
+    source.append(Document(embedding=np.zeros(4)))
+    source[0, 'embedding'] = np.full(4, 2.0)
+    del source[1]
+    da.insert(1, Document(embedding=np.ones(4)))
+    assert len(da) == len(source) == 6
+    _assert_in_sync(da)
+
+
+def test_find_columnar():
+    da = _da(n=20)
+    q = da[7].embedding
+    assert da.find(q, limit=1)[0].id == da[7].id
+
+
+def test_dtype_is_promoted():
+    da = DocumentArray(
+        [Document(embedding=np.arange(4)) for _ in range(3)],
+        config=MemoryConfig(columnar_embeddings=True),
+    )
+    assert da.embeddings.dtype.kind == 'i'
+    da.append(Document(embedding=np.full(4, 0.5)))
+    assert da.embeddings.dtype == np.float64
+    np.testing.assert_equal(da[-1].embedding, np.full(4, 0.5))
+    _assert_in_sync(da)
+
+
+@pytest.mark.parametrize(
+    'op',
+    [
+        lambda da, d: da.__delitem__(d.id),
+        lambda da, d: da.__delitem__(slice(0, 2)),
+        lambda da, d: da.__setitem__(d.id, Document(embedding=np.zeros(4))),
+        lambda da, d: da.clear(),
+    ],
+)
+def test_removed_document_keeps_its_embedding(op):
+    da = _da()
+    da.embeddings
+    d = da[1]
+    expected = d.embedding.copy()
+    op(da, d)
+    da.extend(Document(embedding=np.full(4, 9.0)) for _ in range(8))
+    da.embeddings
+    np.testing.assert_equal(d.embedding, expected)
+    assert not np.shares_memory(d.embedding, da.embeddings)
+
+
+def test_non_numpy_embedding_is_not_converted():
+    torch = pytest.importorskip('torch')
+    da = _da()
+    da.append(Document(embedding=torch.ones(4)))
+    assert isinstance(da[-1].embedding, torch.Tensor)
+    assert da.embeddings.shape == (6, 4)
+    del da[-1]
+    _assert_in_sync(da)
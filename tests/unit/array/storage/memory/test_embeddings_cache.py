@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from docarray import Document, DocumentArray
+
+
+@pytest.fixture
+def da():
+    return DocumentArray(Document(embedding=np.random.random(8)) for _ in range(10))
+
+
+def test_cache_is_reused(da):
+    cache = da._get_embeddings_cache()
+    np.testing.assert_allclose(cache.matrix, da.embeddings)
+    np.testing.assert_allclose(cache.norms, np.linalg.norm(da.embeddings, axis=1))
+    assert da._get_embeddings_cache() is cache
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+@pytest.mark.parametrize(
+    'op',
+    [
+        lambda da: da.append(Document(embedding=np.ones(8))),
+        lambda da: da.extend([Document(embedding=np.ones(8))]),
+        lambda da: da.insert(0, Document(embedding=np.ones(8))),
+        lambda da: da.__delitem__(0),
+        lambda da: da.__setitem__(0, Document(embedding=np.ones(8))),
+        lambda da: da.__setitem__((0, 'embedding'), np.ones(8)),
+        lambda da: setattr(da, 'embeddings', np.ones((10, 8))),
+        lambda da: setattr(da[0], 'embedding', np.ones(8)),
+        lambda da: da.__setitem__(slice(0, 2), da[0:2][::-1]),
+    ],
+)
+def test_cache_follows_changes(da, op, columnar):
+    if columnar:
+        da = DocumentArray(da, config={'columnar_embeddings': True})
+    old_cache = da._get_embeddings_cache()
+    old_cache.norms
+    op(da)
+    cache = da._get_embeddings_cache()
+    assert cache is not old_cache
+    expected = np.stack([d.embedding for d in da])
+    np.testing.assert_allclose(cache.matrix, expected)
+    np.testing.assert_allclose(cache.norms, np.linalg.norm(expected, axis=1))
+
+
+def test_columnar_cache_is_not_stacked(da):
+    da = DocumentArray(da, config={'columnar_embeddings': True})
+    assert np.shares_memory(da._get_embeddings_cache().matrix, da[0].embedding)
+
+
+def test_cache_shared_data(da):
+    other = DocumentArray(da)
+    cache = other._get_embeddings_cache()
+    da.append(Document(embedding=np.ones(8)))
+    assert other._get_embeddings_cache() is not cache
+
+
+def test_find_after_inplace_edit(da):
+    da.find(np.ones(8), metric='euclidean')
+    da[3].embedding[:] = 100
+    da[3, 'embedding'] = da[3].embedding
+    assert da.find(np.full(8, 100.0), metric='euclidean', limit=1)[0].id == da[3].id
+
+
+@pytest.mark.parametrize('metric', ['cosine', 'sqeuclidean', 'euclidean'])
+def test_find_with_cache(da, metric):
+    query = np.random.random((3, 8))
+    expected = da.find(query, metric=metric, use_scipy=True)
+    for _ in range(2):
+        results = da.find(query, metric=metric)
+        for r, e in zip(results, expected):
+            assert r[:, 'id'] == e[:, 'id']
+            np.testing.assert_allclose(
+                r[:, f'scores__{metric}__value'],
+                e[:, f'scores__{metric}__value'],
+                atol=1e-5,
+            )
@@ -0,0 +1,429 @@
+import gc
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from docarray import Document, DocumentArray
+
+
+@pytest.mark.parametrize(
+    'num_worker,backend', [(1, 'thread'), (3, 'thread'), (2, 'process')]
+)
+def test_extend_batches(num_worker, backend):
+    docs = [Document(text=f'{i}', embedding=np.array([i, i])) for i in range(25)]
+    da = DocumentArray(
+        [Document(id='first')],
+        storage='sqlite',
+        config={'serialize_config': {'protocol': 'protobuf'}},
+    )
+    da.extend((d for d in docs), batch_size=4, num_worker=num_worker, backend=backend)
+
+    assert len(da) == 26
+    assert da[:, 'id'] == ['first'] + [d.id for d in docs]
+    assert da[10] == docs[9]
+    r = da._sql(f'SELECT doc_id FROM {da._table_name} ORDER BY item_order')
+    assert [i for (i,) in r] == da[:, 'id']
+
+    da.append(Document(id='last'))
+    assert da[-1].id == 'last'
+
+
+def test_extend_duplicate_id():
+    da = DocumentArray([Document(id='a')], storage='sqlite')
+    with pytest.raises(sqlite3.IntegrityError):
+        da.extend([Document(id='b'), Document(id='c'), Document(id='a')], batch_size=2)
+
+    # the whole extend is rolled back
+    assert da[:, 'id'] == ['a']
+    assert len(da) == 1
+    assert _persisted_ids(da) == ['a']
+    da.extend([Document(id='b')])
+    assert da[:, 'id'] == ['a', 'b']
+
+
+def _persisted_ids(da):
+    r = da._sql(f'SELECT doc_id FROM {da._table_name} ORDER BY item_order')
+    return [i for (i,) in r]
+
+
+def test_insert_delete_keep_order():
+    da = DocumentArray([Document(id=str(i)) for i in range(5)], storage='sqlite')
+    da.insert(2, Document(id='a'))
+    da.insert(0, Document(id='b'))
+    da.insert(-1, Document(id='c'))
+    del da['3']
+    del da[0]
+    da.append(Document(id='d'))
+    expected = ['0', '1', 'a', '2', 'c', '4', 'd']
+    assert da[:, 'id'] == expected
+    assert _persisted_ids(da) == expected
+
+    da2 = DocumentArray(storage='sqlite', config=da._config)
+    assert da2[:, 'id'] == expected
+
+
+def test_insert_compacts_order_keys():
+    da = DocumentArray([Document(id='first'), Document(id='last')], storage='sqlite')
+    for i in range(30):
+        da.insert(1, Document(id=str(i)))
+    expected = ['first'] + [str(i) for i in reversed(range(30))] + ['last']
+    assert da[:, 'id'] == expected
+    assert _persisted_ids(da) == expected
+
+
+def test_compact_order_keys_single_statement():
+    da = DocumentArray([Document(id=str(i)) for i in range(10)], storage='sqlite')
+    statements = []
+    da._connection.set_trace_callback(statements.append)
+    da._compact_order_keys()
+    da._connection.set_trace_callback(None)
+    assert sum(s.lstrip().upper().startswith('UPDATE') for s in statements) == 1
+    assert da[:, 'id'] == [str(i) for i in range(10)]
+    keys = [
+        k
+        for (k,) in da._sql(
+            f'SELECT item_order FROM {da._table_name} ORDER BY item_order'
+        )
+    ]
+    assert set(np.diff(keys)) == {1 << 20}
+
+
+def test_delete_updates_no_other_rows():
+    da = DocumentArray([Document(id=str(i)) for i in range(10)], storage='sqlite')
+    changes = da._connection.total_changes
+    del da[3]
+    assert da._connection.total_changes - changes == 1
+
+
+@pytest.mark.parametrize('metric', ['cosine', 'euclidean', 'sqeuclidean'])
+@pytest.mark.parametrize('batch_size', [None, 7])
+def test_find_streams_embedding_column(metric, batch_size):
+    embeddings = np.random.random((50, 8)).astype(np.float32)
+    docs = [Document(id=str(i), embedding=e) for i, e in enumerate(embeddings)]
+    da = DocumentArray(docs, storage='sqlite')
+    expected = DocumentArray(docs).find(embeddings[:3], metric=metric, limit=5)
+    result = da.find(embeddings[:3], metric=metric, limit=5, batch_size=batch_size)
+    for r, e in zip(result, expected):
+        assert r[:, 'id'] == e[:, 'id']
+        np.testing.assert_allclose(
+            r[:, f'scores__{metric}__value'],
+            e[:, f'scores__{metric}__value'],
+            rtol=1e-5,
+            atol=1e-3,
+        )
+
+
+def test_find_keeps_embedding_dtype():
+    da = DocumentArray(
+        [
+            Document(id='a', embedding=np.array([1.0, 1e-9], dtype=np.float64)),
+            Document(id='b', embedding=np.array([1.0, 0.0], dtype=np.float64)),
+            Document(id='c', embedding=np.array([2, 0], dtype=np.int8)),
+        ],
+        storage='sqlite',
+    )
+    assert da._get_embeddings_by_offsets(np.array([0, 1])).dtype == np.float64
+    assert da._get_embeddings_by_offsets(np.array([2])).dtype == np.int8
+    # float32 would round both to the same embedding
+    matches = da.find(np.array([1.0, 1e-9]), metric='euclidean', limit=2)
+    assert matches[:, 'id'] == ['a', 'b']
+    assert matches[0].scores['euclidean'].value == 0
+
+
+def test_find_framework_query():
+    torch = pytest.importorskip('torch')
+    embeddings = np.random.random((20, 8)).astype(np.float32)
+    docs = [Document(id=str(i), embedding=e) for i, e in enumerate(embeddings)]
+    da = DocumentArray(docs, storage='sqlite')
+    expected = da.find(embeddings[:2], limit=3)
+    result = da.find(torch.from_numpy(embeddings[:2]), limit=3)
+    for r, e in zip(result, expected):
+        assert r[:, 'id'] == e[:, 'id']
+
+
+def test_find_skips_docs_without_embedding():
+    da = DocumentArray(
+        [Document(id='a', embedding=np.array([1.0, 0.0])), Document(id='b')]
+        + [Document(id=f'c{i}', embedding=np.array([0.0, 1.0 + i])) for i in range(3)],
+        storage='sqlite',
+    )
+    da[1] = Document(id='b', embedding=np.array([1.0, 0.1]))
+    da.append(Document(id='d'))
+
+    matches = da.find(np.array([1.0, 0.0]), limit=10, batch_size=2)
+    assert matches[:, 'id'] == ['a', 'b', 'c0', 'c1', 'c2']
+
+    # like in memory, quantization needs every Document to have an embedding
+    del da['d']
+    assert da.find(np.array([1.0, 0.0]), quantization='int8', limit=2)[:, 'id'] == [
+        'a',
+        'b',
+    ]
+
+
+def test_embedding_column_added_to_existing_table(tmpdir):
+    config = {'connection': str(tmpdir / 'old.db'), 'table_name': 'old'}
+    DocumentArray(
+        [Document(id=str(i), embedding=np.array([i, 1.0])) for i in range(4)],
+        storage='sqlite',
+        config=config,
+    )
+    conn = sqlite3.connect(config['connection'])
+    conn.executescript(
+        '''
+        CREATE TABLE new (doc_id TEXT NOT NULL UNIQUE, serialized_value Document NOT NULL, item_order INTEGER PRIMARY KEY);
+        INSERT INTO new SELECT doc_id, serialized_value, item_order FROM old;
+        DROP TABLE old;
+        ALTER TABLE new RENAME TO old;
+        '''
+    )
+
+    conn.close()
+
+    da = DocumentArray(storage='sqlite', config=config)
+    assert da.find(np.array([3.0, 1.0]), metric='euclidean', limit=2)[:, 'id'] == [
+        '3',
+        '2',
+    ]
+
+
+@pytest.fixture
+def tag_docs():
+    tags = [
+        {'price': 10.0, 'category': 'shoes', 'stock': 3, 'sale': True},
+        {'price': 25.5, 'category': 'shirts', 'stock': 0, 'sale': False},
+        {'price': 7, 'category': 'socks'},
+        {'category': ''},
+        {'price': 99.0, 'category': 'shoes', 'stock': 12},
+        {},
+    ]
+    return [
+        Document(id=str(i), tags=t, embedding=np.array([1.0, i]))
+        for i, t in enumerate(tags)
+    ]
+
+
+_columns = {'price': 'float', 'category': 'str', 'stock': 'int', 'sale': 'bool'}
+
+
+@pytest.mark.parametrize(
+    'filter',
+    [
+        {'tags__price': {'$gte': 10}},
+        {'tags__price': {'$lt': 20}, 'tags__category': {'$eq': 'shoes'}},
+        {'$or': [{'tags__stock': {'$gt': 5}}, {'tags__category': {'$eq': 'socks'}}]},
+        {'$not': {'tags__price': {'$gt': 20}}},
+        {'tags__category': {'$neq': 'shoes'}},
+        {'tags__category': {'$in': ['socks', 'shirts']}},
+        {'tags__stock': {'$nin': [0, None]}},
+        {'tags__price': {'$eq': None}},
+        {'tags__stock': {'$exists': True}},
+        {'tags__category': {'$exists': False}},
+        {'tags__category': {'$regex': '^sh'}},
+        {'tags__sale': {'$eq': True}},
+        {'id': {'$in': ['1', '4']}},
+        {'tags__price': {'$gte': 10, '$lte': 30}},
+    ],
+)
+def test_filter_tag_columns(tag_docs, filter):
+    from docarray.array.storage.sqlite.helper import filter_to_sql
+
+    da = DocumentArray(tag_docs, storage='sqlite', config={'columns': _columns})
+    assert filter_to_sql(filter, da._config.columns) is not None
+    expected = DocumentArray(tag_docs).find(filter)[:, 'id']
+    assert da.find(filter)[:, 'id'] == expected
+    assert da.find(query=None, filter=filter)[:, 'id'] == expected
+
+
+@pytest.mark.parametrize(
+    'filter',
+    [
+        {'tags__stock': {'$eq': 7}},
+        {'tags__stock': {'$neq': 7}},
+        {'tags__stock': {'$in': [7, 1]}},
+        {'tags__stock': {'$exists': True}},
+        {'tags__stock': {'$exists': False}},
+        {'tags__category': {'$exists': True}},
+        {'tags__price': {'$lt': 4}},
+        {'tags__sale': {'$eq': 1}},
+    ],
+)
+def test_filter_tags_of_other_types(filter):
+    from docarray.array.storage.sqlite.helper import filter_to_sql
+
+    docs = [
+        Document(id='0', tags={'stock': '7', 'category': 5}),
+        Document(id='1', tags={'stock': 7, 'category': []}),
+        Document(id='2', tags={'stock': [1], 'category': 'socks'}),
+        Document(id='3', tags={'stock': '', 'price': np.float32(3.5)}),
+        Document(id='4', tags={'stock': 2**70, 'sale': 'yes'}),
+        Document(id='5', tags={'price': np.int64(3), 'sale': True}),
+    ]
+    da = DocumentArray(docs, storage='sqlite', config={'columns': _columns})
+    assert filter_to_sql(filter, da._config.columns) is not None
+    assert da.find(filter)[:, 'id'] == DocumentArray(docs).find(filter)[:, 'id']
+
+
+def test_filter_compare_tags_of_other_types():
+    docs = [
+        Document(id='0', tags={'stock': '7', 'category': 5}),
+        Document(id='1', tags={'stock': 7, 'category': 'socks'}),
+        Document(id='2', tags={'stock': 2**70}),
+    ]
+    da = DocumentArray(docs, storage='sqlite', config={'columns': _columns})
+    assert da.find({'tags__stock': {'$gt': 5}})[:, 'id'] == ['1', '2']
+    assert da.find({'tags__category': {'$lte': 'z'}})[:, 'id'] == ['1']
+
+
+def test_filter_bare_column_name(tag_docs):
+    da = DocumentArray(tag_docs, storage='sqlite', config={'columns': _columns})
+    assert da.find({'price': {'$lt': 20}, 'category': {'$eq': 'shoes'}})[:, 'id'] == [
+        '0'
+    ]
+
+
+@pytest.mark.parametrize(
+    'filter',
+    [
+        {'text': {'$eq': 'x'}},
+        {'tags__color': {'$eq': 'red'}},
+        {'tags__category': {'$eq': '{tags__color}'}},
+        {'tags__price': {'$eq': '10'}},
+        {'tags__category': {'$size': 5}},
+    ],
+)
+def test_filter_falls_back_to_client_side(tag_docs, filter):
+    from docarray.array.storage.sqlite.helper import filter_to_sql
+
+    da = DocumentArray(tag_docs, storage='sqlite', config={'columns': _columns})
+    assert filter_to_sql(filter, da._config.columns) is None
+    assert da.find(filter)[:, 'id'] == DocumentArray(tag_docs).find(filter)[:, 'id']
+
+
+def test_filter_uses_index(tag_docs):
+    from docarray.array.storage.sqlite.helper import filter_to_sql
+
+    da = DocumentArray(tag_docs, storage='sqlite', config={'columns': _columns})
+    sql, params = filter_to_sql(
+        {'tags__price': {'$gt': 10}, 'tags__category': {'$in': ['shoes']}},
+        da._config.columns,
+    )
+    plan = da._sql(
+        f'EXPLAIN QUERY PLAN SELECT serialized_value FROM {da._table_name} WHERE {sql} ORDER BY +item_order',
+        params,
+    ).fetchall()
+    assert 'INDEX' in str(plan)
+
+
+def test_find_with_filter(tag_docs):
+    da = DocumentArray(tag_docs, storage='sqlite', config={'columns': _columns})
+    matches = da.find(
+        np.array([[1.0, 5.0], [1.0, 0.0]]),
+        metric='euclidean',
+        filter={'tags__category': {'$eq': 'shoes'}},
+        limit=5,
+        batch_size=1,
+    )
+    assert matches[0][:, 'id'] == ['4', '0']
+    assert matches[1][:, 'id'] == ['0', '4']
+    assert matches[1][0].scores['euclidean'].value == pytest.approx(0.0)
+    assert matches[1][0].tags['category'] == 'shoes'
+
+    with pytest.raises(ValueError):
+        da.find(np.array([1.0, 0.0]), filter={'text': {'$eq': 'x'}})
+
+
+def test_set_updates_tag_columns(tag_docs):
+    da = DocumentArray(tag_docs, storage='sqlite', config={'columns': _columns})
+    da['5'] = Document(id='5', tags={'price': 1.0})
+    da[2, 'tags'] = {'price': 1000.0}
+    assert da.find({'tags__price': {'$lt': 5}})[:, 'id'] == ['5']
+    assert da.find({'tags__price': {'$gt': 500}})[:, 'id'] == ['2']
+
+
+def test_tag_columns_added_to_existing_table(tmpdir, tag_docs):
+    config = {'connection': str(tmpdir / 'tags.db'), 'table_name': 'tags'}
+    DocumentArray(tag_docs, storage='sqlite', config=config)
+
+    da = DocumentArray(storage='sqlite', config={**config, 'columns': _columns})
+    assert da.find({'tags__price': {'$gte': 25}})[:, 'id'] == ['1', '4']
+
+
+def test_invalid_column_name():
+    with pytest.raises(ValueError):
+        DocumentArray(storage='sqlite', config={'columns': {'doc_id': 'str'}})
+
+
+def test_read_connection_per_thread():
+    da = DocumentArray([Document(id=str(i)) for i in range(20)], storage='sqlite')
+    with ThreadPoolExecutor(4) as ex:
+        connections = set(
+            ex.map(lambda _: id(da._read_connection), range(4), timeout=10)
+        )
+        docs = list(ex.map(lambda i: da[str(i)].id, range(20)))
+    assert docs == [str(i) for i in range(20)]
+    assert id(da._connection) not in connections
+
+    assert da._read_connection is da._connection
+    with ThreadPoolExecutor(1) as ex:
+        with pytest.raises(sqlite3.OperationalError):
+            ex.submit(da._read_sql, f'DELETE FROM {da._table_name}').result()
+
+
+def test_read_connections_are_closed():
+    import threading
+
+    da = DocumentArray([Document(id=str(i)) for i in range(5)], storage='sqlite')
+    connections = []
+
+    def _read():
+        connections.append(da._read_connection)
+        assert len(da) == 5
+
+    threads = [threading.Thread(target=_read) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(connections) == 3
+    assert not da._readers._readers
+    for c in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            c.execute('SELECT 1')
+
+    with ThreadPoolExecutor(2) as ex:
+        list(ex.map(lambda i: da[str(i)], range(5)))
+        connections = [r.connection for r in da._readers._readers]
+        assert connections
+        del da
+        gc.collect()
+        for c in connections:
+            with pytest.raises(sqlite3.ProgrammingError):
+                c.execute('SELECT 1')
+
+
+def test_read_sees_uncommitted_writes():
+    da = DocumentArray([Document(id='a')], storage='sqlite')
+    da._append(Document(id='b'), commit=False)
+    assert da._read_connection is da._connection
+    assert 'b' in da
+    assert da['b'].id == 'b'
+    da._commit()
+    assert da._read_connection is da._connection
+    assert len(da) == 2
+
+    with ThreadPoolExecutor(1) as ex:
+        assert ex.submit(lambda: da._read_connection).result() is not da._connection
+        da._append(Document(id='c'), commit=False)
+        assert ex.submit(lambda: da._read_connection).result() is da._connection
+
+
+@pytest.mark.parametrize(
+    'config', [{'connection': ':memory:'}, {'journal_mode': 'DELETE'}]
+)
+def test_read_through_writer(config):
+    da = DocumentArray([Document(id='a')], storage='sqlite', config=config)
+    assert da._read_connection is da._connection
+    assert da['a'].id == 'a'
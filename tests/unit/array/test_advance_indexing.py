@@ -4,6 +4,7 @@ import pytest
 from docarray import DocumentArray, Document
 from docarray.array.storage.weaviate import WeaviateConfig
 from docarray.array.annlite import AnnliteConfig, DocumentArrayAnnlite
+from docarray.array.hnsw import DocumentArrayHnsw, HnswConfig
 from docarray.array.qdrant import QdrantConfig
 from docarray.array.elastic import ElasticConfig
 from docarray.array.redis import RedisConfig
@@ -27,6 +28,7 @@ def indices():
         ('sqlite', None),
         ('weaviate', WeaviateConfig(n_dim=123)),
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', ElasticConfig(n_dim=123)),
@@ -63,6 +65,7 @@ def test_getter_int_str(docs, storage, config, start_storage):
         ('sqlite', None),
         ('weaviate', WeaviateConfig(n_dim=123)),
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('redis', RedisConfig(n_dim=123)),
@@ -94,6 +97,7 @@ def test_setter_int_str(docs, storage, config, start_storage):
         ('sqlite', None),
         ('weaviate', WeaviateConfig(n_dim=123)),
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', ElasticConfig(n_dim=123)),
@@ -131,6 +135,7 @@ def test_del_int_str(docs, storage, config, start_storage, indices):
         ('sqlite', None),
         ('weaviate', WeaviateConfig(n_dim=123)),
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', ElasticConfig(n_dim=123)),
@@ -172,6 +177,7 @@ def test_slice(docs, storage, config, start_storage):
         ('sqlite', None),
         ('weaviate', WeaviateConfig(n_dim=123)),
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', ElasticConfig(n_dim=123)),
@@ -221,6 +227,7 @@ def test_sequence_bool_index(docs, storage, config, start_storage):
         ('sqlite', None),
         ('weaviate', WeaviateConfig(n_dim=123)),
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', ElasticConfig(n_dim=123)),
@@ -260,6 +267,7 @@ def test_sequence_int(docs, nparray, storage, config, start_storage):
         ('sqlite', None),
         ('weaviate', WeaviateConfig(n_dim=123)),
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', ElasticConfig(n_dim=123)),
@@ -297,6 +305,7 @@ def test_sequence_str(docs, storage, config, start_storage):
         ('sqlite', None),
         ('weaviate', WeaviateConfig(n_dim=123)),
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', ElasticConfig(n_dim=123)),
@@ -320,6 +329,7 @@ def test_docarray_list_tuple(docs, storage, config, start_storage):
         ('sqlite', None),
         ('weaviate', WeaviateConfig(n_dim=123)),
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', ElasticConfig(n_dim=123)),
@@ -362,6 +372,7 @@ def test_path_syntax_indexing(storage, config, start_storage):
         ('sqlite', None),
         ('weaviate', WeaviateConfig(n_dim=123)),
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', ElasticConfig(n_dim=123)),
@@ -501,6 +512,7 @@ def test_getset_subindex():
         ('sqlite', None, None),
         ('weaviate', WeaviateConfig(n_dim=123), {'n_dim': 123}),
         ('annlite', AnnliteConfig(n_dim=123), {'n_dim': 123}),
+        ('hnsw', HnswConfig(n_dim=123), {'n_dim': 123}),
         ('qdrant', QdrantConfig(n_dim=123), {'n_dim': 123}),
         ('qdrant', QdrantConfig(n_dim=123, prefer_grpc=True), {'n_dim': 123}),
         ('elasticsearch', ElasticConfig(n_dim=123), {'n_dim': 123}),
@@ -538,6 +550,7 @@ def test_getset_subindex_in_store(storage, config, subindex_config, start_storag
         ('sqlite', None),
         ('weaviate', lambda: WeaviateConfig(n_dim=123)),
         ('annlite', lambda: AnnliteConfig(n_dim=123)),
+        ('hnsw', lambda: HnswConfig(n_dim=123)),
         ('qdrant', lambda: QdrantConfig(n_dim=123)),
         ('qdrant', lambda: QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', lambda: ElasticConfig(n_dim=123)),
@@ -579,6 +592,7 @@ def test_attribute_indexing(storage, config_gen, start_storage, size):
         ('sqlite', None),
         ('weaviate', lambda: WeaviateConfig(n_dim=10)),
         ('annlite', lambda: AnnliteConfig(n_dim=10)),
+        ('hnsw', lambda: HnswConfig(n_dim=10)),
         ('qdrant', lambda: QdrantConfig(n_dim=10)),
         ('qdrant', lambda: QdrantConfig(n_dim=10, prefer_grpc=True)),
         ('elasticsearch', lambda: ElasticConfig(n_dim=10)),
@@ -642,6 +656,7 @@ def test_advance_selector_mixed(storage):
         ('sqlite', None),
         ('weaviate', lambda: WeaviateConfig(n_dim=10)),
         ('annlite', lambda: AnnliteConfig(n_dim=10)),
+        ('hnsw', lambda: HnswConfig(n_dim=10)),
         ('qdrant', lambda: QdrantConfig(n_dim=10)),
         ('qdrant', lambda: QdrantConfig(n_dim=10, prefer_grpc=True)),
         ('elasticsearch', lambda: ElasticConfig(n_dim=10)),
@@ -677,6 +692,7 @@ def test_single_boolean_and_padding(storage, config_gen, start_storage):
         ('sqlite', None),
         ('weaviate', lambda: WeaviateConfig(n_dim=123)),
         ('annlite', lambda: AnnliteConfig(n_dim=123)),
+        ('hnsw', lambda: HnswConfig(n_dim=123)),
         ('qdrant', lambda: QdrantConfig(n_dim=123)),
         ('qdrant', lambda: QdrantConfig(n_dim=123, prefer_grpc=True)),
         ('elasticsearch', lambda: ElasticConfig(n_dim=123)),
@@ -755,6 +771,7 @@ def test_edge_case_two_strings(storage, config_gen, start_storage):
     'storage,config',
     [
         ('annlite', AnnliteConfig(n_dim=123)),
+        ('hnsw', HnswConfig(n_dim=123)),
         ('qdrant', QdrantConfig(n_dim=123)),
         ('elasticsearch', ElasticConfig(n_dim=123)),
         ('redis', RedisConfig(n_dim=123)),
@@ -6,6 +6,7 @@ from docarray.array.elastic import DocumentArrayElastic, ElasticConfig
 from docarray.array.qdrant import DocumentArrayQdrant
 from docarray.array.sqlite import DocumentArraySqlite
 from docarray.array.annlite import DocumentArrayAnnlite, AnnliteConfig
+from docarray.array.hnsw import DocumentArrayHnsw, HnswConfig
 from docarray.array.storage.qdrant import QdrantConfig
 from docarray.array.weaviate import DocumentArrayWeaviate, WeaviateConfig
 from docarray.array.elastic import DocumentArrayElastic, ElasticConfig
@@ -19,6 +20,7 @@ from docarray.array.milvus import DocumentArrayMilvus, MilvusConfig
         (DocumentArrayInMemory, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=128)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=128)),
         (DocumentArrayWeaviate, WeaviateConfig(n_dim=128)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=128)),
         (DocumentArrayElastic, ElasticConfig(n_dim=128)),
@@ -69,6 +71,7 @@ def test_construct_docarray(da_cls, config, start_storage):
         (DocumentArrayInMemory, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=128)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=128)),
         (DocumentArrayWeaviate, WeaviateConfig(n_dim=128)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=128)),
         (DocumentArrayElastic, ElasticConfig(n_dim=128)),
@@ -100,6 +103,7 @@ def test_docarray_copy_singleton(da_cls, config, is_copy, start_storage):
         (DocumentArrayInMemory, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=128)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=128)),
         (DocumentArrayWeaviate, WeaviateConfig(n_dim=128)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=128)),
         (DocumentArrayElastic, ElasticConfig(n_dim=128)),
@@ -131,6 +135,7 @@ def test_docarray_copy_da(da_cls, config, is_copy, start_storage):
         (DocumentArrayInMemory, None),
         (DocumentArraySqlite, None),
         (DocumentArrayAnnlite, AnnliteConfig(n_dim=1)),
+        (DocumentArrayHnsw, HnswConfig(n_dim=1)),
         (DocumentArrayQdrant, QdrantConfig(n_dim=1)),
         (DocumentArrayElastic, ElasticConfig(n_dim=128)),
         (DocumentArrayRedis, RedisConfig(n_dim=128)),
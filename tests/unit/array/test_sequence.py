@@ -120,6 +120,7 @@ def test_context_manager_from_disk(storage, config, start_storage, tmpdir, tmpfi
         ('memory', None),
         ('weaviate', {'n_dim': 3, 'distance': 'l2-squared'}),
         ('annlite', {'n_dim': 3, 'metric': 'Euclidean'}),
+        ('hnsw', {'n_dim': 3, 'metric': 'euclidean'}),
         ('qdrant', {'n_dim': 3, 'distance': 'euclidean'}),
         ('elasticsearch', {'n_dim': 3, 'distance': 'l2_norm'}),
         ('sqlite', dict()),
@@ -167,6 +168,7 @@ def test_extend_subindex(storage, config, start_storage):
         ('memory', None),
         ('weaviate', {'n_dim': 3, 'distance': 'l2-squared'}),
         ('annlite', {'n_dim': 3, 'metric': 'Euclidean'}),
+        ('hnsw', {'n_dim': 3, 'metric': 'euclidean'}),
         ('qdrant', {'n_dim': 3, 'distance': 'euclidean'}),
         ('elasticsearch', {'n_dim': 3, 'distance': 'l2_norm'}),
         ('sqlite', dict()),
@@ -218,6 +220,7 @@ def embeddings_eq(emb1, emb2):
         ('memory', None),
         ('weaviate', {'n_dim': 3, 'distance': 'l2-squared'}),
         ('annlite', {'n_dim': 3, 'metric': 'Euclidean'}),
+        ('hnsw', {'n_dim': 3, 'metric': 'euclidean'}),
         ('qdrant', {'n_dim': 3, 'distance': 'euclidean'}),
         ('elasticsearch', {'n_dim': 3, 'distance': 'l2_norm'}),
         ('sqlite', dict()),
@@ -246,6 +249,7 @@ def test_del_and_append(index, storage, config, start_storage):
         ('memory', None),
         ('weaviate', {'n_dim': 3, 'distance': 'l2-squared'}),
         ('annlite', {'n_dim': 3, 'metric': 'Euclidean'}),
+        ('hnsw', {'n_dim': 3, 'metric': 'euclidean'}),
         ('qdrant', {'n_dim': 3, 'distance': 'euclidean'}),
         ('elasticsearch', {'n_dim': 3, 'distance': 'l2_norm'}),
         ('sqlite', dict()),
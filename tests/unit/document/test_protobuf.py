@@ -1,3 +1,4 @@
+import pickle
 from collections import defaultdict
 
 import numpy as np
@@ -48,3 +49,125 @@ def test_from_to_namescore_default_dict(attr, meth):
     r_d = getattr(Document, f'from_{meth}')(r)
     assert isinstance(r_d.scores, defaultdict)
     assert isinstance(r_d.scores['random_score2'], NamedScore)
+
+
+def test_from_protobuf_writable_ndarrays():
+    d = Document(tensor=np.random.random([3, 4]), embedding=np.array([1.0, 2.0]))
+    pb = d.to_protobuf()
+    assert not Document.from_protobuf(pb).tensor.flags.writeable
+
+    r = Document.from_protobuf(pb, writable_ndarrays=True)
+    assert r.tensor.flags.writeable
+    assert r.tensor.ctypes.data % 64 == 0
+    r.embedding[0] = 3.0
+    np.testing.assert_equal(r.tensor, d.tensor)
+    np.testing.assert_equal(Document.from_protobuf(pb).embedding, [1.0, 2.0])
+    # a small array does not keep a larger buffer alive
+    assert r.embedding.base.nbytes <= r.embedding.nbytes + 64
+
+
+@pytest.mark.parametrize('sp_format', ['csr', 'csc', 'coo', 'bsr'])
+def test_from_protobuf_scipy_sparse(sp_format):
+    import scipy.sparse as sp
+
+    tensor = sp.random(10, 7, density=0.2, format=sp_format, random_state=0)
+    r = Document.from_protobuf(Document(tensor=tensor).to_protobuf())
+    assert r.tensor.getformat() == sp_format
+    np.testing.assert_equal(r.tensor.toarray(), tensor.toarray())
+
+
+def test_from_protobuf_lazy_ndarrays():
+    d = Document(
+        tensor=np.random.random([3, 4]),
+        embedding=np.array([1.0, 2.0]),
+        chunks=[Document(embedding=np.array([3.0]))],
+    )
+    pb = d.to_protobuf()
+    r = Document.from_protobuf(pb, lazy_ndarrays=True)
+    assert set(r._data._lazy_fields) == {'tensor', 'embedding'}
+    assert r.non_empty_fields == d.non_empty_fields
+    assert r.to_protobuf() == pb
+    assert set(r._data._lazy_fields) == {'tensor', 'embedding'}
+
+    np.testing.assert_equal(r.embedding, d.embedding)
+    assert set(r._data._lazy_fields) == {'tensor'}
+    r.tensor = None
+    assert not r._data._lazy_fields
+    assert 'tensor' not in r.non_empty_fields
+    np.testing.assert_equal(r.chunks[0].embedding, [3.0])
+
+
+def test_from_protobuf_lazy():
+    d = Document(
+        text='hello',
+        embedding=np.array([1.0, 2.0]),
+        tags={'hello': 'world', 'nest': {'a': [1.0, 2.0]}},
+        location=[1.0, 2.0],
+        scores={'hello': NamedScore(value=1.0)},
+        chunks=[Document(tags={'c': 1})],
+        matches=[Document(), Document()],
+    )
+    pb = d.to_protobuf()
+    r = Document.from_protobuf(pb, lazy=True)
+    assert r.id == d.id and r.text == 'hello'
+    assert set(r._data._lazy_fields) == {
+        'embedding',
+        'tags',
+        'location',
+        'scores',
+        'chunks',
+        'matches',
+    }
+    assert r.non_empty_fields == d.non_empty_fields
+    assert r.to_protobuf() == pb
+
+    assert r.tags == d.tags
+    assert 'tags' not in r._data._lazy_fields
+    assert r.chunks[0].parent_id == d.id
+    assert r.chunks[0].tags == {'c': 1}
+    assert r == d
+    assert not r._data._lazy_fields
+
+    r = Document.from_protobuf(pb, lazy=True)
+    assert pickle.loads(pickle.dumps(r)) == d
+
+
+@pytest.mark.parametrize(
+    'tags',
+    [
+        {'hello': 'world', 'nest': {'a': [1, 2.5, None, True]}},
+        {'int': -(2**40), 'big': 2**64 - 1, 'small': -3, 'bytes': b'\x00\xff'},
+        {
+            'long': 'x' * 70000,
+            'many': list(range(20)),
+            'wide': {str(i): i for i in range(20)},
+        },
+    ],
+)
+def test_to_from_protobuf_tags_msgpack(tags):
+    pytest.importorskip('msgpack')
+    d = Document(tags=tags, chunks=[Document(tags={'a': 1})])
+    pb = d.to_protobuf(tags_codec='msgpack')
+    assert not pb.HasField('tags') and pb.tags_msgpack
+    r = Document.from_protobuf(pb)
+    assert r.tags == tags
+    assert type(r.chunks[0].tags['a']) is int
+
+    r = Document.from_bytes(
+        d.to_bytes(protocol='protobuf', tags_codec='msgpack'),
+        protocol='protobuf',
+        lazy=True,
+    )
+    assert r.to_protobuf(tags_codec='msgpack') == pb
+    assert r.tags == tags
+
+    with pytest.raises(ValueError):
+        d.to_protobuf(tags_codec='json')
+
+
+def test_to_protobuf_tags_msgpack_not_installed(monkeypatch):
+    import sys
+
+    monkeypatch.setitem(sys.modules, 'msgpack', None)
+    with pytest.raises(ImportError, match='pip install msgpack'):
+        Document(tags={'a': 1}).to_protobuf(tags_codec='msgpack')
@@ -124,3 +124,72 @@ def test_euclidean(x_mat, y_mat, result):
 )
 def test_sparse_euclidean(x_mat, y_mat, result):
     np.testing.assert_almost_equal(sparse_euclidean(x_mat, y_mat), result, decimal=3)
+
+
+@pytest.mark.parametrize('func', [cosine, sqeuclidean, euclidean])
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_precomputed_norms_and_out(func, dtype):
+    from docarray.math.distance.numpy import row_norms
+
+    x_mat = np.random.random((4, 8)).astype(dtype)
+    y_mat = np.random.random((6, 8)).astype(dtype)
+    expected = func(x_mat, y_mat)
+    assert expected.dtype == dtype
+
+    out = np.empty((4, 6), dtype=dtype)
+    dists = func(
+        x_mat, y_mat, x_norm=row_norms(x_mat), y_norm=row_norms(y_mat), out=out
+    )
+    assert dists is out
+    np.testing.assert_allclose(dists, expected, rtol=1e-4, atol=1e-5)
+
+
+@pytest.mark.parametrize('func', [cosine, sqeuclidean, euclidean])
+def test_normalized(func):
+    x_mat = np.random.random((4, 8))
+    y_mat = np.random.random((6, 8))
+    x_mat /= np.linalg.norm(x_mat, axis=1, keepdims=True)
+    y_mat /= np.linalg.norm(y_mat, axis=1, keepdims=True)
+    np.testing.assert_allclose(
+        func(x_mat, y_mat, normalized=True), func(x_mat, y_mat), atol=1e-6
+    )
+
+
+@pytest.mark.parametrize('n_rows', [1, 4])
+def test_hamming(n_rows):
+    from docarray.math.distance.numpy import hamming
+    from docarray.math.quantization import binarize
+
+    x_mat = np.random.random((n_rows, 20)) - 0.5
+    y_mat = np.random.random((6, 20)) - 0.5
+    expected = np.sum((x_mat[:, np.newaxis] > 0) != (y_mat > 0), axis=-1)
+    np.testing.assert_equal(hamming(binarize(x_mat), binarize(y_mat)), expected)
+
+
+@pytest.mark.parametrize('metric', ['cosine', 'sqeuclidean', 'euclidean'])
+def test_int8(metric):
+    from docarray.math.distance import cdist
+    from docarray.math.quantization import int8_quantize, int8_scales
+
+    x_mat = np.random.random((4, 16))
+    y_mat = np.random.random((6, 16))
+    codes, scales = int8_quantize(y_mat, int8_scales(np.concatenate([x_mat, y_mat])))
+    assert codes.dtype == np.int8
+
+    expected = cdist(x_mat, y_mat, metric)
+    np.testing.assert_allclose(
+        cdist(x_mat, codes, f'int8_{metric}', scales=scales), expected, atol=0.05
+    )
+    x_codes, _ = int8_quantize(x_mat, scales)
+    np.testing.assert_allclose(
+        cdist(x_codes, codes, f'int8_{metric}', scales=scales), expected, atol=0.05
+    )
+
+
+@pytest.mark.parametrize('metric', ['hamming', 'int8_cosine'])
+def test_codes_metrics_require_numpy(metric):
+    torch = pytest.importorskip('torch')
+    from docarray.math.distance import cdist
+
+    with pytest.raises(NotImplementedError):
+        cdist(torch.ones((2, 4)), torch.ones((3, 4)), metric, scales=np.ones(4))
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from scipy.spatial.distance import cdist
+
+from docarray.math.ivfpq import IVFPQIndex
+
+
+@pytest.mark.parametrize('metric', ['cosine', 'euclidean', 'sqeuclidean'])
+def test_ivfpq_recall(metric):
+    x = np.random.random((2000, 16)).astype(np.float32)
+    query = np.random.random((10, 16)).astype(np.float32)
+
+    index = IVFPQIndex(16, n_clusters=8, n_subvectors=8, metric=metric)
+    index.train(x, random_seed=0)
+    index.add(x[:1000])
+    index.add(x[1000:])
+    assert len(index) == 2000
+
+    expected = np.argsort(cdist(query, x, metric), axis=1)[:, :10]
+    recall = 0
+    for q, e in zip(query, expected):
+        dists, labels = index.search(q, 100, nprobe=8)
+        assert np.all(np.diff(dists) >= 0)
+        recall += len(set(labels) & set(e))
+    assert recall / expected.size > 0.8
+
+
+def test_ivfpq_search_probes_enough_lists():
+    x = np.random.random((100, 8)).astype(np.float32)
+    index = IVFPQIndex(8, n_clusters=10, n_subvectors=2)
+    index.train(x, random_seed=0)
+    index.add(x)
+
+    _, labels = index.search(x[0], 50, nprobe=1)
+    assert len(labels) == 50
+    assert len(set(labels)) == 50
+
+    _, labels = index.search(x[0], 1000, nprobe=1)
+    assert sorted(labels) == list(range(100))
+
+
+def test_ivfpq_reset():
+    x = np.random.random((100, 8)).astype(np.float32)
+    index = IVFPQIndex(8, n_clusters=4, n_subvectors=2)
+    with pytest.raises(ValueError):
+        index.add(x)
+    index.train(x)
+    index.add(x)
+    index.reset()
+    assert len(index) == 0
+    index.add(x[:10])
+    _, labels = index.search(x[0], 20)
+    assert sorted(labels) == list(range(10))
+
+
+def test_ivfpq_add_remove_labels():
+    x = np.random.random((100, 8)).astype(np.float32)
+    index = IVFPQIndex(8, n_clusters=4, n_subvectors=2)
+    index.train(x, random_seed=0)
+    labels = np.arange(100) * 10
+    index.add(x[:50], labels[:50])
+    index.add(x[50:], labels[50:])
+
+    index.remove(labels[:10])
+    index.remove([12345])
+    assert len(index) == 90
+    _, found = index.search(x[0], 100)
+    assert sorted(found) == sorted(labels[10:])
+
+    index.add(x[:1], [7])
+    assert len(index) == 91
+    _, found = index.search(x[0], 100)
+    assert 7 in found and 0 not in found
+
+    # labels assigned in order continue after the largest label
+    index.add(x[:1])
+    _, found = index.search(x[0], 100)
+    assert 991 in found
+
+    with pytest.raises(ValueError):
+        index.add(x[:2], [1])
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [{'metric': 'jaccard'}, {'n_subvectors': 3}, {'n_bits': 9}],
+)
+def test_ivfpq_invalid_params(kwargs):
+    with pytest.raises(ValueError):
+        IVFPQIndex(8, **kwargs)